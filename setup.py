@@ -39,12 +39,13 @@ setup(
     author_email="thomas@dyhr.com",
     url="https://github.com/docdyhr/pigame",
     license="MIT",
-    py_modules=["pigame"],
+    py_modules=["pigame", "pigame_client"],
     package_dir={"": "src/python"},
     include_package_data=True,
     entry_points={
         "console_scripts": [
             "pigame-py=pigame:main",
+            "pigame-client=pigame_client:main",
         ],
     },
     classifiers=[
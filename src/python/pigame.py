@@ -7,17 +7,96 @@ for perfect accuracy and consistent results across all implementations.
 
 from __future__ import annotations
 
-import argparse
-import json
-import logging
-import re
+import abc
+import contextlib
+import functools
+import math
+import os
 import sys
-import termios
 import time
-import tty
-from dataclasses import dataclass
+import types
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import NoReturn
+
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    import asyncio
+    import bisect
+    import csv
+    import curses
+    import datetime as dt
+    import fcntl
+    import heapq
+    import http
+    import json
+    import logging
+    import random
+    import re
+    import signal
+    import socket
+    import sqlite3
+    import tempfile
+    import termios
+    import threading
+    import tty
+    import unicodedata
+    import uuid
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+    from concurrent import futures
+    from typing import BinaryIO, NoReturn, TextIO
+    from urllib import parse as urlparse
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported when first used.
+
+    Most runs only check or print digits, so the modules needed by practice
+    mode, races and the statistics stores are not imported (or even looked
+    up on disk) at startup.  On first attribute access the stand-in replaces
+    itself with the real module in this module's namespace.
+    """
+
+    def __init__(self: _LazyModule, name: str, binding: str | None = None) -> None:
+        """Defer importing *name*, bound here as *binding* (default: *name*)."""
+        self._name = name
+        self._binding = binding or name
+
+    def __getattr__(self: _LazyModule, attr: str) -> object:
+        """Import the module and return its attribute."""
+        __import__(self._name)
+        module = sys.modules[self._name]
+        globals()[self._binding] = module
+        return getattr(module, attr)
+
+
+if not TYPE_CHECKING:
+    argparse = _LazyModule("argparse")
+    asyncio = _LazyModule("asyncio")
+    bisect = _LazyModule("bisect")
+    csv = _LazyModule("csv")
+    curses = _LazyModule("curses")
+    dt = _LazyModule("datetime", "dt")
+    fcntl = _LazyModule("fcntl")
+    futures = _LazyModule("concurrent.futures", "futures")
+    heapq = _LazyModule("heapq")
+    http = _LazyModule("http")
+    json = _LazyModule("json")
+    logging = _LazyModule("logging")
+    random = _LazyModule("random")
+    re = _LazyModule("re")
+    signal = _LazyModule("signal")
+    socket = _LazyModule("socket")
+    sqlite3 = _LazyModule("sqlite3")
+    tempfile = _LazyModule("tempfile")
+    termios = _LazyModule("termios")
+    threading = _LazyModule("threading")
+    tty = _LazyModule("tty")
+    unicodedata = _LazyModule("unicodedata")
+    urlparse = _LazyModule("urllib.parse", "urlparse")
+    uuid = _LazyModule("uuid")
 
 
 # Constants
@@ -30,14 +109,114 @@ PERFECT_SCORE_THRESHOLD = 15
 PRACTICE_CONFIG_DIR = Path.home() / ".pigame"
 PRACTICE_STATS_FILE = PRACTICE_CONFIG_DIR / "stats.json"
 PRACTICE_CONFIG_FILE = PRACTICE_CONFIG_DIR / "config.json"
+PRACTICE_REVIEW_FILE = PRACTICE_CONFIG_DIR / "review.json"
+PRACTICE_SESSIONS_DIR = PRACTICE_CONFIG_DIR / "sessions"
 PRACTICE_MIN_DIGITS = 5
 PRACTICE_MAX_DIGITS = 100
 
+# Practice statistics: a snapshot of the aggregates plus an append-only log
+STATS_RECENT_HISTORY = 100  # sessions kept in the snapshot for --stats
+STATS_COMPACT_BYTES = 32 * 1024  # log growth that triggers a new snapshot
+STATS_EXPORT_FORMATS = ["ndjson", "csv"]
+STATS_EXPORT_FIELDS = (
+    "constant",
+    "date",
+    "mode",
+    "max_level",
+    "correct_digits",
+    "duration_seconds",
+    "uid",
+)
+ROLLUP_DAILY_DAYS = 92  # days kept in daily rollups; older ones are weekly only
+SPEED_SKETCH_ACCURACY = 0.02  # relative error of the speed percentiles
+
+# Profiles share one SQLite store; "default" is the OS user's own files
+DEFAULT_PROFILE = "default"
+PROFILE_NAME_PATTERN = r"[A-Za-z0-9_.-]{1,32}"
+
 # Practice mode constants
-PRACTICE_MODES = ["standard", "timed", "chunk"]
+PRACTICE_MODES = ["standard", "timed", "chunk", "review"]
 DEFAULT_PRACTICE_MODE = "standard"
 DEFAULT_CHUNK_SIZE = 5
 DEFAULT_TIME_LIMIT = 180  # 3 minutes
+DEFAULT_PRACTICE_UI = "ansi"
+CURSES_TICK_MS = 250  # how often the curses UI redraws its timer
+STREAM_READ_SIZE = 4096
+STREAM_END_BYTES = b"\x03\x04"  # Ctrl-C and Ctrl-D end a streamed session
+
+# Race mode
+RACE_SOCKET_FILE = PRACTICE_CONFIG_DIR / "race.sock"
+RACE_DEFAULT_DIGITS = 100
+RACE_COUNTDOWN_SECONDS = 3.0
+RACE_TICK_SECONDS = 0.2  # at most one leaderboard broadcast per tick
+RACE_LEADERBOARD_SIZE = 10
+RACE_MAX_LINE = 4096  # longest protocol message accepted, in bytes
+RACE_MAX_NAME = 32
+RACE_HEAP_SLACK = 64  # stale leaderboard entries tolerated before a rebuild
+
+# HTTP scoring service
+SERVE_DEFAULT_PORT = 8314
+SERVE_MAX_HEADER = 8192  # longest request line plus headers, in bytes
+SERVE_MAX_BODY = 65536  # largest request body accepted, in bytes
+SERVE_IDLE_SECONDS = 15.0  # an idle kept-alive connection closes after this
+SERVE_WORKERS = 4  # threads running costly requests
+SERVE_COST_DIGITS = 250  # digits that add 1 to a request's cost
+SERVE_OFFLOAD_COST = 3  # requests costing this much run on the thread pool
+SERVE_RATE = 100.0  # cost each client may spend per second
+SERVE_BURST = 200.0  # cost each client may spend at once
+SERVE_MAX_COST = 400  # cost of the requests in flight that fills the service
+SERVE_MAX_CLIENTS = 4096  # rate-limited clients tracked before pruning
+SERVE_INTEGER_ARGUMENTS = ("length", "decimals")
+SERVE_METRICS_PATH = "/metrics"  # Prometheus text exposition, GET only
+# Endpoints and the worker operation each one runs
+SERVE_ROUTES = {"/constants": "constants", "/digits": "digits", "/score": "score"}
+
+# Command daemon (pigame serve --daemon)
+DAEMON_STREAMS = (0, 1, 2)  # descriptors a client hands over: stdin, stdout, stderr
+DAEMON_MAX_REQUEST = 1 << 20  # largest forwarded command line, in bytes
+DAEMON_READ_TIMEOUT = 5.0  # seconds a client has to send its command
+
+# Spaced-repetition (SM-2) constants for review mode
+SM2_DEFAULT_EASINESS = 2.5
+SM2_MIN_EASINESS = 1.3
+SM2_PASS_QUALITY = 3
+SECONDS_PER_DAY = 86400
+REVIEW_SESSION_CHUNKS = 10
+
+# Number of preceding digits shown as a cue when practising from an offset
+REFERENCE_CONTEXT_DIGITS = 10
+
+# Session recordings
+SESSION_RECORDING_MAGIC = b"PGR1"
+MAX_REPLAY_SPEED = 100.0
+REVIEW_FAST_SECONDS_PER_DIGIT = 1.0
+REVIEW_SLOW_SECONDS_PER_DIGIT = 2.5
+
+# Output cache: ready-to-write digit output kept for repeated requests
+OUTPUT_CACHE_BYTES = 1 << 20
+
+# Metrics: upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+# Answer lengths (in digits) that start a new scoring latency class
+SCORE_SIZE_CLASSES = (10, 100, 1000)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -47,22 +226,237 @@ DEFAULT_TIME_LIMIT = 180  # 3 minutes
 # Enable DEBUG output with --debug flag or PIGAME_DEBUG=1 env var.
 # ---------------------------------------------------------------------------
 
-import os as _os  # noqa: E402 - used only for env-var check below
+_DEBUG_LEVEL = 10  # logging.DEBUG, known without importing logging
+
+
+class _DeferredLogger:
+    """The module logger, set up when something is first logged.
+
+    Debug messages are dropped without importing :mod:`logging` unless debug
+    output is enabled, so the common paths never pay for it.
+    """
+
+    def __init__(self: _DeferredLogger) -> None:
+        """Start with debug output enabled only if PIGAME_DEBUG is set."""
+        # Honour PIGAME_DEBUG env-var so that debug output is available even
+        # when the --debug flag cannot be parsed yet (e.g. in tests).
+        self._debug = bool(os.environ.get("PIGAME_DEBUG"))
+        self._logger: logging.Logger | None = None
+
+    def _get(self: _DeferredLogger) -> logging.Logger:
+        """Return the real logger, creating and configuring it once."""
+        if self._logger is None:
+            self._logger = logging.getLogger(__name__)
+            handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(
+                logging.Formatter("[%(levelname)s] pigame: %(message)s")
+            )
+            self._logger.addHandler(handler)
+            self._logger.setLevel(
+                logging.DEBUG if self._debug else logging.WARNING,
+            )
+        return self._logger
+
+    def debug(self: _DeferredLogger, msg: str, *args: object, **kwargs: object) -> None:
+        """Log a debug message if debug output is enabled."""
+        if self._debug:
+            self._get().debug(msg, *args, **kwargs)
+
+    def setLevel(self: _DeferredLogger, level: int) -> None:  # noqa: N802
+        """Set the level of the real logger (as :meth:`logging.Logger.setLevel`)."""
+        self._debug = level <= _DEBUG_LEVEL
+        self._get().setLevel(level)
+
+    def __getattr__(self: _DeferredLogger, name: str) -> object:
+        """Delegate everything else to the real logger."""
+        return getattr(self._get(), name)
+
+
+logger = _DeferredLogger()
+
+
+# ---------------------------------------------------------------------------
+# Metrics - counters and fixed-bucket histograms in the Prometheus format
+#
+# Metrics are created at import and kept in module variables, so recording
+# an observation is a couple of attribute updates.  The HTTP service serves
+# them at /metrics and --metrics-dump prints them to stderr after a run.
+# ---------------------------------------------------------------------------
+
+
+class Counter:
+    """A count that only goes up."""
+
+    __slots__ = ("value",)
 
+    def __init__(self: Counter) -> None:
+        """Start at zero."""
+        self.value = 0
 
-logger = logging.getLogger(__name__)
-_log_handler = logging.StreamHandler(sys.stderr)
-_log_handler.setFormatter(logging.Formatter("[%(levelname)s] pigame: %(message)s"))
-logger.addHandler(_log_handler)
+    def inc(self: Counter, amount: float = 1) -> None:
+        """Add *amount* (default 1)."""
+        self.value += amount
 
-# Honour PIGAME_DEBUG env-var so that debug output is available even when the
-# --debug flag cannot be parsed yet (e.g. during module import in tests).
-if _os.environ.get("PIGAME_DEBUG"):
-    logger.setLevel(logging.DEBUG)
-else:
-    logger.setLevel(logging.WARNING)
 
-del _os  # keep module namespace clean
+class Histogram:
+    """Observations counted in fixed buckets, with their sum.
+
+    ``counts[i]`` is the number of observations no greater than
+    ``bounds[i]`` and greater than the bound before; the last count is for
+    observations above every bound.
+    """
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self: Histogram, bounds: tuple[float, ...]) -> None:
+        """Start empty, with buckets up to each of *bounds* (ascending)."""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self: Histogram, value: float) -> None:
+        """Count one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextlib.contextmanager
+    def timer(self: Histogram) -> Iterator[None]:
+        """Observe the seconds the ``with`` block takes."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+def _label_value(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    """Return ``{name="value",...}``, or "" for no labels."""
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_label_value(value)}"' for name, value in labels)
+    return f"{{{pairs}}}"
+
+
+class MetricsRegistry:
+    """Named metric families, each holding one metric per set of labels."""
+
+    def __init__(self: MetricsRegistry) -> None:
+        """Start with no metrics."""
+        self._families: dict[str, tuple[str, str, dict[tuple, object]]] = {}
+        self._readers: dict[str, tuple[str, str, Callable[[], float]]] = {}
+
+    def counter(
+        self: MetricsRegistry, name: str, help_text: str, **labels: str
+    ) -> Counter:
+        """Return the counter *name* with *labels*, creating it on first use."""
+        return self._metric(name, "counter", help_text, labels, Counter)
+
+    def histogram(
+        self: MetricsRegistry,
+        name: str,
+        help_text: str,
+        bounds: tuple[float, ...] = LATENCY_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        """Return the histogram *name* with *labels*, creating it on first use."""
+        return self._metric(
+            name, "histogram", help_text, labels, lambda: Histogram(bounds)
+        )
+
+    def register_reader(
+        self: MetricsRegistry,
+        name: str,
+        kind: str,
+        help_text: str,
+        read: Callable[[], float],
+    ) -> None:
+        """Report the value *read* returns, read when metrics are rendered.
+
+        Args:
+            name: Metric name.
+            kind: ``"counter"`` or ``"gauge"``.
+            help_text: One-line description.
+            read: Returns the current value.
+        """
+        self._readers[name] = (kind, help_text, read)
+
+    def _metric(
+        self: MetricsRegistry,
+        name: str,
+        kind: str,
+        help_text: str,
+        labels: dict[str, str],
+        make: Callable[[], object],
+    ) -> object:
+        family = self._families.setdefault(name, (kind, help_text, {}))
+        if family[0] != kind:
+            msg = f"Metric {name} is a {family[0]}, not a {kind}"
+            raise ValueError(msg)
+        key = tuple(sorted(labels.items()))
+        metric = family[2].get(key)
+        if metric is None:
+            metric = family[2][key] = make()
+        return metric
+
+    def render(self: MetricsRegistry) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        for name, (kind, help_text, metrics) in sorted(self._families.items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for labels, metric in metrics.items():
+                if kind == "counter":
+                    lines.append(f"{name}{_format_labels(labels)} {metric.value}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(
+                    (*metric.bounds, "+Inf"), metric.counts, strict=True
+                ):
+                    cumulative += count
+                    bucket = _format_labels((*labels, ("le", str(bound))))
+                    lines.append(f"{name}_bucket{bucket} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {metric.sum}")
+                lines.append(f"{name}_count{_format_labels(labels)} {metric.count}")
+        for name, (kind, help_text, read) in sorted(self._readers.items()):
+            lines += [
+                f"# HELP {name} {help_text}",
+                f"# TYPE {name} {kind}",
+                f"{name} {read()}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+# Scoring latency by answer length, one histogram per SCORE_SIZE_CLASSES class
+_SCORE_SECONDS = tuple(
+    METRICS.histogram(
+        "pigame_score_seconds",
+        "Time to score an answer, by its length in digits.",
+        digits=label,
+    )
+    for label in ("1-9", "10-99", "100-999", "1000+")
+)
+_DIGITS_GENERATED = METRICS.counter(
+    "pigame_digits_generated_total", "Decimals returned by digits()."
+)
+_PRACTICE_KEYSTROKES = METRICS.counter(
+    "pigame_practice_keystrokes_total", "Digits typed in practice sessions."
+)
+_STATS_WRITE_SECONDS = {
+    store: METRICS.histogram(
+        "pigame_stats_write_seconds",
+        "Time to write practice statistics, by store.",
+        store=store,
+    )
+    for store in ("json", "sqlite")
+}
 
 # ANSI color codes
 red = "\033[0;31m"
@@ -109,8 +503,39 @@ class TooManyDigitsError(PiError):
         super().__init__(msg)
 
 
+class InvalidDigitsError(PiError, ValueError):
+    """Raised when an answer is not digits with at most one decimal point."""
+
+    def __init__(self: InvalidDigitsError, value: str) -> None:
+        """Initialize invalid digits error.
+
+        Args:
+            value: The rejected answer.
+        """
+        msg = f"Invalid input {value!r}: use digits and at most one decimal point"
+        super().__init__(msg)
+
+
+class UnknownConstantError(PiError, ValueError):
+    """Raised when a constant name is not in ``MATHEMATICAL_CONSTANTS``."""
+
+    def __init__(self: UnknownConstantError, name: str) -> None:
+        """Initialize unknown constant error.
+
+        Args:
+            name: The unknown constant name.
+        """
+        known = ", ".join(MATHEMATICAL_CONSTANTS)
+        msg = f"Unknown constant '{name}'. Choose from: {known}"
+        super().__init__(msg)
+
+
+@functools.cache
 def get_version() -> str:
-    """Read version from VERSION file or return default version."""
+    """Read version from VERSION file or return default version.
+
+    The file is only read when the version is first needed.
+    """
     try:
         version_file = Path(__file__).parent.parent / "VERSION"
         return version_file.read_text(encoding="utf-8").strip()
@@ -118,7 +543,12 @@ def get_version() -> str:
         return "0.0.0"
 
 
-VERSION = get_version()
+def __getattr__(name: str) -> object:
+    """Resolve ``VERSION`` on first access instead of at import time."""
+    if name == "VERSION":
+        return get_version()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 def usage(exit_code: int = 1) -> NoReturn:
@@ -134,30 +564,30 @@ def usage(exit_code: int = 1) -> NoReturn:
 
 
 def input_validation(input_str: str) -> bool:
-    """Validate that input contains only digits and at most one decimal point."""
+    """Validate that input contains only digits and at most one decimal point.
+
+    Raises:
+        InvalidDigitsError: If it does not (a ``ValueError``).
+    """
     logger.debug("input_validation: checking %r", input_str)
 
     if not input_str:
-        msg = "Invalid input"
-        raise ValueError(msg)
+        raise InvalidDigitsError(input_str)
 
     dot_count = input_str.count(".")
     comma_count = input_str.count(",")
 
     if comma_count > 0:
         logger.debug("input_validation: comma found in %r", input_str)
-        msg = "Invalid input"
-        raise ValueError(msg)
+        raise InvalidDigitsError(input_str)
 
     if not all(c.isdigit() or c == "." for c in input_str):
         logger.debug("input_validation: non-digit character in %r", input_str)
-        msg = "Invalid input"
-        raise ValueError(msg)
+        raise InvalidDigitsError(input_str)
 
     if dot_count > 1:
         logger.debug("input_validation: %d decimal points in %r", dot_count, input_str)
-        msg = "Invalid input"
-        raise ValueError(msg)
+        raise InvalidDigitsError(input_str)
 
     logger.debug("input_validation: %r OK", input_str)
     return True
@@ -203,16 +633,8 @@ def length_validation(length_str: str) -> int:
 def calculate_pi(length: int) -> str:
     """Return pi digits from a verified source."""
     logger.debug("calculate_pi: requesting %d decimal digit(s)", length)
-    # Verified digits of π from a trusted source
-    pi_digits = (
-        "141592653589793238462643383279502884197169399375105820974944592307816406286"
-        "208998628034825342117067982148086513282306647093844609550582231725359408128"
-        "481117450284102701938521105559644622948954930381964428810975665933446128475"
-        "648233786783165271201909145648566923460348610454326648213393607260249141273"
-        "724587006606315588174881520920962829254091715364367892590360011330530548820"
-        "466521384146951941511609433057270365759591953092186117381932611793105118548"
-        "074462379962749567351885752724891227938183011949129833673362440656643"
-    )
+    # Verified digits of π from a trusted source (shared with the constants)
+    pi_digits = _CONSTANT_DIGIT_STRINGS["pi"]
 
     # Check for negative length
     if length < 0:
@@ -367,15 +789,14 @@ def calculate_constant(name: str, length: int) -> str:
         String of the form ``"<integer>.<decimals>"``.
 
     Raises:
-        ValueError: If *name* is unknown, or *length* is negative.
+        UnknownConstantError: If *name* is unknown (a ``ValueError``).
+        ValueError: If *length* is negative.
         TooManyDigitsError: If more digits are requested than are available.
     """
     logger.debug("calculate_constant: name=%r length=%d", name, length)
 
     if name not in MATHEMATICAL_CONSTANTS:
-        known = ", ".join(MATHEMATICAL_CONSTANTS)
-        msg = f"Unknown constant '{name}'. Choose from: {known}"
-        raise ValueError(msg)
+        raise UnknownConstantError(name)
 
     if name == "pi":
         return calculate_pi(length)
@@ -399,19 +820,55 @@ def calculate_constant(name: str, length: int) -> str:
     return result
 
 
+@functools.cache
+def _digit_buffer(name: str) -> str:
+    """Return every available digit of a constant as ``"<integer>.<decimals>"``.
+
+    The string is built once per constant and shared by every practice level,
+    review chunk and replay, which only ever slice the window they need.
+
+    Args:
+        name: Constant identifier, a key of ``MATHEMATICAL_CONSTANTS``.
+    """
+    integer_part = MATHEMATICAL_CONSTANTS[name]["integer_part"]
+    return f"{integer_part}.{_CONSTANT_DIGIT_STRINGS[name]}"
+
+
+def _constant_file(path: Path, constant: str) -> Path:
+    """Return the per-constant variant of a practice data file.
+
+    π keeps the original file name, so existing statistics stay where they
+    are; other constants get their own namespace (``stats-e.json``).
+    """
+    if constant == "pi":
+        return path
+    return path.with_stem(f"{path.stem}-{constant}")
+
+
 def format_pi_with_spaces(pi_str: str) -> str:
     """Format pi with spaces every 5 digits for better readability."""
-    # Start with the first 2 characters "3."
-    result = pi_str[:2]
+    # Keep the first 2 characters "3." and join the rest in groups of 5, in
+    # one pass rather than by growing a string a digit at a time
+    decimals = pi_str[2:]
+    groups = (decimals[i : i + 5] for i in range(0, len(decimals), 5))
+    return pi_str[:2] + " ".join(groups)
 
-    # Add the rest with spaces every 5 digits
-    for i, digit in enumerate(pi_str[2:]):
-        # Add space after every 5 digits
-        if i > 0 and i % 5 == 0:
-            result += " "
-        result += digit
 
-    return result
+def _color_digits(
+    answer: str,
+    expected: str,
+    *,
+    colorblind_mode: bool = False,
+) -> str:
+    """Return *answer* with each digit coloured right or wrong."""
+    if colorblind_mode:
+        right, wrong = "\033[38;5;34m", "\033[38;5;208m"
+    else:
+        right, wrong = "\033[92m", "\033[91m"
+    return "".join(
+        f"{right if digit == correct else wrong}{digit}\033[0m"
+        for digit, correct in zip(answer, expected, strict=False)
+    )
 
 
 def color_your_pi(
@@ -432,24 +889,10 @@ def color_your_pi(
     Returns:
         Number of incorrect digits found
     """
-    error_count = 0
-    output = []
-    for input_digit, correct_digit in zip(input_pi, correct_pi, strict=False):
-        if input_digit != correct_digit:
-            error_count += 1
-            if colorblind_mode:
-                colored_digit = f"\033[38;5;208m{input_digit}\033[0m"
-                output.append(colored_digit)
-            else:
-                colored_digit = f"\033[91m{input_digit}\033[0m"
-                output.append(colored_digit)
-        elif colorblind_mode:
-            colored_digit = f"\033[38;5;34m{input_digit}\033[0m"
-            output.append(colored_digit)
-        else:
-            colored_digit = f"\033[92m{input_digit}\033[0m"
-            output.append(colored_digit)
-    print("".join(output))
+    error_count = sum(
+        digit != correct for digit, correct in zip(input_pi, correct_pi, strict=False)
+    )
+    print(_color_digits(input_pi, correct_pi, colorblind_mode=colorblind_mode))
 
     if verbose:
         print(f"Found {error_count} incorrect digits")
@@ -478,34 +921,332 @@ def print_results(  # noqa: PLR0913
         symbol: Unicode symbol for the constant (e.g. ``"π"``, ``"e"``, ``"φ"``).
         constant_name: Human-readable name of the constant (e.g. ``"Pi"``).
     """
-    # Format constant with spaces for better readability
-    formatted_pi = format_pi_with_spaces(calculated_pi)
-
-    if verbose:
-        print(f"{symbol} with {decimals} decimals:\t{formatted_pi}")
-        print(f"Your version of {symbol}:\t{user_pi}")
-
-    color_your_pi(
-        input_pi=user_pi,
-        correct_pi=calculated_pi,
+    result = ScoreResult(
+        answer=user_pi,
+        expected=calculated_pi,
+        decimals=decimals,
+        errors=_digit_errors(user_pi, calculated_pi),
+    )
+    report = format_score(
+        result,
         verbose=verbose,
         colorblind_mode=colorblind_mode,
+        symbol=symbol,
+        constant_name=constant_name,
     )
+    for line in report.splitlines():
+        print(line)
 
-    if calculated_pi == user_pi:
-        if verbose:
-            if decimals < PERFECT_SCORE_THRESHOLD:
-                print("Well done.")
-            else:
-                print(
-                    f"Perfect! You know {decimals} decimal places of {constant_name}!"
-                )
-        else:
-            print("Match")
-    elif verbose:
-        print("You can do better!")
+
+# ---------------------------------------------------------------------------
+# Library API - pure functions for embedding pigame in other programs
+# ---------------------------------------------------------------------------
+# These never print or exit: they return values or raise PiError subclasses.
+# The command line is a thin adapter that prints their results.
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ScoreResult:
+    """Outcome of comparing an answer with the digits of a constant.
+
+    Attributes:
+        answer: The digits as given, e.g. ``"3.14158"``.
+        expected: The constant to the same number of decimals.
+        decimals: Number of decimals compared.
+        constant: Constant compared with, a key of ``MATHEMATICAL_CONSTANTS``.
+        errors: Positions in *answer* whose character is wrong.
+    """
+
+    answer: str
+    expected: str
+    decimals: int
+    constant: str = "pi"
+    errors: tuple[int, ...] = ()
+
+    @property
+    def match(self: ScoreResult) -> bool:
+        """Whether the answer is exactly the expected digits."""
+        return self.answer == self.expected
+
+
+def _digit_errors(answer: str, expected: str) -> tuple[int, ...]:
+    """Return the positions where *answer* differs from *expected*."""
+    return tuple(
+        position
+        for position, (digit, correct) in enumerate(zip(answer, expected, strict=False))
+        if digit != correct
+    )
+
+
+def digits(length: int = DEFAULT_LENGTH, constant: str = "pi") -> str:
+    """Return a constant to *length* decimals, e.g. ``digits(5) == "3.14159"``.
+
+    Args:
+        length: Number of decimals (0 for the default of ``DEFAULT_LENGTH``).
+        constant: Constant to return, a key of ``MATHEMATICAL_CONSTANTS``.
+
+    Raises:
+        UnknownConstantError: If *constant* is unknown.
+        NegativeLengthError: If *length* is negative.
+        TooManyDigitsError: If more digits are requested than are available.
+    """
+    if length < 0:
+        raise NegativeLengthError(length)
+    value = calculate_constant(constant, length)
+    _DIGITS_GENERATED.inc(length or DEFAULT_LENGTH)
+    return value
+
+
+def score(
+    answer: str,
+    constant: str = "pi",
+    *,
+    decimals: int | None = None,
+) -> ScoreResult:
+    """Compare an answer with the digits of a constant.
+
+    Args:
+        answer: The digits to check, e.g. ``"3.14158"``.
+        constant: Constant to compare with, a key of ``MATHEMATICAL_CONSTANTS``.
+        decimals: Number of decimals to compare with (default: as many as
+            *answer* has).
+
+    Raises:
+        InvalidDigitsError: If *answer* is not digits with at most one point.
+        UnknownConstantError: If *constant* is unknown.
+        TooManyDigitsError: If *answer* is longer than the digits available.
+    """
+    start = time.perf_counter()
+    input_validation(answer)
+    if decimals is None:
+        decimals = (
+            len(answer) - 2 if len(answer) >= MIN_DIGITS_WITH_POINT else len(answer)
+        )
+    expected = digits(decimals, constant)
+    result = ScoreResult(
+        answer=answer,
+        expected=expected,
+        decimals=decimals,
+        constant=constant,
+        errors=_digit_errors(answer, expected),
+    )
+    size_class = bisect.bisect_right(SCORE_SIZE_CLASSES, len(answer))
+    _SCORE_SECONDS[size_class].observe(time.perf_counter() - start)
+    return result
+
+
+def format_digits(value: str) -> str:
+    """Return digits grouped in fives after the point, e.g. ``"3.14159 26535"``."""
+    return format_pi_with_spaces(value)
+
+
+def format_score(
+    result: ScoreResult,
+    *,
+    verbose: bool = False,
+    colorblind_mode: bool = False,
+    symbol: str | None = None,
+    constant_name: str | None = None,
+) -> str:
+    """Return the report the command line prints for a score.
+
+    Args:
+        result: The score to report.
+        verbose: Whether to include the digits compared and the error count.
+        colorblind_mode: Whether to use colorblind-friendly highlighting.
+        symbol: Symbol for the constant (default: from its metadata).
+        constant_name: Name of the constant (default: from its metadata).
+    """
+    meta = MATHEMATICAL_CONSTANTS[result.constant]
+    symbol = symbol or meta["symbol"]
+    lines = []
+    if verbose:
+        expected = format_digits(result.expected)
+        lines.append(f"{symbol} with {result.decimals} decimals:\t{expected}")
+        lines.append(f"Your version of {symbol}:\t{result.answer}")
+    lines.append(
+        _color_digits(result.answer, result.expected, colorblind_mode=colorblind_mode)
+    )
+    if verbose:
+        lines.append(f"Found {len(result.errors)} incorrect digits")
+
+    if not verbose:
+        lines.append("Match" if result.match else "No match")
+    elif not result.match:
+        lines.append("You can do better!")
+    elif result.decimals < PERFECT_SCORE_THRESHOLD:
+        lines.append("Well done.")
     else:
-        print("No match")
+        name = constant_name or meta["name"]
+        lines.append(f"Perfect! You know {result.decimals} decimal places of {name}!")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Output cache - encoded digit output, ready to write, for repeated requests
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a :class:`ByteLRU`.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to build their value.
+        entries: Values held.
+        size: Bytes held.
+        max_size: Most bytes held at once.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    size: int
+    max_size: int
+
+
+class ByteLRU:
+    """Least-recently-used cache of encoded output, bounded by total size.
+
+    The bound is on the bytes held, not on the number of entries, so a few
+    thousand-digit outputs weigh as much as many short ones.  A value larger
+    than the whole cache is returned but not kept.  The cache is not
+    thread-safe; use it from one thread (or event loop).
+    """
+
+    def __init__(self: ByteLRU, max_size: int = OUTPUT_CACHE_BYTES) -> None:
+        """Initialize an empty cache holding at most *max_size* bytes."""
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+
+    def __len__(self: ByteLRU) -> int:
+        """Return the number of values held."""
+        return len(self._entries)
+
+    def __contains__(self: ByteLRU, key: Hashable) -> bool:
+        """Whether a value for *key* is held (not counted as a hit)."""
+        return key in self._entries
+
+    def get(self: ByteLRU, key: Hashable, build: Callable[[], bytes]) -> bytes:
+        """Return the value for *key*, calling *build* to make it on a miss."""
+        value = self._entries.get(key)
+        if value is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+        self.misses += 1
+        value = build()
+        self.put(key, value)
+        return value
+
+    def put(self: ByteLRU, key: Hashable, value: bytes) -> None:
+        """Store *value*, evicting the least recently used values to make room."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        if len(value) > self.max_size:
+            return
+        self._entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def clear(self: ByteLRU) -> None:
+        """Drop every value (the counters are kept)."""
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self: ByteLRU) -> CacheStats:
+        """Return the hit and miss counters and the current size."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            entries=len(self._entries),
+            size=self.size,
+            max_size=self.max_size,
+        )
+
+
+# How digits_output() renders each format: plain and grouped digits and the
+# verbose -p line end with a newline, as printed; "json" is a response body
+DIGIT_OUTPUT_FORMATS: dict[str, Callable[[str, int, str], str]] = {
+    "plain": lambda value, _length, _constant: f"{value}\n",
+    "grouped": lambda value, _length, _constant: f"{format_digits(value)}\n",
+    "verbose": lambda value, length, constant: (
+        f"{MATHEMATICAL_CONSTANTS[constant]['symbol']} with {length} decimals:"
+        f"\t{format_digits(value)}\n"
+    ),
+    "json": lambda value, _length, _constant: json.dumps(
+        {"digits": value}, separators=(",", ":")
+    ),
+}
+
+# Shared by the command line, the worker and the HTTP service
+OUTPUT_CACHE = ByteLRU()
+METRICS.register_reader(
+    "pigame_output_cache_hits_total",
+    "counter",
+    "Digit outputs served from the output cache.",
+    lambda: OUTPUT_CACHE.stats().hits,
+)
+METRICS.register_reader(
+    "pigame_output_cache_misses_total",
+    "counter",
+    "Digit outputs built because they were not cached.",
+    lambda: OUTPUT_CACHE.stats().misses,
+)
+METRICS.register_reader(
+    "pigame_output_cache_bytes",
+    "gauge",
+    "Bytes held by the output cache.",
+    lambda: OUTPUT_CACHE.stats().size,
+)
+
+
+def digits_output(
+    length: int = DEFAULT_LENGTH,
+    constant: str = "pi",
+    *,
+    fmt: str = "grouped",
+) -> bytes:
+    """Return ``digits(length, constant)`` rendered and encoded as UTF-8.
+
+    Results are kept in ``OUTPUT_CACHE``, so a repeated request is a
+    dictionary lookup.
+
+    Args:
+        length: Number of decimals.
+        constant: Constant to return, a key of ``MATHEMATICAL_CONSTANTS``.
+        fmt: A key of ``DIGIT_OUTPUT_FORMATS``.
+
+    Raises:
+        KeyError: If *fmt* is unknown.
+        UnknownConstantError: If *constant* is unknown.
+        NegativeLengthError: If *length* is negative.
+        TooManyDigitsError: If more digits are requested than are available.
+    """
+    render = DIGIT_OUTPUT_FORMATS[fmt]
+    return OUTPUT_CACHE.get(
+        (constant, length, fmt),
+        lambda: render(digits(length, constant), length, constant).encode(),
+    )
+
+
+def _write_output(data: bytes) -> None:
+    """Write encoded output to stdout, as bytes when its encoding allows."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None or (sys.stdout.encoding or "").lower() not in {"utf-8", "utf8"}:
+        sys.stdout.write(data.decode())
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
 
 
 def handle_easter_egg(input_str: str) -> bool:
@@ -554,1063 +1295,5565 @@ def handle_easter_egg(input_str: str) -> bool:
     return True
 
 
-def load_practice_stats() -> dict[str, object]:
-    """Load practice statistics from file."""
-    # Create directory if it doesn't exist
-    if not PRACTICE_CONFIG_DIR.exists():
-        PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+@contextlib.contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock for read-modify-write of *path*.
 
-    # Create stats file if it doesn't exist
-    if not PRACTICE_STATS_FILE.exists():
-        default_stats = {
-            "max_digits": 0,
-            "total_digits_correct": 0,
-            "total_practice_sessions": 0,
-            "last_session_date": None,
-            "fastest_time": None,
-            "best_speed": None,  # digits per minute
-            "history": [],
-        }
-        with PRACTICE_STATS_FILE.open("w", encoding="utf-8") as f:
-            json.dump(default_stats, f, indent=2)
-        return default_stats
+    The lock lives in a ``.lock`` file next to *path*, so it survives the
+    file itself being replaced.  Other pigame processes wait only as long
+    as the current holder's update takes.
+    """
+    lock_file = path.with_name(f"{path.name}.lock")
+    with lock_file.open("a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
 
-    # Load existing stats
+
+def _write_json_atomic(path: Path, data: object) -> None:
+    """Replace *path* with *data* as JSON, never leaving a partial file.
+
+    The JSON goes to a temporary file in the same directory, is flushed to
+    disk and then renamed over *path*, so a crash leaves either the old or
+    the new contents.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
     try:
-        with PRACTICE_STATS_FILE.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        # Return default stats if there's an error
-        return {
-            "max_digits": 0,
-            "total_digits_correct": 0,
-            "total_practice_sessions": 0,
-            "last_session_date": None,
-            "fastest_time": None,
-            "best_speed": None,
-            "history": [],
-        }
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    # Make the rename itself durable
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
-def save_practice_stats(stats: dict[str, object]) -> None:
-    """Save practice statistics to file."""
-    # Create directory if it doesn't exist
-    if not PRACTICE_CONFIG_DIR.exists():
-        PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+# Log offset folded into each snapshot file, as last read or written
+_STATS_LOG_OFFSETS: dict[Path, int] = {}
 
-    # Save stats
-    with PRACTICE_STATS_FILE.open("w", encoding="utf-8") as f:
-        json.dump(stats, f, indent=2)
 
+def _default_practice_stats() -> dict[str, object]:
+    """Return the statistics of someone who has never practised."""
+    return {
+        "max_digits": 0,
+        "total_digits_correct": 0,
+        "total_practice_sessions": 0,
+        "last_session_date": None,
+        "fastest_time": None,
+        "best_speed": None,  # digits per minute
+        "history": [],
+    }
 
-def load_practice_config() -> dict[str, object]:
-    """Load practice configuration from file."""
-    # Create directory if it doesn't exist
-    if not PRACTICE_CONFIG_DIR.exists():
-        PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Create config file if it doesn't exist
-    if not PRACTICE_CONFIG_FILE.exists():
-        default_config = {
-            "mode": DEFAULT_PRACTICE_MODE,
-            "min_digits": PRACTICE_MIN_DIGITS,
-            "max_digits": PRACTICE_MAX_DIGITS,
-            "chunk_size": DEFAULT_CHUNK_SIZE,
-            "time_limit": DEFAULT_TIME_LIMIT,
-            "show_timer": True,
-            "visual_aid": True,
-        }
-        with PRACTICE_CONFIG_FILE.open("w", encoding="utf-8") as f:
-            json.dump(default_config, f, indent=2)
-        return default_config
+def _stats_log_file(stats_file: Path) -> Path:
+    """Return the session event log that belongs to a statistics snapshot."""
+    return stats_file.with_suffix(".ndjson")
 
-    # Load existing config
+
+def _read_practice_events(log_file: Path, offset: int = 0) -> tuple[list, int]:
+    """Read the session events appended to a log after *offset*.
+
+    A torn final line (from a crash mid-write) and malformed lines are
+    skipped.
+
+    Args:
+        log_file: The NDJSON event log.
+        offset: Byte offset to start reading from; an offset past the end
+            means the log was replaced, so it is read from the start.
+
+    Returns:
+        The events and the offset they were actually read from.
+    """
     try:
-        with PRACTICE_CONFIG_FILE.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        # Return default config if there's an error
-        return {
-            "mode": DEFAULT_PRACTICE_MODE,
-            "min_digits": PRACTICE_MIN_DIGITS,
-            "max_digits": PRACTICE_MAX_DIGITS,
-            "chunk_size": DEFAULT_CHUNK_SIZE,
-            "time_limit": DEFAULT_TIME_LIMIT,
-            "show_timer": True,
-            "visual_aid": True,
-        }
+        with log_file.open("rb") as f:
+            if offset > f.seek(0, os.SEEK_END):
+                offset = 0
+            f.seek(offset)
+            return list(_parse_practice_events(f)), offset
+    except FileNotFoundError:
+        return [], 0
+
+
+def _parse_practice_events(lines: Iterable[bytes]) -> Iterator[dict]:
+    """Yield the events in NDJSON log lines, stopping at a torn final line."""
+    for line in lines:
+        if not line.endswith(b"\n"):
+            break
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            continue
 
 
-def save_practice_config(config: dict[str, object]) -> None:
-    """Save practice configuration to file."""
-    # Create directory if it doesn't exist
-    if not PRACTICE_CONFIG_DIR.exists():
-        PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+def _open_stats_log(stats_file: Path) -> BinaryIO:
+    """Open a statistics event log for appending (hold the stats lock).
 
-    # Save config
-    with PRACTICE_CONFIG_FILE.open("w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    A line torn by a crash is terminated first, so it cannot swallow the
+    next event.
+    """
+    f = _stats_log_file(stats_file).open("a+b")
+    if f.seek(0, os.SEEK_END) > 0:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+    return f
 
 
-# Module-level constants for configuration constraints
-MIN_CHUNK_SIZE = 2
-MAX_CHUNK_SIZE = 10
-MIN_TIME_LIMIT = 30
-MAX_TIME_LIMIT = 600
+# Base of the speed sketch's logarithmic buckets
+_SPEED_SKETCH_GAMMA = (1 + SPEED_SKETCH_ACCURACY) / (1 - SPEED_SKETCH_ACCURACY)
 
 
-def _display_config_menu(config: dict[str, object]) -> None:
-    """Display the configuration menu with current settings.
+def _sketch_add(sketch: dict[str, int], value: float) -> None:
+    """Count *value* in a mergeable quantile sketch.
+
+    Values share a bucket with everything within ``SPEED_SKETCH_ACCURACY``
+    of them (logarithmic buckets, as in DDSketch), so the sketch stays small
+    however many values it has seen, and two sketches merge by adding up
+    their bucket counts.
 
     Args:
-        config: The configuration dictionary to display.
+        sketch: Bucket counts keyed by bucket index, updated in place.
+        value: The non-negative value to add.
     """
-    print("\nCurrent settings:")
-    print(f"1. Practice mode: {config.get('mode', DEFAULT_PRACTICE_MODE)}")
-    print(f"2. Minimum digits: {config.get('min_digits', PRACTICE_MIN_DIGITS)}")
-    print(f"3. Maximum digits: {config.get('max_digits', PRACTICE_MAX_DIGITS)}")
-    print(f"4. Chunk size: {config.get('chunk_size', DEFAULT_CHUNK_SIZE)}")
-    time_limit_str = (
-        f"5. Time limit: {config.get('time_limit', DEFAULT_TIME_LIMIT)} seconds"
-    )
-    print(time_limit_str)
-    print(f"6. Show timer: {'Yes' if config.get('show_timer', True) else 'No'}")
-    print(f"7. Visual aid: {'Yes' if config.get('visual_aid', True) else 'No'}")
-    print("8. Save and exit")
-    print("9. Reset to defaults")
-    print("\n")
+    key = "0" if value <= 0 else str(math.ceil(math.log(value, _SPEED_SKETCH_GAMMA)))
+    sketch[key] = sketch.get(key, 0) + 1
 
 
-def _get_default_config() -> dict[str, object]:
-    """Get the default practice configuration.
+def _sketch_quantile(sketch: dict[str, int], q: float) -> float | None:
+    """Return the *q*-quantile of a sketch, or None if it is empty.
 
-    Returns:
-        Dictionary with default configuration values.
+    Args:
+        sketch: Bucket counts as built by :func:`_sketch_add`.
+        q: Quantile between 0 and 1.
     """
-    return {
-        "mode": DEFAULT_PRACTICE_MODE,
-        "min_digits": PRACTICE_MIN_DIGITS,
-        "max_digits": PRACTICE_MAX_DIGITS,
-        "chunk_size": DEFAULT_CHUNK_SIZE,
-        "time_limit": DEFAULT_TIME_LIMIT,
-        "show_timer": True,
-        "visual_aid": True,
-    }
+    total = sum(sketch.values())
+    if not total:
+        return None
+    rank = q * (total - 1)
+    seen = 0
+    for key in sorted(sketch, key=lambda key: -math.inf if key == "0" else int(key)):
+        seen += sketch[key]
+        if seen > rank:
+            break
+    if key == "0":
+        return 0.0
+    return 2 * _SPEED_SKETCH_GAMMA ** int(key) / (_SPEED_SKETCH_GAMMA + 1)
 
 
-def _handle_mode_selection(config: dict[str, object]) -> None:
-    """Handle practice mode selection.
+def _add_to_rollup(bucket: dict[str, object], record: dict[str, object]) -> None:
+    """Add one session to a rollup bucket.
 
     Args:
-        config: The configuration dictionary to update.
+        bucket: Session count, digits, seconds, best level and speed sketch.
+        record: The session record.
     """
-    print("\nSelect practice mode:")
-    print("1. Standard - Digit by digit practice")
-    print("2. Timed - Race against the clock")
-    print("3. Chunk - Practice in groups of digits\n")
-    mode_choice = input("Select mode (1-3): ").strip()
+    bucket["sessions"] = bucket.get("sessions", 0) + 1
+    bucket["digits"] = bucket.get("digits", 0) + record["correct_digits"]
+    bucket["seconds"] = bucket.get("seconds", 0) + record["duration_seconds"]
+    bucket["best"] = max(bucket.get("best", 0), record["max_level"])
+    if record["duration_seconds"] > 0:
+        speed = record["correct_digits"] / record["duration_seconds"] * 60
+        _sketch_add(bucket.setdefault("speed", {}), speed)
 
-    if mode_choice == "1":
-        config["mode"] = "standard"
-    elif mode_choice == "2":
-        config["mode"] = "timed"
-    elif mode_choice == "3":
-        config["mode"] = "chunk"
-    else:
-        print("Invalid selection. No changes made.")
 
+def _update_rollups(rollups: dict[str, object], record: dict[str, object]) -> None:
+    """Add one session to the daily and weekly rollups.
 
-def _handle_min_digits(config: dict[str, object]) -> None:
-    """Handle minimum digits configuration.
+    Daily rollups older than ``ROLLUP_DAILY_DAYS`` are dropped; weekly ones
+    (keyed by the Monday starting the week) are kept.
 
     Args:
-        config: The configuration dictionary to update.
+        rollups: The rollups, updated in place.
+        record: The session record.
     """
-    prompt = f"Enter minimum digits ({PRACTICE_MIN_DIGITS}-{PRACTICE_MAX_DIGITS}): "
-    min_digits_input = input(prompt).strip()
-    try:
-        min_digits = int(min_digits_input)
-        if PRACTICE_MIN_DIGITS <= min_digits <= PRACTICE_MAX_DIGITS:
-            config["min_digits"] = min_digits
-        else:
-            msg = (
-                f"Value must be between {PRACTICE_MIN_DIGITS} "
-                f"and {PRACTICE_MAX_DIGITS}."
-            )
-            print(msg)
-    except ValueError:
-        print("Invalid input. Please enter a number.")
+    day = dt.date.fromisoformat(record["date"][:10])
+    week = day - dt.timedelta(days=day.weekday())
+    mode = record.get("mode", DEFAULT_PRACTICE_MODE)
+    rollups.setdefault("daily_since", day.isoformat())
+    periods = [("weekly", week)]
+    if day.isoformat() >= rollups["daily_since"]:
+        periods.append(("daily", day))
+    for period, key in periods:
+        buckets = rollups.setdefault(period, {}).setdefault(key.isoformat(), {})
+        _add_to_rollup(buckets.setdefault(mode, {}), record)
+
+    # Daily rollups cover every day since "daily_since"
+    cutoff = (day - dt.timedelta(days=ROLLUP_DAILY_DAYS)).isoformat()
+    if rollups["daily_since"] < cutoff:
+        rollups["daily_since"] = cutoff
+        rollups["daily"] = {
+            key: value
+            for key, value in rollups.get("daily", {}).items()
+            if key >= cutoff
+        }
 
 
-def _handle_max_digits(config: dict[str, object]) -> None:
-    """Handle maximum digits configuration.
+def _build_rollups(history: list[dict[str, object]]) -> dict[str, object]:
+    """Build rollups from a list of session records, oldest first."""
+    rollups: dict[str, object] = {}
+    for record in history:
+        _update_rollups(rollups, record)
+    return rollups
 
-    Args:
-        config: The configuration dictionary to update.
-    """
-    prompt = f"Enter maximum digits ({PRACTICE_MIN_DIGITS}-{PRACTICE_MAX_DIGITS}): "
-    max_digits_input = input(prompt).strip()
-    try:
-        max_digits = int(max_digits_input)
-        if PRACTICE_MIN_DIGITS <= max_digits <= PRACTICE_MAX_DIGITS:
-            config["max_digits"] = max_digits
-        else:
-            msg = (
-                f"Value must be between {PRACTICE_MIN_DIGITS} "
-                f"and {PRACTICE_MAX_DIGITS}."
-            )
-            print(msg)
-    except ValueError:
-        print("Invalid input. Please enter a number.")
 
+def summarize_practice_stats(
+    stats: dict[str, object],
+    *,
+    since: str | None = None,
+    mode: str | None = None,
+) -> dict[str, object]:
+    """Summarise practice from the rollups, without walking the history.
 
-def _handle_chunk_size(config: dict[str, object]) -> None:
-    """Handle chunk size configuration.
+    The cost depends on the number of days or weeks covered, not on the
+    number of sessions.  Dates before the daily rollups' window are
+    resolved to whole weeks.
 
     Args:
-        config: The configuration dictionary to update.
+        stats: Practice statistics dictionary.
+        since: Only count sessions on or after this date (``YYYY-MM-DD``).
+        mode: Only count sessions of this practice mode.
+
+    Returns:
+        Session count, digits, seconds, best level and the median and 90th
+        percentile speed (digits per minute, None if no session was timed).
     """
-    chunk_size_input = input("Enter chunk size (2-10): ").strip()
-    try:
-        chunk_size = int(chunk_size_input)
-        if MIN_CHUNK_SIZE <= chunk_size <= MAX_CHUNK_SIZE:
-            config["chunk_size"] = chunk_size
-        else:
-            msg = f"Value must be between {MIN_CHUNK_SIZE} and {MAX_CHUNK_SIZE}."
-            print(msg)
-    except ValueError:
-        print("Invalid input. Please enter a number.")
+    rollups = stats.get("rollups") or _build_rollups(stats.get("history", []))
+    if since is not None and since >= rollups.get("daily_since", "9999"):
+        periods = [b for k, b in rollups["daily"].items() if k >= since]
+    else:
+        first_week = ""
+        if since is not None:
+            day = dt.date.fromisoformat(since)
+            first_week = (day - dt.timedelta(days=day.weekday())).isoformat()
+        periods = [b for k, b in rollups.get("weekly", {}).items() if k >= first_week]
+
+    summary = {"sessions": 0, "digits": 0, "seconds": 0, "best": 0}
+    speed: dict[str, int] = {}
+    for period in periods:
+        for bucket_mode, bucket in period.items():
+            if mode is not None and bucket_mode != mode:
+                continue
+            for field_name in ("sessions", "digits", "seconds"):
+                summary[field_name] += bucket[field_name]
+            summary["best"] = max(summary["best"], bucket["best"])
+            for key, count in bucket.get("speed", {}).items():
+                speed[key] = speed.get(key, 0) + count
+    summary["speed_p50"] = _sketch_quantile(speed, 0.5)
+    summary["speed_p90"] = _sketch_quantile(speed, 0.9)
+    return summary
 
 
-def _handle_time_limit(config: dict[str, object]) -> None:
-    """Handle time limit configuration.
+def _apply_practice_event(stats: dict[str, object], event: dict) -> None:
+    """Fold one session event into the aggregate statistics.
 
     Args:
-        config: The configuration dictionary to update.
+        stats: Practice statistics dictionary, updated in place.
+        event: A session event as written by :func:`_update_practice_stats`.
     """
-    prompt = f"Enter time limit in seconds ({MIN_TIME_LIMIT}-{MAX_TIME_LIMIT}): "
-    time_limit_input = input(prompt).strip()
-    try:
-        time_limit = int(time_limit_input)
-        if MIN_TIME_LIMIT <= time_limit <= MAX_TIME_LIMIT:
-            config["time_limit"] = time_limit
-        else:
-            msg = f"Value must be between {MIN_TIME_LIMIT} and {MAX_TIME_LIMIT}."
-            print(msg)
-    except ValueError:
-        print("Invalid input. Please enter a number.")
+    record = event["session"]
+    stats["max_digits"] = max(stats.get("max_digits", 0), record["max_level"])
+    stats["total_digits_correct"] = (
+        stats.get("total_digits_correct", 0) + record["correct_digits"]
+    )
+    stats["total_practice_sessions"] = stats.get("total_practice_sessions", 0) + 1
+    stats["last_session_date"] = max(
+        stats.get("last_session_date") or "", record["date"]
+    )
+
+    # Update fastest time for timed mode
+    elapsed_time = event.get("elapsed_time")
+    time_improved = not stats.get("fastest_time") or (
+        elapsed_time is not None
+        and elapsed_time < stats.get("fastest_time", float("inf"))
+    )
+    if record["mode"] == "timed" and elapsed_time is not None and time_improved:
+        stats["fastest_time"] = elapsed_time
 
+    best_speed = event.get("best_speed")
+    if best_speed and (
+        not stats.get("best_speed") or best_speed > stats.get("best_speed")
+    ):
+        stats["best_speed"] = best_speed
 
-def _handle_show_timer(config: dict[str, object]) -> None:
-    """Handle show timer configuration.
+    # Rollups summarise every session; older snapshots are brought up to date
+    if "rollups" not in stats:
+        stats["rollups"] = _build_rollups(stats.get("history", []))
+    _update_rollups(stats["rollups"], record)
 
-    Args:
-        config: The configuration dictionary to update.
-    """
-    show_timer = input("Show timer? (y/n): ").strip().lower()
-    if show_timer in ("y", "yes"):
-        config["show_timer"] = True
-    elif show_timer in ("n", "no"):
-        config["show_timer"] = False
-    else:
-        print("Invalid input. No changes made.")
+    # The snapshot keeps recent sessions only; the log keeps all of them
+    history = stats.setdefault("history", [])
+    history.append(record)
+    if len(history) > 1 and history[-2]["date"] > record["date"]:
+        # Imported sessions may be older than the ones already recorded
+        history.sort(key=lambda session: session["date"])
+    if len(history) > STATS_RECENT_HISTORY:
+        stats["history"] = history[-STATS_RECENT_HISTORY:]
 
 
-def _handle_visual_aid(config: dict[str, object]) -> None:
-    """Handle visual aid configuration.
+def _load_json_stats(stats_file: Path) -> dict[str, object]:
+    """Read a statistics snapshot and fold in the sessions logged after it.
 
     Args:
-        config: The configuration dictionary to update.
+        stats_file: The snapshot file.
+
+    Returns:
+        The statistics including every logged session.
     """
-    visual_aid = input("Enable visual progress indicators? (y/n): ").strip().lower()
-    if visual_aid in ("y", "yes"):
-        config["visual_aid"] = True
-    elif visual_aid in ("n", "no"):
-        config["visual_aid"] = False
-    else:
-        print("Invalid input. No changes made.")
+    stats = _default_practice_stats()
+    if stats_file.exists():
+        try:
+            with stats_file.open("r", encoding="utf-8") as f:
+                stats = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            # Rebuild what the log still knows if the snapshot is unreadable
+            logger.warning("Cannot read %s, rebuilding it from the log", stats_file)
+            stats = _default_practice_stats()
+
+    events, offset = _read_practice_events(
+        _stats_log_file(stats_file), stats.pop("log_offset", 0)
+    )
+    for event in events:
+        _apply_practice_event(stats, event)
+    _STATS_LOG_OFFSETS[stats_file] = offset
+    return stats
 
 
-def _validate_and_save_config(config: dict[str, object]) -> bool:
-    """Validate and save the configuration.
+def _write_stats_snapshot(stats_file: Path, stats: dict[str, object]) -> None:
+    """Write a snapshot covering the whole event log (hold the stats lock)."""
+    try:
+        offset = _stats_log_file(stats_file).stat().st_size
+    except FileNotFoundError:
+        offset = 0
+    _write_json_atomic(stats_file, {**stats, "log_offset": offset})
+    _STATS_LOG_OFFSETS[stats_file] = offset
 
-    Args:
-        config: The configuration dictionary to validate and save.
 
-    Returns:
-        True if saved successfully, False if validation failed.
+def load_practice_stats(
+    constant: str = "pi",
+    profile: str | None = None,
+) -> dict[str, object]:
+    """Load practice statistics from file.
+
+    Reads the snapshot of the aggregates and folds in the sessions logged
+    since it was written, so the cost is bounded by the compaction interval
+    rather than by the length of the history.
+
+    Args:
+        constant: Constant whose statistics to load.
+        profile: Profile whose statistics to load (the OS user's own if None).
     """
-    if config.get("min_digits", 0) > config.get("max_digits", 0):
-        print(
-            "Error: Minimum digits cannot be greater than maximum digits.",
-        )
-        return False
+    db_file = _stats_db_file()
+    if db_file.exists():
+        return _sqlite_load_stats(db_file, constant, profile or DEFAULT_PROFILE)
+    if profile not in {None, DEFAULT_PROFILE}:
+        # Nothing is created until the profile's first session is saved
+        return _default_practice_stats()
 
-    save_practice_config(config)
-    print("\nConfiguration saved successfully!")
-    return True
+    # Snapshots are replaced atomically and the log only grows, so reading
+    # needs no lock; the files are created by the first session saved
+    return _load_json_stats(_constant_file(PRACTICE_STATS_FILE, constant))
 
 
-def _handle_reset_to_defaults(config: dict[str, object]) -> dict[str, object]:
-    """Handle resetting configuration to defaults.
+def load_practice_history(
+    constant: str = "pi",
+    profile: str | None = None,
+) -> list[dict[str, object]]:
+    """Return every recorded practice session, oldest first.
 
     Args:
-        config: The current configuration dictionary.
+        constant: Constant whose history to load.
+        profile: Profile whose history to load (the OS user's own if None).
+    """
+    return list(iter_practice_sessions(constant, profile))
 
-    Returns:
-        The default configuration if confirmed, otherwise the original config.
+
+def _session_key(record: dict[str, object]) -> str:
+    """Return what identifies a session record when merging or importing.
+
+    Sessions are logged with a unique ``uid``; older records without one,
+    several of which may share a second, are told apart by their contents.
     """
-    confirm = (
-        input("Are you sure you want to reset to defaults? (y/n): ").strip().lower()
+    if record.get("uid"):
+        return record["uid"]
+    return json.dumps(
+        [
+            record["date"],
+            record.get("mode", DEFAULT_PRACTICE_MODE),
+            record["max_level"],
+            record["correct_digits"],
+            record["duration_seconds"],
+        ]
     )
-    if confirm in ("y", "yes"):
-        default_config = _get_default_config()
-        save_practice_config(default_config)
-        print("\nConfiguration reset to defaults.")
-        return default_config
-    print("Reset cancelled.")
-    return config
 
 
-def configure_practice_mode() -> None:
-    """Interactive configuration for practice mode settings."""
-    # Load current configuration
-    config = load_practice_config()
+def iter_practice_sessions(
+    constant: str = "pi",
+    profile: str | None = None,
+) -> Iterator[dict[str, object]]:
+    """Yield every recorded practice session.
 
-    print("\n🔧 PIGAME PRACTICE MODE CONFIGURATION 🔧")
-    print("======================================\n")
+    Sessions are streamed from the event log (or the SQLite store) in the
+    order they were recorded, so memory use does not grow with the history.
+    Sessions older than the log, which only the snapshot remembers, come
+    first.
 
-    # Show initial menu
-    _display_config_menu(config)
+    Args:
+        constant: Constant whose sessions to yield.
+        profile: Profile whose sessions to yield (the OS user's own if None).
+    """
+    db_file = _stats_db_file()
+    if db_file.exists():
+        with contextlib.closing(_connect_stats_db(db_file, create=False)) as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(_STATS_SESSION_COLUMNS)} FROM sessions "  # noqa: S608
+                "WHERE profile = ? AND constant = ? ORDER BY id",
+                (profile or DEFAULT_PROFILE, constant),
+            )
+            for row in rows:
+                yield dict(zip(_STATS_SESSION_COLUMNS, row, strict=True))
+        return
+    if profile not in {None, DEFAULT_PROFILE}:
+        return
+
+    stats_file = _constant_file(PRACTICE_STATS_FILE, constant)
+    log_file = _stats_log_file(stats_file)
+    history = []
+    with contextlib.suppress(OSError, json.JSONDecodeError):
+        history = json.loads(stats_file.read_text(encoding="utf-8"))["history"]
+
+    # The snapshot's recent sessions up to the first logged one predate the
+    # log, unless they are logged too (imported later, or in the same second)
+    older = {}
+    with contextlib.suppress(FileNotFoundError), log_file.open("rb") as f:
+        events = _parse_practice_events(f)
+        first = next(events, None)
+        first_date = None if first is None else first["session"]["date"]
+        older = {
+            _session_key(record): record
+            for record in history
+            if first_date is None or record["date"] <= first_date
+        }
+        if first is not None:
+            older.pop(_session_key(first["session"]), None)
+        for event in events if older else ():
+            older.pop(_session_key(event["session"]), None)
+    yield from older.values()
 
-    # Menu option handlers
-    handlers = {
-        "1": _handle_mode_selection,
-        "2": _handle_min_digits,
-        "3": _handle_max_digits,
-        "4": _handle_chunk_size,
-        "5": _handle_time_limit,
-        "6": _handle_show_timer,
-        "7": _handle_visual_aid,
-    }
+    with contextlib.suppress(FileNotFoundError), log_file.open("rb") as f:
+        for event in _parse_practice_events(f):
+            yield event["session"]
 
-    while True:
-        try:
-            choice = input("Select an option (1-9): ").strip()
 
-            # Handle save and exit
-            if choice == "8":
-                if _validate_and_save_config(config):
-                    break
-                continue
+def save_practice_stats(
+    stats: dict[str, object],
+    constant: str = "pi",
+    profile: str | None = None,
+) -> None:
+    """Save a snapshot of practice statistics to file.
 
-            # Handle reset to defaults
-            if choice == "9":
-                config = _handle_reset_to_defaults(config)
-                _display_config_menu(config)
-                continue
+    *stats* must be as returned by :func:`load_practice_stats`, changed only
+    directly (sessions are recorded by logging them, not by saving).  The
+    snapshot records the log offset the statistics were loaded at, so
+    sessions logged since, by this or another process, are still folded in
+    by the next load.
 
-            # Handle configuration options
-            if choice in handlers:
-                handlers[choice](config)
-                _display_config_menu(config)
-            else:
-                print("Invalid selection. Please choose 1-9.")
+    Args:
+        stats: Statistics to save.
+        constant: Constant the statistics belong to.
+        profile: Profile the statistics belong to (the OS user's if None).
+    """
+    if not PRACTICE_CONFIG_DIR.exists():
+        PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-        except KeyboardInterrupt:
-            print("\n\nConfiguration cancelled. No changes saved.")
-            break
+    db_file = _stats_db_file() if profile is None else _profile_store()
+    if db_file.exists():
+        with (
+            _STATS_WRITE_SECONDS["sqlite"].timer(),
+            contextlib.closing(_connect_stats_db(db_file)) as conn,
+            conn,
+        ):
+            conn.execute("BEGIN IMMEDIATE")
+            _register_profile(conn, profile or DEFAULT_PROFILE)
+            _sqlite_save_totals(conn, stats, constant, profile or DEFAULT_PROFILE)
+        return
+
+    stats_file = _constant_file(PRACTICE_STATS_FILE, constant)
+    offset = _STATS_LOG_OFFSETS.get(stats_file, 0)
+    with _STATS_WRITE_SECONDS["json"].timer(), _file_lock(stats_file):
+        _write_json_atomic(stats_file, {**stats, "log_offset": offset})
+
+
+def _log_practice_event(
+    event: dict[str, object],
+    constant: str,
+    levels: list[dict[str, object]] | None = None,
+    profile: str | None = None,
+) -> None:
+    """Append a session event to the log, compacting it when due.
 
+    Appending costs the same however long the history is; the snapshot is
+    only rewritten once the log has grown by ``STATS_COMPACT_BYTES``.  With
+    the SQLite store the session and its levels are inserted instead.
 
-def display_timer(start_time: float, time_limit: int | None = None) -> None:
-    """Display a timer in the top-right corner of the terminal.
+    Compaction re-reads the snapshot and log under the lock rather than
+    trusting this process's copy of the statistics, so sessions saved
+    meanwhile by other terminals are merged instead of overwritten.
 
     Args:
-        start_time: The time when the timer started
-        time_limit: Optional time limit in seconds
+        event: The session event to append.
+        constant: Constant the session practised.
+        levels: The session's levels, kept by the SQLite store only.
+        profile: Profile that practised (the OS user if None).
     """
-    elapsed = time.time() - start_time
-    mins, secs = divmod(int(elapsed), 60)
+    if not PRACTICE_CONFIG_DIR.exists():
+        PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Create timer string
-    if time_limit:
-        remaining = max(0, time_limit - elapsed)
-        r_mins, r_secs = divmod(int(remaining), 60)
-        timer_str = f"⏱️  {mins:02d}:{secs:02d} | Remaining: {r_mins:02d}:{r_secs:02d}"
-    else:
-        timer_str = f"⏱️  {mins:02d}:{secs:02d}"
+    db_file = _stats_db_file() if profile is None else _profile_store()
+    if db_file.exists():
+        with _STATS_WRITE_SECONDS["sqlite"].timer():
+            _sqlite_record_session(
+                db_file, event, levels or [], constant, profile or DEFAULT_PROFILE
+            )
+        return
 
-    # Position cursor at top-right, print timer, then return cursor
-    sys.stdout.write(f"\033[s\033[1;40H{timer_str}\033[u")
-    sys.stdout.flush()
+    stats_file = _constant_file(PRACTICE_STATS_FILE, constant)
+    line = json.dumps(event, separators=(",", ":")) + "\n"
+    with _STATS_WRITE_SECONDS["json"].timer(), _file_lock(stats_file):
+        with _open_stats_log(stats_file) as f:
+            f.write(line.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
 
+        snapshot_offset = _STATS_LOG_OFFSETS.get(stats_file)
+        if not stats_file.exists() or (
+            snapshot_offset is not None and size - snapshot_offset > STATS_COMPACT_BYTES
+        ):
+            _write_stats_snapshot(stats_file, _load_json_stats(stats_file))
 
-def display_progress_bar(current: int, total: int, width: int = 30) -> None:
-    """Display a progress bar.
 
-    Args:
-        current: Current progress value
-        total: Total value for 100% completion
-        width: Width of the progress bar in characters
+# ---------------------------------------------------------------------------
+# Optional SQLite statistics store - used once `--migrate-stats` has run
+# ---------------------------------------------------------------------------
+
+_STATS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    created TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS profile_data (
+    profile TEXT NOT NULL REFERENCES profiles (name),
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (profile, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    constant TEXT NOT NULL,
+    date TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    max_level INTEGER NOT NULL,
+    correct_digits INTEGER NOT NULL,
+    duration_seconds INTEGER NOT NULL,
+    elapsed_time REAL,
+    best_speed REAL,
+    uid TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_by_date
+    ON sessions (profile, constant, date);
+CREATE INDEX IF NOT EXISTS sessions_by_mode
+    ON sessions (profile, constant, mode, date);
+CREATE TABLE IF NOT EXISTS levels (
+    session_id INTEGER NOT NULL REFERENCES sessions (id),
+    number INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    elapsed REAL,
+    PRIMARY KEY (session_id, number)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS results (
+    session_id INTEGER NOT NULL REFERENCES sessions (id),
+    level INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    PRIMARY KEY (session_id, level, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS totals (
+    profile TEXT NOT NULL,
+    constant TEXT NOT NULL,
+    max_digits INTEGER NOT NULL,
+    total_digits_correct INTEGER NOT NULL,
+    total_practice_sessions INTEGER NOT NULL,
+    last_session_date TEXT,
+    fastest_time REAL,
+    best_speed REAL,
+    rollups TEXT,
+    PRIMARY KEY (profile, constant)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS totals_by_best ON totals (constant, max_digits DESC);
+"""
+
+# Columns shared by the statistics dictionary and the SQLite tables
+_STATS_TOTAL_COLUMNS = (
+    "max_digits",
+    "total_digits_correct",
+    "total_practice_sessions",
+    "last_session_date",
+    "fastest_time",
+    "best_speed",
+    "rollups",
+)
+_STATS_SESSION_COLUMNS = (
+    "uid",
+    "date",
+    "mode",
+    "max_level",
+    "correct_digits",
+    "duration_seconds",
+)
+
+
+def _stats_db_file() -> Path:
+    """Return the SQLite statistics store, shared by every constant."""
+    return PRACTICE_STATS_FILE.with_suffix(".db")
+
+
+def _profile_store() -> Path:
+    """Return the SQLite store to write a named profile's data to.
+
+    Only called before a write: the first time any profile saves something,
+    the store is created and the OS user's own JSON statistics are imported
+    as the default profile so that they stay visible.  Reads never create
+    the store; the profile is registered by the write itself (see
+    :func:`_register_profile`).
     """
-    percent = min(100, int(current / total * 100))
-    filled = int(width * current / total)
-    bar = "█" * filled + "░" * (width - filled)
-    sys.stdout.write(f"\r[{bar}] {percent}%")
-    sys.stdout.flush()
+    db_file = _stats_db_file()
+    if not db_file.exists():
+        if not PRACTICE_CONFIG_DIR.exists():
+            PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(FileExistsError):
+            migrate_practice_stats()
+    return db_file
+
+
+def _register_profile(conn: sqlite3.Connection, profile: str) -> None:
+    """Add *profile* to the store's profiles (in the caller's transaction)."""
+    conn.execute(
+        "INSERT OR IGNORE INTO profiles (name, created) VALUES (?, ?)",
+        (profile, time.strftime("%Y-%m-%d %H:%M:%S")),
+    )
 
 
-def chunk_based_practice(
-    pi_digits: str,
-    chunk_size: int,
-    current_digits: int,
-    *,
-    colorblind_mode: bool = False,
-) -> tuple[bool, int]:
-    """Implement chunk-based practice strategy.
+def _load_profile_data(profile: str, key: str) -> object | None:
+    """Return a JSON value stored for a profile, or None if there is none."""
+    db_file = _stats_db_file()
+    if not db_file.exists():
+        return None
+    with contextlib.closing(_connect_stats_db(db_file, create=False)) as conn:
+        row = conn.execute(
+            "SELECT value FROM profile_data WHERE profile = ? AND key = ?",
+            (profile, key),
+        ).fetchone()
+    return None if row is None else json.loads(row[0])
+
+
+def _save_profile_data(profile: str, key: str, value: object) -> None:
+    """Store a JSON value for a profile, replacing any previous one."""
+    db_file = _profile_store()
+    with contextlib.closing(_connect_stats_db(db_file)) as conn, conn:
+        _register_profile(conn, profile)
+        conn.execute(
+            "INSERT OR REPLACE INTO profile_data (profile, key, value) "
+            "VALUES (?, ?, ?)",
+            (profile, key, json.dumps(value)),
+        )
 
-    Args:
-        pi_digits: String containing the digits of pi
-        chunk_size: Number of digits per chunk
-        current_digits: Current level (total digits to practice)
-        colorblind_mode: Whether to use colorblind-friendly colors
 
-    Returns:
-        Tuple of (all_correct, correct_digits_count)
+def _merge_profile_data(profile: str, key: str, changes: dict[str, object]) -> None:
+    """Merge *changes* into a JSON object stored for a profile.
+
+    The stored object is re-read inside the write transaction, so keys
+    saved meanwhile by another process are kept.
     """
-    all_correct = True
-    correct_digits = 0
+    db_file = _profile_store()
+    with contextlib.closing(_connect_stats_db(db_file)) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _register_profile(conn, profile)
+        row = conn.execute(
+            "SELECT value FROM profile_data WHERE profile = ? AND key = ?",
+            (profile, key),
+        ).fetchone()
+        current = {} if row is None else json.loads(row[0])
+        if not isinstance(current, dict):
+            current = {}
+        conn.execute(
+            "INSERT OR REPLACE INTO profile_data (profile, key, value) "
+            "VALUES (?, ?, ?)",
+            (profile, key, json.dumps({**current, **changes})),
+        )
 
-    # Split into chunks
-    digits_after_decimal = pi_digits[2 : current_digits + 2]  # Skip "3."
-    chunks = [
-        digits_after_decimal[i : i + chunk_size]
-        for i in range(0, len(digits_after_decimal), chunk_size)
-    ]
 
-    # Print the first 2 characters (3.)
-    sys.stdout.write("3.")
+def _connect_stats_db(db_file: Path, *, create: bool = True) -> sqlite3.Connection:
+    """Open the SQLite statistics store.
+
+    Args:
+        db_file: The store.
+        create: Whether to create the schema if needed; readers pass False,
+            since an existing store always has it.
+    """
+    conn = sqlite3.connect(db_file)
+    if create:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_STATS_SCHEMA)
+    return conn
+
+
+def _sqlite_read_totals(
+    conn: sqlite3.Connection,
+    constant: str,
+    profile: str,
+) -> dict[str, object]:
+    """Read a profile's aggregate statistics for a constant."""
+    stats = _default_practice_stats()
+    row = conn.execute(
+        f"SELECT {', '.join(_STATS_TOTAL_COLUMNS)} FROM totals "  # noqa: S608
+        "WHERE profile = ? AND constant = ?",
+        (profile, constant),
+    ).fetchone()
+    if row is not None:
+        stats.update(zip(_STATS_TOTAL_COLUMNS, row, strict=True))
+        if stats["rollups"] is None:
+            del stats["rollups"]
+        else:
+            stats["rollups"] = json.loads(stats["rollups"])
+    return stats
+
+
+def _sqlite_load_stats(
+    db_file: Path,
+    constant: str,
+    profile: str,
+) -> dict[str, object]:
+    """Load a profile's totals and recent sessions for a constant."""
+    with contextlib.closing(_connect_stats_db(db_file, create=False)) as conn:
+        stats = _sqlite_read_totals(conn, constant, profile)
+        rows = conn.execute(
+            f"SELECT {', '.join(_STATS_SESSION_COLUMNS)} FROM sessions "  # noqa: S608
+            "WHERE profile = ? AND constant = ? ORDER BY id DESC LIMIT ?",
+            (profile, constant, STATS_RECENT_HISTORY),
+        ).fetchall()
+    stats["history"] = [
+        dict(zip(_STATS_SESSION_COLUMNS, row, strict=True)) for row in reversed(rows)
+    ]
+    return stats
+
+
+def _sqlite_save_totals(
+    conn: sqlite3.Connection,
+    stats: dict[str, object],
+    constant: str,
+    profile: str,
+) -> None:
+    """Write a profile's aggregate statistics (in the caller's transaction)."""
+    conn.execute(
+        "INSERT OR REPLACE INTO totals "  # noqa: S608
+        f"(profile, constant, {', '.join(_STATS_TOTAL_COLUMNS)}) "
+        f"VALUES (?, ?{', ?' * len(_STATS_TOTAL_COLUMNS)})",
+        (
+            profile,
+            constant,
+            *(stats.get(column) for column in _STATS_TOTAL_COLUMNS[:-1]),
+            json.dumps(stats["rollups"]) if "rollups" in stats else None,
+        ),
+    )
+
+
+def _level_results(
+    session_id: int,
+    levels: list[dict[str, object]],
+) -> Iterator[tuple[int, int, int, int]]:
+    """Yield one ``results`` row per digit typed in each level.
+
+    Levels stop at the first mistake, so a level with ``correct`` digits
+    right covers positions ``start + 1`` onwards, followed by the missed one.
+    """
+    for number, level in enumerate(levels):
+        first = level["start"] + 1
+        for position in range(first, first + level["correct"]):
+            yield session_id, number, position, 1
+        if level["correct"] < level["length"]:
+            yield session_id, number, first + level["correct"], 0
+
+
+def _sqlite_insert_session(
+    conn: sqlite3.Connection,
+    event: dict[str, object],
+    levels: list[dict[str, object]],
+    constant: str,
+    profile: str,
+) -> None:
+    """Insert a session with its levels and per-position results."""
+    record = event["session"]
+    cursor = conn.execute(
+        "INSERT INTO sessions (profile, constant, uid, date, mode, max_level, "
+        "correct_digits, duration_seconds, elapsed_time, best_speed) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            profile,
+            constant,
+            record.get("uid"),
+            record["date"],
+            record.get("mode", DEFAULT_PRACTICE_MODE),
+            record["max_level"],
+            record["correct_digits"],
+            record["duration_seconds"],
+            event.get("elapsed_time"),
+            event.get("best_speed"),
+        ),
+    )
+    session_id = cursor.lastrowid
+    conn.executemany(
+        "INSERT INTO levels (session_id, number, start, length, correct, elapsed) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                session_id,
+                number,
+                level["start"],
+                level["length"],
+                level["correct"],
+                level.get("elapsed"),
+            )
+            for number, level in enumerate(levels)
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO results (session_id, level, position, correct) "
+        "VALUES (?, ?, ?, ?)",
+        _level_results(session_id, levels),
+    )
+
+
+def _sqlite_record_session(
+    db_file: Path,
+    event: dict[str, object],
+    levels: list[dict[str, object]],
+    constant: str,
+    profile: str,
+) -> None:
+    """Store a finished session and the updated totals in one transaction.
+
+    The totals are re-read and updated inside a write transaction, so
+    sessions stored concurrently by other terminals are not overwritten.
+    """
+    with contextlib.closing(_connect_stats_db(db_file)) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _register_profile(conn, profile)
+        totals = _sqlite_read_totals(conn, constant, profile)
+        _apply_practice_event(totals, event)
+        _sqlite_insert_session(conn, event, levels, constant, profile)
+        _sqlite_save_totals(conn, totals, constant, profile)
+
+
+def migrate_practice_stats() -> int:
+    """Import every constant's JSON statistics into a new SQLite store.
+
+    Totals are copied as they are; sessions come from the event log plus any
+    older sessions only the snapshot still remembers.  They become the
+    default profile's, and from then on :func:`load_practice_stats` and
+    :func:`save_practice_stats` use the SQLite store.  The JSON files are
+    left in place as a backup.
+
+    Returns:
+        The number of sessions imported.
+
+    Raises:
+        FileExistsError: If the SQLite store already exists.
+    """
+    db_file = _stats_db_file()
+    with _file_lock(db_file):
+        if db_file.exists():
+            raise FileExistsError(db_file)
+        return _import_json_stats(db_file)
+
+
+def _import_json_stats(db_file: Path) -> int:
+    """Create the SQLite store from the JSON statistics (hold the lock)."""
+    imported = {}
+    for constant in MATHEMATICAL_CONSTANTS:
+        stats_file = _constant_file(PRACTICE_STATS_FILE, constant)
+        if not stats_file.exists() and not _stats_log_file(stats_file).exists():
+            continue
+        stats = load_practice_stats(constant)
+        sessions = load_practice_history(constant)
+        stats.setdefault("rollups", _build_rollups(sessions))
+        imported[constant] = (stats, sessions)
+
+    try:
+        with contextlib.closing(_connect_stats_db(db_file)) as conn, conn:
+            conn.execute(
+                "INSERT INTO profiles (name, created) VALUES (?, ?)",
+                (DEFAULT_PROFILE, time.strftime("%Y-%m-%d %H:%M:%S")),
+            )
+            for constant, (stats, sessions) in imported.items():
+                for record in sessions:
+                    _sqlite_insert_session(
+                        conn, {"session": record}, [], constant, DEFAULT_PROFILE
+                    )
+                _sqlite_save_totals(conn, stats, constant, DEFAULT_PROFILE)
+    except sqlite3.Error:
+        db_file.unlink(missing_ok=True)
+        raise
+    return sum(len(sessions) for _, sessions in imported.values())
+
+
+def query_practice_sessions(
+    constant: str = "pi",
+    *,
+    mode: str | None = None,
+    since: str | None = None,
+    profile: str | None = None,
+) -> list[dict[str, object]]:
+    """Return a constant's logged sessions, oldest first.
+
+    Uses the SQLite store's indexes when it exists and scans the event log
+    otherwise.
+
+    Args:
+        constant: Constant whose sessions to return.
+        mode: Only return sessions of this practice mode.
+        since: Only return sessions on or after this date (``YYYY-MM-DD``).
+        profile: Profile whose sessions to return (the OS user's own if None).
+    """
+    db_file = _stats_db_file()
+    if not db_file.exists():
+        return [
+            record
+            for record in load_practice_history(constant, profile)
+            if (mode is None or record.get("mode") == mode)
+            and (since is None or record["date"] >= since)
+        ]
+
+    clauses = ["profile = ?", "constant = ?"]
+    params: list[object] = [profile or DEFAULT_PROFILE, constant]
+    if mode is not None:
+        clauses.append("mode = ?")
+        params.append(mode)
+    if since is not None:
+        clauses.append("date >= ?")
+        params.append(since)
+    with contextlib.closing(_connect_stats_db(db_file, create=False)) as conn:
+        rows = conn.execute(
+            f"SELECT {', '.join(_STATS_SESSION_COLUMNS)} FROM sessions "  # noqa: S608
+            f"WHERE {' AND '.join(clauses)} ORDER BY date, id",
+            params,
+        ).fetchall()
+    return [dict(zip(_STATS_SESSION_COLUMNS, row, strict=True)) for row in rows]
+
+
+def profile_leaderboard(constant: str = "pi") -> list[dict[str, object]]:
+    """Return every profile's best results for a constant, best first.
+
+    Args:
+        constant: Constant to compare.
+
+    Returns:
+        One entry per profile with ``profile``, ``max_digits``,
+        ``total_practice_sessions`` and ``best_speed``.
+    """
+    db_file = _stats_db_file()
+    if not db_file.exists():
+        return []
+    with contextlib.closing(_connect_stats_db(db_file, create=False)) as conn:
+        rows = conn.execute(
+            "SELECT profiles.name, COALESCE(totals.max_digits, 0), "
+            "COALESCE(totals.total_practice_sessions, 0), totals.best_speed "
+            "FROM profiles LEFT JOIN totals "
+            "ON totals.profile = profiles.name AND totals.constant = ? "
+            "ORDER BY 2 DESC, totals.best_speed DESC, profiles.name",
+            (constant,),
+        ).fetchall()
+    columns = ("profile", "max_digits", "total_practice_sessions", "best_speed")
+    return [dict(zip(columns, row, strict=True)) for row in rows]
+
+
+# ---------------------------------------------------------------------------
+# Practice history export and import - streaming CSV or NDJSON records
+# ---------------------------------------------------------------------------
+
+
+def export_practice_sessions(
+    stream: TextIO,
+    fmt: str = "ndjson",
+    *,
+    constants: Iterable[str] | None = None,
+    profile: str | None = None,
+) -> int:
+    """Write every recorded session to *stream*, one record at a time.
+
+    Args:
+        stream: Where to write the records.
+        fmt: Record format, one of ``STATS_EXPORT_FORMATS``.
+        constants: Constants to export (all of them by default).
+        profile: Profile to export (the OS user's own sessions if None).
+
+    Returns:
+        The number of sessions written.
+    """
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, STATS_EXPORT_FIELDS, lineterminator="\n")
+        writer.writeheader()
+
+    count = 0
+    for constant in constants or MATHEMATICAL_CONSTANTS:
+        for record in iter_practice_sessions(constant, profile):
+            row = {
+                "constant": constant,
+                **record,
+                "mode": record.get("mode", DEFAULT_PRACTICE_MODE),
+                "uid": record.get("uid"),
+            }
+            row = {field_name: row[field_name] for field_name in STATS_EXPORT_FIELDS}
+            if writer is None:
+                stream.write(json.dumps(row) + "\n")
+            else:
+                writer.writerow(row)
+            count += 1
+    return count
+
+
+def _session_from_row(row: dict[str, object]) -> tuple[str, dict[str, object]]:
+    """Validate an imported record.
+
+    Args:
+        row: A CSV row or NDJSON object with ``STATS_EXPORT_FIELDS``.
+
+    Returns:
+        The constant and the session record.
+
+    Raises:
+        ValueError: If a field is missing or invalid.
+    """
+    constant = row.get("constant") or "pi"
+    mode = row.get("mode") or DEFAULT_PRACTICE_MODE
+    if constant not in MATHEMATICAL_CONSTANTS or mode not in PRACTICE_MODES:
+        msg = f"unknown constant or mode in {row!r}"
+        raise ValueError(msg)
+    date = str(row.get("date"))
+    time.strptime(date, "%Y-%m-%d %H:%M:%S")
+    record = {"date": date, "mode": mode}
+    for field_name in ("max_level", "correct_digits", "duration_seconds"):
+        value = int(row.get(field_name))
+        if value < 0:
+            msg = f"negative {field_name} in {row!r}"
+            raise ValueError(msg)
+        record[field_name] = value
+    if uid := row.get("uid"):
+        record["uid"] = str(uid)
+    return constant, record
+
+
+def _read_session_rows(
+    stream: TextIO,
+    fmt: str,
+) -> Iterator[tuple[str, dict[str, object]] | None]:
+    """Yield the sessions in a CSV or NDJSON stream, None for invalid ones."""
+    rows = csv.DictReader(stream) if fmt == "csv" else stream
+    for row in rows:
+        if not row or (isinstance(row, str) and not row.strip()):
+            continue
+        try:
+            yield _session_from_row(row if fmt == "csv" else json.loads(row))
+        except (ValueError, TypeError, AttributeError):
+            yield None
+
+
+def import_practice_sessions(
+    stream: TextIO,
+    fmt: str = "ndjson",
+    *,
+    profile: str | None = None,
+) -> tuple[int, int, int]:
+    """Merge sessions from a CSV or NDJSON stream into the statistics.
+
+    Records are read one at a time.  A session already recorded for its
+    constant (the same ``uid``, or the same contents for records without
+    one) is skipped, so importing the same file twice is harmless.
+
+    Args:
+        stream: Where to read the records from.
+        fmt: Record format, one of ``STATS_EXPORT_FORMATS``.
+        profile: Profile to import into (the OS user's own files if None).
+
+    Returns:
+        Tuple of (imported, duplicates, invalid) record counts.
+    """
+    rows = _read_session_rows(stream, fmt)
+    if profile is not None or _stats_db_file().exists():
+        db_file = _stats_db_file() if profile is None else _profile_store()
+        return _sqlite_import_sessions(db_file, rows, profile or DEFAULT_PROFILE)
+    return _json_import_sessions(rows)
+
+
+def _json_import_sessions(
+    rows: Iterable[tuple[str, dict[str, object]] | None],
+) -> tuple[int, int, int]:
+    """Append imported sessions to the logs, then write each snapshot once."""
+    if not PRACTICE_CONFIG_DIR.exists():
+        PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+    counts = {"imported": 0, "duplicates": 0, "invalid": 0}
+    targets: dict[str, tuple[dict[str, object], set[str], BinaryIO]] = {}
+    with contextlib.ExitStack() as stack:
+        # Lock every constant up front, in a fixed order, so that concurrent
+        # imports cannot deadlock
+        for constant in sorted(MATHEMATICAL_CONSTANTS):
+            stack.enter_context(
+                _file_lock(_constant_file(PRACTICE_STATS_FILE, constant))
+            )
+
+        for row in rows:
+            if row is None:
+                counts["invalid"] += 1
+                continue
+            constant, record = row
+            if constant not in targets:
+                stats_file = _constant_file(PRACTICE_STATS_FILE, constant)
+                targets[constant] = (
+                    _load_json_stats(stats_file),
+                    {_session_key(s) for s in iter_practice_sessions(constant)},
+                    stack.enter_context(_open_stats_log(stats_file)),
+                )
+            stats, seen, log = targets[constant]
+            key = _session_key(record)
+            if key in seen:
+                counts["duplicates"] += 1
+                continue
+            seen.add(key)
+            event = {"session": record, "elapsed_time": None, "best_speed": None}
+            _apply_practice_event(stats, event)
+            log.write(json.dumps(event, separators=(",", ":")).encode() + b"\n")
+            counts["imported"] += 1
+
+        for constant, (stats, _, log) in targets.items():
+            log.flush()
+            os.fsync(log.fileno())
+            _write_stats_snapshot(_constant_file(PRACTICE_STATS_FILE, constant), stats)
+    return counts["imported"], counts["duplicates"], counts["invalid"]
+
+
+def _sqlite_import_sessions(
+    db_file: Path,
+    rows: Iterable[tuple[str, dict[str, object]] | None],
+    profile: str,
+) -> tuple[int, int, int]:
+    """Insert imported sessions and update the totals in one transaction."""
+    counts = {"imported": 0, "duplicates": 0, "invalid": 0}
+    totals: dict[str, dict[str, object]] = {}
+    with contextlib.closing(_connect_stats_db(db_file)) as conn, conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _register_profile(conn, profile)
+        for row in rows:
+            if row is None:
+                counts["invalid"] += 1
+                continue
+            constant, record = row
+            same_second = conn.execute(
+                f"SELECT {', '.join(_STATS_SESSION_COLUMNS)} FROM sessions "  # noqa: S608
+                "WHERE profile = ? AND constant = ? AND date = ?",
+                (profile, constant, record["date"]),
+            )
+            key = _session_key(record)
+            if any(
+                _session_key(dict(zip(_STATS_SESSION_COLUMNS, other, strict=True)))
+                == key
+                for other in same_second
+            ):
+                counts["duplicates"] += 1
+                continue
+            if constant not in totals:
+                totals[constant] = _sqlite_read_totals(conn, constant, profile)
+            event = {"session": record}
+            _apply_practice_event(totals[constant], event)
+            _sqlite_insert_session(conn, event, [], constant, profile)
+            counts["imported"] += 1
+
+        for constant, stats in totals.items():
+            _sqlite_save_totals(conn, stats, constant, profile)
+    return counts["imported"], counts["duplicates"], counts["invalid"]
+
+
+# Parsed config files, with the (mtime, size, inode) they were read at
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int, int], dict[str, object]]] = {}
+
+
+def _is_count(value: object, minimum: int = 0) -> bool:
+    """Return whether *value* is an integer (not a bool) of at least *minimum*."""
+    return isinstance(value, int) and not isinstance(value, bool) and value >= minimum
+
+
+# Checks for each practice setting read from a config file
+_PRACTICE_SETTING_CHECKS = {
+    "mode": lambda value: value in PRACTICE_MODES,
+    "min_digits": lambda value: _is_count(value, 1),
+    "max_digits": lambda value: _is_count(value, 1),
+    "chunk_size": lambda value: (
+        _is_count(value) and MIN_CHUNK_SIZE <= value <= MAX_CHUNK_SIZE
+    ),
+    "time_limit": lambda value: _is_count(value, 1),
+    "show_timer": lambda value: isinstance(value, bool),
+    "visual_aid": lambda value: isinstance(value, bool),
+    "from_position": _is_count,
+    "window": lambda value: value is None or _is_count(value, 1),
+}
+
+
+def _validate_practice_settings(raw: object) -> dict[str, object]:
+    """Return the valid practice settings in a parsed config file.
+
+    Unknown settings are dropped and invalid ones fall back to their
+    defaults, so a hand-edited file cannot break practice mode.
+    """
+    settings = _get_default_config()
+    if isinstance(raw, dict):
+        settings.update(
+            (key, value)
+            for key, value in raw.items()
+            if key in _PRACTICE_SETTING_CHECKS and _PRACTICE_SETTING_CHECKS[key](value)
+        )
+    return settings
+
+
+def _load_config_file() -> dict[str, object]:
+    """Load the practice config file, or the defaults if there is none.
+
+    The parsed settings are cached until the file's modification time, size
+    or inode changes, so repeated loads cost a single ``stat``.  Nothing is
+    written: the file is only created when settings are saved.
+    """
+    try:
+        st = PRACTICE_CONFIG_FILE.stat()
+    except OSError:
+        return _get_default_config()
+
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _CONFIG_CACHE.get(PRACTICE_CONFIG_FILE)
+    if cached is None or cached[0] != signature:
+        try:
+            with PRACTICE_CONFIG_FILE.open("r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            # Use the defaults if there's an error
+            raw = None
+        cached = (signature, _validate_practice_settings(raw))
+        _CONFIG_CACHE[PRACTICE_CONFIG_FILE] = cached
+    return dict(cached[1])
+
+
+def load_practice_config(profile: str | None = None) -> dict[str, object]:
+    """Load practice configuration.
+
+    Args:
+        profile: Profile whose settings to apply on top of the config file
+            (the OS user's own settings if None).
+    """
+    config = _load_config_file()
+    if profile is None:
+        return config
+    profile_config = _load_profile_data(profile, "config")
+    return _validate_practice_settings({**config, **(profile_config or {})})
+
+
+def save_practice_config(
+    config: dict[str, object],
+    profile: str | None = None,
+    *,
+    base: dict[str, object] | None = None,
+    replace: bool = False,
+) -> None:
+    """Save practice configuration to file.
+
+    Only the settings that differ from *base*, the settings *config* was
+    edited from, are saved.  They are merged into the settings as stored
+    now, re-read under the lock, so settings changed meanwhile by another
+    pigame process are kept.
+
+    Args:
+        config: Settings to save.
+        profile: Profile to save them for (the config file if None).
+        base: Settings as loaded before editing (every setting in *config*
+            is saved if None).
+        replace: Whether *config* replaces the stored settings outright,
+            dropping any it does not hold (*base* is then ignored).
+    """
+    if replace:
+        if profile is not None:
+            _save_profile_data(profile, "config", config)
+            return
+        PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        with _file_lock(PRACTICE_CONFIG_FILE):
+            _write_json_atomic(PRACTICE_CONFIG_FILE, config)
+        return
+
+    changes = {
+        key: value
+        for key, value in config.items()
+        if base is None or key not in base or base[key] != value
+    }
+    if not changes:
+        return
+    if profile is not None:
+        _merge_profile_data(profile, "config", changes)
+        return
+
+    # Create the directory on first save
+    PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Save config
+    with _file_lock(PRACTICE_CONFIG_FILE):
+        current = {}
+        with contextlib.suppress(OSError, json.JSONDecodeError):
+            current = json.loads(PRACTICE_CONFIG_FILE.read_text(encoding="utf-8"))
+        if not isinstance(current, dict):
+            current = {}
+        _write_json_atomic(PRACTICE_CONFIG_FILE, {**current, **changes})
+
+
+# Module-level constants for configuration constraints
+MIN_CHUNK_SIZE = 2
+MAX_CHUNK_SIZE = 10
+MIN_TIME_LIMIT = 30
+MAX_TIME_LIMIT = 600
+
+
+def _display_config_menu(config: dict[str, object]) -> None:
+    """Display the configuration menu with current settings.
+
+    Args:
+        config: The configuration dictionary to display.
+    """
+    print("\nCurrent settings:")
+    print(f"1. Practice mode: {config.get('mode', DEFAULT_PRACTICE_MODE)}")
+    print(f"2. Minimum digits: {config.get('min_digits', PRACTICE_MIN_DIGITS)}")
+    print(f"3. Maximum digits: {config.get('max_digits', PRACTICE_MAX_DIGITS)}")
+    print(f"4. Chunk size: {config.get('chunk_size', DEFAULT_CHUNK_SIZE)}")
+    time_limit_str = (
+        f"5. Time limit: {config.get('time_limit', DEFAULT_TIME_LIMIT)} seconds"
+    )
+    print(time_limit_str)
+    print(f"6. Show timer: {'Yes' if config.get('show_timer', True) else 'No'}")
+    print(f"7. Visual aid: {'Yes' if config.get('visual_aid', True) else 'No'}")
+    print("8. Save and exit")
+    print("9. Reset to defaults")
+    print("\n")
+
+
+def _get_default_config() -> dict[str, object]:
+    """Get the default practice configuration.
+
+    Returns:
+        Dictionary with default configuration values.
+    """
+    return {
+        "mode": DEFAULT_PRACTICE_MODE,
+        "min_digits": PRACTICE_MIN_DIGITS,
+        "max_digits": PRACTICE_MAX_DIGITS,
+        "chunk_size": DEFAULT_CHUNK_SIZE,
+        "time_limit": DEFAULT_TIME_LIMIT,
+        "show_timer": True,
+        "visual_aid": True,
+    }
+
+
+def _handle_mode_selection(config: dict[str, object]) -> None:
+    """Handle practice mode selection.
+
+    Args:
+        config: The configuration dictionary to update.
+    """
+    print("\nSelect practice mode:")
+    print("1. Standard - Digit by digit practice")
+    print("2. Timed - Race against the clock")
+    print("3. Chunk - Practice in groups of digits")
+    print("4. Review - Spaced repetition of your weakest chunks\n")
+    mode_choice = input("Select mode (1-4): ").strip()
+
+    if mode_choice == "1":
+        config["mode"] = "standard"
+    elif mode_choice == "2":
+        config["mode"] = "timed"
+    elif mode_choice == "3":
+        config["mode"] = "chunk"
+    elif mode_choice == "4":
+        config["mode"] = "review"
+    else:
+        print("Invalid selection. No changes made.")
+
+
+def _handle_min_digits(config: dict[str, object]) -> None:
+    """Handle minimum digits configuration.
+
+    Args:
+        config: The configuration dictionary to update.
+    """
+    prompt = f"Enter minimum digits ({PRACTICE_MIN_DIGITS}-{PRACTICE_MAX_DIGITS}): "
+    min_digits_input = input(prompt).strip()
+    try:
+        min_digits = int(min_digits_input)
+        if PRACTICE_MIN_DIGITS <= min_digits <= PRACTICE_MAX_DIGITS:
+            config["min_digits"] = min_digits
+        else:
+            msg = (
+                f"Value must be between {PRACTICE_MIN_DIGITS} "
+                f"and {PRACTICE_MAX_DIGITS}."
+            )
+            print(msg)
+    except ValueError:
+        print("Invalid input. Please enter a number.")
+
+
+def _handle_max_digits(config: dict[str, object]) -> None:
+    """Handle maximum digits configuration.
+
+    Args:
+        config: The configuration dictionary to update.
+    """
+    prompt = f"Enter maximum digits ({PRACTICE_MIN_DIGITS}-{PRACTICE_MAX_DIGITS}): "
+    max_digits_input = input(prompt).strip()
+    try:
+        max_digits = int(max_digits_input)
+        if PRACTICE_MIN_DIGITS <= max_digits <= PRACTICE_MAX_DIGITS:
+            config["max_digits"] = max_digits
+        else:
+            msg = (
+                f"Value must be between {PRACTICE_MIN_DIGITS} "
+                f"and {PRACTICE_MAX_DIGITS}."
+            )
+            print(msg)
+    except ValueError:
+        print("Invalid input. Please enter a number.")
+
+
+def _handle_chunk_size(config: dict[str, object]) -> None:
+    """Handle chunk size configuration.
+
+    Args:
+        config: The configuration dictionary to update.
+    """
+    chunk_size_input = input("Enter chunk size (2-10): ").strip()
+    try:
+        chunk_size = int(chunk_size_input)
+        if MIN_CHUNK_SIZE <= chunk_size <= MAX_CHUNK_SIZE:
+            config["chunk_size"] = chunk_size
+        else:
+            msg = f"Value must be between {MIN_CHUNK_SIZE} and {MAX_CHUNK_SIZE}."
+            print(msg)
+    except ValueError:
+        print("Invalid input. Please enter a number.")
+
+
+def _handle_time_limit(config: dict[str, object]) -> None:
+    """Handle time limit configuration.
+
+    Args:
+        config: The configuration dictionary to update.
+    """
+    prompt = f"Enter time limit in seconds ({MIN_TIME_LIMIT}-{MAX_TIME_LIMIT}): "
+    time_limit_input = input(prompt).strip()
+    try:
+        time_limit = int(time_limit_input)
+        if MIN_TIME_LIMIT <= time_limit <= MAX_TIME_LIMIT:
+            config["time_limit"] = time_limit
+        else:
+            msg = f"Value must be between {MIN_TIME_LIMIT} and {MAX_TIME_LIMIT}."
+            print(msg)
+    except ValueError:
+        print("Invalid input. Please enter a number.")
+
+
+def _handle_show_timer(config: dict[str, object]) -> None:
+    """Handle show timer configuration.
+
+    Args:
+        config: The configuration dictionary to update.
+    """
+    show_timer = input("Show timer? (y/n): ").strip().lower()
+    if show_timer in ("y", "yes"):
+        config["show_timer"] = True
+    elif show_timer in ("n", "no"):
+        config["show_timer"] = False
+    else:
+        print("Invalid input. No changes made.")
+
+
+def _handle_visual_aid(config: dict[str, object]) -> None:
+    """Handle visual aid configuration.
+
+    Args:
+        config: The configuration dictionary to update.
+    """
+    visual_aid = input("Enable visual progress indicators? (y/n): ").strip().lower()
+    if visual_aid in ("y", "yes"):
+        config["visual_aid"] = True
+    elif visual_aid in ("n", "no"):
+        config["visual_aid"] = False
+    else:
+        print("Invalid input. No changes made.")
+
+
+def _validate_and_save_config(
+    config: dict[str, object],
+    profile: str | None = None,
+    *,
+    base: dict[str, object] | None = None,
+) -> bool:
+    """Validate and save the configuration.
+
+    Args:
+        config: The configuration dictionary to validate and save.
+        profile: Profile to save the configuration for.
+        base: The configuration as loaded; only settings changed since are
+            saved.
+
+    Returns:
+        True if saved successfully, False if validation failed.
+    """
+    if config.get("min_digits", 0) > config.get("max_digits", 0):
+        print(
+            "Error: Minimum digits cannot be greater than maximum digits.",
+        )
+        return False
+
+    save_practice_config(config, profile, base=base)
+    print("\nConfiguration saved successfully!")
+    return True
+
+
+def _handle_reset_to_defaults(
+    config: dict[str, object],
+    profile: str | None = None,
+) -> dict[str, object]:
+    """Handle resetting configuration to defaults.
+
+    Args:
+        config: The current configuration dictionary.
+        profile: Profile whose configuration to reset.
+
+    Returns:
+        The default configuration if confirmed, otherwise the original config.
+    """
+    confirm = (
+        input("Are you sure you want to reset to defaults? (y/n): ").strip().lower()
+    )
+    if confirm in ("y", "yes"):
+        default_config = _get_default_config()
+        # Replace, not merge, so settings without a default are cleared too
+        save_practice_config(default_config, profile, replace=True)
+        print("\nConfiguration reset to defaults.")
+        return default_config
+    print("Reset cancelled.")
+    return config
+
+
+def configure_practice_mode(profile: str | None = None) -> None:
+    """Interactive configuration for practice mode settings.
+
+    Args:
+        profile: Profile to configure (the OS user's own settings if None).
+    """
+    # Load current configuration; only the settings changed here are saved
+    config = load_practice_config(profile)
+    saved = dict(config)
+
+    print("\n🔧 PIGAME PRACTICE MODE CONFIGURATION 🔧")
+    print("======================================\n")
+
+    # Show initial menu
+    _display_config_menu(config)
+
+    # Menu option handlers
+    handlers = {
+        "1": _handle_mode_selection,
+        "2": _handle_min_digits,
+        "3": _handle_max_digits,
+        "4": _handle_chunk_size,
+        "5": _handle_time_limit,
+        "6": _handle_show_timer,
+        "7": _handle_visual_aid,
+    }
+
+    while True:
+        try:
+            choice = input("Select an option (1-9): ").strip()
+
+            # Handle save and exit
+            if choice == "8":
+                if _validate_and_save_config(config, profile, base=saved):
+                    break
+                continue
+
+            # Handle reset to defaults
+            if choice == "9":
+                reset = _handle_reset_to_defaults(config, profile)
+                if reset is not config:
+                    config, saved = reset, dict(reset)
+                _display_config_menu(config)
+                continue
+
+            # Handle configuration options
+            if choice in handlers:
+                handlers[choice](config)
+                _display_config_menu(config)
+            else:
+                print("Invalid selection. Please choose 1-9.")
+
+        except KeyboardInterrupt:
+            print("\n\nConfiguration cancelled. No changes saved.")
+            break
+
+
+def display_timer(start_time: float, time_limit: int | None = None) -> None:
+    """Display a timer in the top-right corner of the terminal.
+
+    Args:
+        start_time: The time when the timer started
+        time_limit: Optional time limit in seconds
+    """
+    timer_str = f"⏱️  {_timer_text(time.time() - start_time, time_limit)}"
+
+    # Position cursor at top-right, print timer, then return cursor
+    sys.stdout.write(f"\033[s\033[1;40H{timer_str}\033[u")
+    sys.stdout.flush()
+
+
+def _timer_text(elapsed: float, time_limit: int | None = None) -> str:
+    """Format elapsed (and remaining) time as ``MM:SS | Remaining: MM:SS``."""
+    mins, secs = divmod(int(elapsed), 60)
+    if not time_limit:
+        return f"{mins:02d}:{secs:02d}"
+    remaining = max(0, time_limit - elapsed)
+    r_mins, r_secs = divmod(int(remaining), 60)
+    return f"{mins:02d}:{secs:02d} | Remaining: {r_mins:02d}:{r_secs:02d}"
+
+
+def display_progress_bar(current: int, total: int, width: int = 30) -> None:
+    """Display a progress bar.
+
+    Args:
+        current: Current progress value
+        total: Total value for 100% completion
+        width: Width of the progress bar in characters
+    """
+    sys.stdout.write(f"\r{_progress_bar_text(current, total, width)}")
     sys.stdout.flush()
 
-    # Process each chunk
-    for chunk_index, chunk in enumerate(chunks):
-        # Print chunk separator
-        if chunk_index > 0:
-            sys.stdout.write(" | ")
 
-        # Process each digit in chunk
-        for correct_digit in chunk:
-            # Get input for this digit (non-blocking)
-            digit = input_digit()
+def _progress_bar_text(current: int, total: int, width: int = 30) -> str:
+    """Format a progress bar as ``[███░░░] 50%``."""
+    percent = min(100, int(current / total * 100))
+    filled = int(width * current / total)
+    bar = "█" * filled + "░" * (width - filled)
+    return f"[{bar}] {percent}%"
+
+
+# ---------------------------------------------------------------------------
+# Input sources - where practice keystrokes come from
+# ---------------------------------------------------------------------------
+
+
+class InputSource(abc.ABC):
+    """Source of keystrokes for the practice strategies.
+
+    Strategies ask the source for one digit at a time, passing the digit they
+    expect so that simulated sources can decide what to type.  Sources that
+    are not driven by a person (``interactive = False``) skip the pauses
+    between levels.
+    """
+
+    interactive = True
+
+    @abc.abstractmethod
+    def read_digit(self: InputSource, expected: str | None = None) -> str:
+        """Return the next digit typed.
+
+        Args:
+            expected: The correct digit at this position, if known.
+
+        Raises:
+            EOFError: When the source has no more keystrokes.
+        """
+
+    def begin_level(self: InputSource, offset: int, length: int) -> None:  # noqa: B027
+        """Called before each level with its offset and length."""
+
+    def restore(self: InputSource) -> None:  # noqa: B027
+        """Return the input device to normal mode before printing messages."""
+
+    def pause(self: InputSource, seconds: float) -> None:
+        """Pause between levels so a person can read the output."""
+        if self.interactive:
+            time.sleep(seconds)
+
+
+class TTYInputSource(InputSource):
+    """Read digits from the terminal in raw mode (the default)."""
+
+    def read_digit(self: TTYInputSource, expected: str | None = None) -> str:  # noqa: ARG002
+        """Return the next digit typed on the terminal."""
+        return input_digit()
+
+    def restore(self: TTYInputSource) -> None:
+        """Restore terminal settings for proper printing."""
+        termios.tcsetattr(
+            sys.stdin.fileno(),
+            termios.TCSADRAIN,
+            termios.tcgetattr(sys.stdin.fileno()),
+        )
+
+
+class ScriptedInputSource(InputSource):
+    """Replay a fixed sequence of keystrokes, optionally with their timing."""
+
+    interactive = False
+
+    def __init__(
+        self: ScriptedInputSource,
+        keys: str,
+        delays: list[float] | None = None,
+        *,
+        realtime: bool = False,
+    ) -> None:
+        """Create a scripted source.
+
+        Args:
+            keys: The keystrokes to replay; non-digits are ignored like on a
+                terminal.
+            delays: Seconds to wait before each keystroke (same length as
+                *keys*); only honoured when *realtime* is set.
+            realtime: Whether to sleep for the recorded delays.
+        """
+        self.keys = keys
+        self.delays = delays
+        self.realtime = realtime
+        self.position = 0
+
+    @classmethod
+    def from_file(
+        cls: type[ScriptedInputSource],
+        path: Path,
+        *,
+        realtime: bool = False,
+    ) -> ScriptedInputSource:
+        """Load a script file.
+
+        Each non-empty line holds ``KEYS [DELAY]``: the keys typed and the
+        seconds between them (default 0).  Text after ``#`` is a comment.
+
+        Args:
+            path: Script file to read.
+            realtime: Whether to sleep for the scripted delays.
+
+        Returns:
+            The scripted source.
+
+        Raises:
+            ValueError: If a line is malformed.
+        """
+        keys: list[str] = []
+        delays: list[float] = []
+        with path.open(encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                fields = line.split("#", 1)[0].split()
+                if not fields:
+                    continue
+                if len(fields) > 2:  # noqa: PLR2004 - KEYS and DELAY
+                    msg = f"{path}:{line_number}: expected 'KEYS [DELAY]'"
+                    raise ValueError(msg)
+                delay = float(fields[1]) if len(fields) == 2 else 0.0  # noqa: PLR2004
+                keys.extend(fields[0])
+                delays.extend([delay] * len(fields[0]))
+        return cls("".join(keys), delays, realtime=realtime)
+
+    def read_digit(self: ScriptedInputSource, expected: str | None = None) -> str:  # noqa: ARG002
+        """Return the next scripted digit."""
+        while self.position < len(self.keys):
+            char = self.keys[self.position]
+            if self.realtime and self.delays:
+                time.sleep(self.delays[self.position])
+            self.position += 1
+            if char.isdigit():
+                return char
+        raise EOFError
+
+
+class SyntheticTypist(InputSource):
+    """Simulated learner who types at a set speed with a set error rate."""
+
+    interactive = False
+
+    def __init__(
+        self: SyntheticTypist,
+        *,
+        digits_per_minute: float = 120.0,
+        error_rate: float = 0.0,
+        max_keystrokes: int | None = None,
+        seed: int | None = None,
+        realtime: bool = False,
+    ) -> None:
+        """Create a synthetic typist.
+
+        Args:
+            digits_per_minute: Typing speed (only used when *realtime* is set).
+            error_rate: Probability of typing a wrong digit, from 0 to 1.
+            max_keystrokes: Stop (raise ``EOFError``) after this many keys.
+            seed: Seed for reproducible mistakes.
+            realtime: Whether to sleep between keystrokes.
+        """
+        self.delay = 60.0 / digits_per_minute
+        self.error_rate = error_rate
+        self.max_keystrokes = max_keystrokes
+        self.realtime = realtime
+        self.keystrokes = 0
+        self._random = random.Random(seed)
+
+    def read_digit(self: SyntheticTypist, expected: str | None = None) -> str:
+        """Type the expected digit, or a wrong one with probability error_rate."""
+        if self.max_keystrokes is not None and self.keystrokes >= self.max_keystrokes:
+            raise EOFError
+        self.keystrokes += 1
+        if self.realtime:
+            time.sleep(self.delay)
+
+        if expected is None:
+            return str(self._random.randrange(10))
+        if self._random.random() < self.error_rate:
+            return str((int(expected) + self._random.randrange(1, 10)) % 10)
+        return expected
+
+
+class StreamInputSource(InputSource):
+    """Read digits from any file descriptor: a pipe, a socket or a file.
+
+    Bytes are read as they arrive, without termios, so the practice mode
+    runs where there is no terminal.  Anything that is not a digit (newlines,
+    spaces, ``3.``) is skipped, which makes keystroke streams and
+    line-buffered input work alike.  End of input, Ctrl-C or Ctrl-D ends the
+    session.
+    """
+
+    interactive = False
+
+    def __init__(
+        self: StreamInputSource, fd: int, *, interactive: bool = False
+    ) -> None:
+        """Initialize the source.
+
+        Args:
+            fd: File descriptor to read from.
+            interactive: Whether to pause between levels for a person.
+        """
+        self.fd = fd
+        self.interactive = interactive
+        self._buffer = b""
+        self._position = 0
+
+    def read_digit(self: StreamInputSource, expected: str | None = None) -> str:  # noqa: ARG002
+        """Return the next digit in the stream.
+
+        Raises:
+            EOFError: At the end of the stream or on Ctrl-C / Ctrl-D.
+        """
+        while True:
+            while self._position < len(self._buffer):
+                byte = self._buffer[self._position]
+                self._position += 1
+                if byte in STREAM_END_BYTES:
+                    raise EOFError
+                if ord("0") <= byte <= ord("9"):
+                    return chr(byte)
+            self._buffer = os.read(self.fd, STREAM_READ_SIZE)
+            self._position = 0
+            if not self._buffer:
+                raise EOFError
+
+
+# ---------------------------------------------------------------------------
+# Practice views - where practice output goes
+# ---------------------------------------------------------------------------
+
+
+class PracticeView(abc.ABC):
+    """Front end that displays a practice session.
+
+    Strategies report what happens (a level starts, a digit is typed, a
+    mistake is made) and the view decides how to draw it.  Messages between
+    levels go through :meth:`message` so that full-screen views can place
+    them too.
+    """
+
+    def __init__(self: PracticeView, *, colorblind_mode: bool = False) -> None:
+        """Initialize the view.
+
+        Args:
+            colorblind_mode: Whether to use colorblind-friendly colors.
+        """
+        self.colorblind_mode = colorblind_mode
+
+    def open(self: PracticeView) -> None:  # noqa: B027
+        """Take over the terminal before the session starts."""
+
+    def close(self: PracticeView) -> None:  # noqa: B027
+        """Give the terminal back after the session ends."""
+
+    def default_source(self: PracticeView) -> InputSource:
+        """Return the input source that belongs with this view."""
+        return TTYInputSource()
+
+    @abc.abstractmethod
+    def message(self: PracticeView, text: str) -> None:
+        """Show a line of text between or after levels."""
+
+    def begin_level(self: PracticeView, prefix: str) -> None:  # noqa: B027
+        """Start a new row of digits after *prefix* (``"3."`` and the like)."""
+
+    @abc.abstractmethod
+    def digit(self: PracticeView, digit: str, *, correct: bool) -> None:
+        """Show a typed digit, marked correct or wrong."""
+
+    def separator(self: PracticeView, text: str) -> None:  # noqa: B027
+        """Show spacing between groups of digits."""
+
+    def mistake(self: PracticeView, text: str) -> None:
+        """Show what should have been typed after a wrong digit."""
+        self.message(f" ✗ {text}")
+
+    def progress(self: PracticeView, current: int, total: int) -> None:  # noqa: B027
+        """Show how far through the level the user is."""
+
+    def clear_progress(self: PracticeView) -> None:  # noqa: B027
+        """Remove the progress indicator at the end of a level."""
+
+    def timer(self: PracticeView, start_time: float, time_limit: int | None) -> None:  # noqa: B027
+        """Show the time elapsed since *start_time* (and the time remaining)."""
+
+    def summary(self: PracticeView, fields: dict[str, object]) -> None:  # noqa: B027
+        """Report the session totals before the summary text is shown."""
+
+    def status(self: PracticeView, text: str) -> None:  # noqa: B027
+        """Show a one-line status (such as race standings) without moving on."""
+
+
+class AnsiView(PracticeView):
+    """Write practice output to stdout with ANSI colors (the default)."""
+
+    def message(self: AnsiView, text: str) -> None:
+        """Print *text* on its own line."""
+        print(text)
+
+    def begin_level(self: AnsiView, prefix: str) -> None:
+        """Write the level prefix."""
+        sys.stdout.write(prefix)
+        sys.stdout.flush()
+
+    def digit(self: AnsiView, digit: str, *, correct: bool) -> None:
+        """Write the digit in green (correct) or red/orange (wrong)."""
+        if correct:
+            color = "38;5;34" if self.colorblind_mode else "92"
+        else:
+            color = "38;5;208" if self.colorblind_mode else "91"
+        sys.stdout.write(f"\033[{color}m{digit}\033[0m")
+        sys.stdout.flush()
+
+    def separator(self: AnsiView, text: str) -> None:
+        """Write the separator."""
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def progress(self: AnsiView, current: int, total: int) -> None:
+        """Draw the progress bar on line 2, keeping the cursor in place."""
+        sys.stdout.write("\033[s\033[2;1H")  # Save cursor and move to line 2
+        display_progress_bar(current, total)
+        sys.stdout.write("\033[u")  # Restore cursor
+
+    def clear_progress(self: AnsiView) -> None:
+        """Clear line 2."""
+        sys.stdout.write("\033[2;1H\033[K")  # Move to line 2 and clear
+        sys.stdout.flush()
+
+    def timer(self: AnsiView, start_time: float, time_limit: int | None) -> None:
+        """Draw the timer in the top-right corner."""
+        display_timer(start_time, time_limit)
+
+    def status(self: AnsiView, text: str) -> None:
+        """Draw the status on line 1, keeping the cursor in place."""
+        sys.stdout.write(f"\033[s\033[1;1H\033[K{text}\033[u")
+        sys.stdout.flush()
+
+
+class PlainView(PracticeView):
+    """Write practice output as plain text, without colors or cursor moves.
+
+    Used where stdout is not a terminal (pipes, sockets, log files).  Wrong
+    digits are followed by the correction, so nothing relies on color.
+    """
+
+    def __init__(
+        self: PlainView,
+        *,
+        colorblind_mode: bool = False,
+        stream: TextIO | None = None,
+    ) -> None:
+        """Initialize the view.
+
+        Args:
+            colorblind_mode: Accepted for symmetry; plain text has no colors.
+            stream: Where to write (defaults to stdout at the time of writing).
+        """
+        super().__init__(colorblind_mode=colorblind_mode)
+        self._stream = stream
+
+    @property
+    def stream(self: PlainView) -> TextIO:
+        """The text stream output goes to."""
+        return self._stream if self._stream is not None else sys.stdout
+
+    def default_source(self: PlainView) -> InputSource:
+        """Read digits from stdin, whatever it is connected to."""
+        return StreamInputSource(sys.stdin.fileno())
+
+    def write(self: PlainView, text: str) -> None:
+        """Write *text* and flush it so readers see every keystroke."""
+        self.stream.write(text)
+        self.stream.flush()
+
+    def message(self: PlainView, text: str) -> None:
+        """Write *text* on its own line."""
+        self.write(f"{text}\n")
+
+    def begin_level(self: PlainView, prefix: str) -> None:
+        """Write the level prefix."""
+        self.write(prefix)
+
+    def digit(self: PlainView, digit: str, *, correct: bool) -> None:  # noqa: ARG002
+        """Write the digit."""
+        self.write(digit)
+
+    def separator(self: PlainView, text: str) -> None:
+        """Write the separator."""
+        self.write(text)
+
+
+class NdjsonView(PlainView):
+    """Write practice output as newline-delimited JSON events.
+
+    Every event is one JSON object with an ``event`` key: ``message``,
+    ``level``, ``digit``, ``mistake``, ``progress``, ``timer`` or
+    ``summary``.  Separators are left to the reader.
+    """
+
+    def emit(self: NdjsonView, event: str, **fields: object) -> None:
+        """Write one event line."""
+        self.write(json.dumps({"event": event, **fields}, ensure_ascii=False) + "\n")
+
+    def message(self: NdjsonView, text: str) -> None:
+        """Emit a ``message`` event (blank messages are dropped)."""
+        if text.strip():
+            self.emit("message", text=text.strip())
+
+    def begin_level(self: NdjsonView, prefix: str) -> None:
+        """Emit a ``level`` event."""
+        self.emit("level", prefix=prefix)
+
+    def digit(self: NdjsonView, digit: str, *, correct: bool) -> None:
+        """Emit a ``digit`` event."""
+        self.emit("digit", digit=digit, correct=correct)
+
+    def separator(self: NdjsonView, text: str) -> None:
+        """Separators are a presentation detail; nothing is emitted."""
+
+    def mistake(self: NdjsonView, text: str) -> None:
+        """Emit a ``mistake`` event."""
+        self.emit("mistake", text=text)
+
+    def progress(self: NdjsonView, current: int, total: int) -> None:
+        """Emit a ``progress`` event."""
+        self.emit("progress", current=current, total=total)
+
+    def timer(self: NdjsonView, start_time: float, time_limit: int | None) -> None:
+        """Emit a ``timer`` event."""
+        elapsed = round(time.time() - start_time, 3)
+        self.emit("timer", elapsed=elapsed, limit=time_limit)
+
+    def summary(self: NdjsonView, fields: dict[str, object]) -> None:
+        """Emit a ``summary`` event."""
+        self.emit("summary", **fields)
+
+    def status(self: NdjsonView, text: str) -> None:
+        """Emit a ``status`` event."""
+        self.emit("status", text=text)
+
+
+# ---------------------------------------------------------------------------
+# Full-screen practice UI - a damage-tracked screen model drawn with curses
+# ---------------------------------------------------------------------------
+
+
+def _cell_width(char: str) -> int:
+    """Return the number of terminal cells *char* occupies (0, 1 or 2)."""
+    if unicodedata.category(char) in {"Mn", "Me", "Cf"}:
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in {"W", "F"} else 1
+
+
+class ScreenModel:
+    """Grid of character cells that reports only the cells that changed.
+
+    Writes update the wanted contents of the grid and mark their rows dirty.
+    :meth:`damage` compares the dirty rows with what was last drawn and
+    returns runs of changed cells, so redrawing after a keystroke touches a
+    handful of cells however much is on the screen.  The model knows nothing
+    about curses, which keeps it testable without a terminal.
+    """
+
+    NORMAL = 0
+    CORRECT = 1
+    WRONG = 2
+    ACCENT = 3
+
+    def __init__(self: ScreenModel, rows: int, cols: int) -> None:
+        """Initialize a blank grid of *rows* by *cols* cells."""
+        self.resize(rows, cols)
+
+    def resize(self: ScreenModel, rows: int, cols: int) -> None:
+        """Blank the grid at a new size; the next damage covers every cell."""
+        self.rows = max(1, rows)
+        self.cols = max(1, cols)
+        blank = (" ", self.NORMAL)
+        self._cells = [[blank] * self.cols for _ in range(self.rows)]
+        self._drawn: list[list[tuple[str, int]] | None] = [None] * self.rows
+        self._dirty = set(range(self.rows))
+
+    def put(self: ScreenModel, row: int, col: int, text: str, attr: int = 0) -> int:
+        """Write *text* at (*row*, *col*), clipped to the row.
+
+        Returns:
+            The column after the last cell written.
+        """
+        if not 0 <= row < self.rows:
+            return col
+        cells = self._cells[row]
+        for char in text:
+            width = _cell_width(char)
+            if width == 0:
+                continue
+            if col + width > self.cols:
+                break
+            cells[col] = (char, attr)
+            if width == 2:  # noqa: PLR2004
+                cells[col + 1] = ("", attr)  # covered by the wide character
+            col += width
+        self._dirty.add(row)
+        return col
+
+    def fill(self: ScreenModel, row: int, col: int = 0) -> None:
+        """Blank *row* from *col* to the right edge."""
+        if 0 <= row < self.rows and col < self.cols:
+            self._cells[row][col:] = [(" ", self.NORMAL)] * (self.cols - col)
+            self._dirty.add(row)
+
+    def text(self: ScreenModel, row: int) -> str:
+        """Return the wanted contents of *row* as a string."""
+        return "".join(char for char, _ in self._cells[row])
+
+    def damage(self: ScreenModel) -> list[tuple[int, int, str, int]]:
+        """Return the changed cells and mark them as drawn.
+
+        Returns:
+            Runs of ``(row, col, text, attr)`` that bring the terminal up to
+            date, in screen order.
+        """
+        runs = []
+        for row in sorted(self._dirty):
+            cells = self._cells[row]
+            drawn = self._drawn[row]
+            col = 0
+            while col < self.cols:
+                if drawn is not None and cells[col] == drawn[col]:
+                    col += 1
+                    continue
+                start = col
+                if cells[start][0] == "" and start > 0:
+                    start -= 1  # redraw the wide character covering this cell
+                attr = cells[col][1]
+                while (
+                    col < self.cols
+                    and cells[col][1] == attr
+                    and (drawn is None or cells[col] != drawn[col])
+                ):
+                    col += 1
+                text = "".join(char for char, _ in cells[start:col])
+                runs.append((row, start, text, attr))
+            self._drawn[row] = list(cells)
+        self._dirty.clear()
+        return runs
+
+
+class PracticeScreen:
+    """Layout of the full-screen practice UI on top of a :class:`ScreenModel`.
+
+    Row 0 holds the title and timer, row 1 the progress bar and the last row
+    the latest message.  The rows in between show the digits of the current
+    level; once a level outgrows them the pane scrolls by whole rows, so the
+    pane is repainted once per row of digits rather than once per digit.
+    """
+
+    TITLE = "PIGAME PRACTICE"
+    PANE_TOP = 2
+
+    def __init__(self: PracticeScreen, rows: int, cols: int) -> None:
+        """Initialize an empty screen of *rows* by *cols* cells."""
+        self.model = ScreenModel(rows, cols)
+        self._pane: list[tuple[str, int]] = []
+        self._top = 0
+        self._timer = ""
+        self._progress = ""
+        self._status = ("", ScreenModel.NORMAL)
+        self._redraw()
+
+    @property
+    def pane_rows(self: PracticeScreen) -> int:
+        """Number of rows available for digits."""
+        return max(1, self.model.rows - self.PANE_TOP - 1)
+
+    @property
+    def pane_width(self: PracticeScreen) -> int:
+        """Cells per row of digits, a multiple of six so groups line up."""
+        group = 6  # five digits and a space
+        cols = self.model.cols
+        return cols - cols % group if cols >= group else cols
+
+    def resize(self: PracticeScreen, rows: int, cols: int) -> None:
+        """Lay the screen out again at a new terminal size."""
+        self.model.resize(rows, cols)
+        self._redraw()
+
+    def set_timer(self: PracticeScreen, text: str) -> None:
+        """Show *text* right-aligned on the title row."""
+        if text != self._timer:
+            self._timer = text
+            self._draw_title()
+
+    def set_progress(self: PracticeScreen, text: str) -> None:
+        """Show *text* on the progress row."""
+        if text != self._progress:
+            self._progress = text
+            self.model.fill(1)
+            self.model.put(1, 0, text)
+
+    def set_status(self: PracticeScreen, text: str, attr: int = 0) -> None:
+        """Show *text* on the status row."""
+        self._status = (text, attr)
+        row = self.model.rows - 1
+        self.model.fill(row)
+        self.model.put(row, 0, text, attr)
+
+    def begin_level(self: PracticeScreen, prefix: str) -> None:
+        """Clear the digit pane and start it with *prefix*."""
+        self._pane = [(char, ScreenModel.NORMAL) for char in prefix]
+        self._draw_pane()
+
+    def append(self: PracticeScreen, text: str, attr: int = 0) -> None:
+        """Add *text* to the digit pane, scrolling if it runs off the end."""
+        width = self.pane_width
+        for char in text:
+            row, col = divmod(len(self._pane), width)
+            self._pane.append((char, attr))
+            if row - self._top >= self.pane_rows:
+                self._draw_pane()
+            else:
+                self.model.put(self.PANE_TOP + row - self._top, col, char, attr)
+
+    def cursor(self: PracticeScreen) -> tuple[int, int]:
+        """Return the screen position just after the last cell in the pane."""
+        row, col = divmod(len(self._pane), self.pane_width)
+        row = min(row - self._top, self.pane_rows - 1)
+        return (
+            min(self.PANE_TOP + row, self.model.rows - 1),
+            min(col, self.model.cols - 1),
+        )
+
+    def _redraw(self: PracticeScreen) -> None:
+        self._draw_title()
+        self.model.fill(1)
+        self.model.put(1, 0, self._progress)
+        self.set_status(*self._status)
+        self._draw_pane()
+
+    def _draw_title(self: PracticeScreen) -> None:
+        self.model.fill(0)
+        self.model.put(0, 0, self.TITLE, ScreenModel.ACCENT)
+        if self._timer:
+            col = max(len(self.TITLE) + 1, self.model.cols - len(self._timer))
+            self.model.put(0, col, self._timer)
+
+    def _draw_pane(self: PracticeScreen) -> None:
+        width = self.pane_width
+        last_row = max(0, len(self._pane) - 1) // width
+        self._top = max(0, last_row - self.pane_rows + 1)
+        for row in range(self.pane_rows):
+            screen_row = self.PANE_TOP + row
+            if screen_row >= self.model.rows - 1:
+                break
+            self.model.fill(screen_row)
+            start = (self._top + row) * width
+            for col, (char, attr) in enumerate(self._pane[start : start + width]):
+                self.model.put(screen_row, col, char, attr)
+
+
+class CursesView(PracticeView):
+    """Full-screen practice front end drawn with curses.
+
+    Output goes into a :class:`PracticeScreen` and only the runs reported by
+    its damage are written to the terminal.  Terminal resizes (SIGWINCH,
+    which curses reports as ``KEY_RESIZE``) lay the screen out again.
+    """
+
+    def __init__(self: CursesView, *, colorblind_mode: bool = False) -> None:
+        """Initialize the view; the terminal is taken over by :meth:`open`."""
+        super().__init__(colorblind_mode=colorblind_mode)
+        self.screen: PracticeScreen | None = None
+        self._window: curses.window | None = None
+        self._attrs: dict[int, int] = {}
+        self._timer_start: tuple[float, int | None] | None = None
+        self._last_message = ""
+
+    def open(self: CursesView) -> None:
+        """Switch the terminal to full-screen mode."""
+        self._window = curses.initscr()
+        curses.noecho()
+        curses.cbreak()
+        self._window.keypad(True)  # noqa: FBT003
+        self._window.timeout(CURSES_TICK_MS)
+        if curses.has_colors():
+            self._init_colors()
+        rows, cols = self._window.getmaxyx()
+        self.screen = PracticeScreen(rows, cols)
+        self.screen.set_status("Type the digits. Ctrl-C quits.")
+        self.refresh()
+
+    def close(self: CursesView) -> None:
+        """Restore the terminal and repeat the last message on it."""
+        if self._window is None:
+            return
+        self._window.keypad(False)  # noqa: FBT003
+        curses.nocbreak()
+        curses.echo()
+        curses.endwin()
+        self._window = None
+        if self._last_message:
+            print(self._last_message)
+
+    def default_source(self: CursesView) -> InputSource:
+        """Return a source that reads keys through this view."""
+        return CursesInputSource(self)
+
+    def refresh(self: CursesView) -> None:
+        """Write the screen's damaged cells to the terminal."""
+        if self._window is None or self.screen is None:
+            return
+        for row, col, text, attr in self.screen.model.damage():
+            # Writing the bottom-right cell moves the cursor off the screen
+            with contextlib.suppress(curses.error):
+                self._window.addstr(row, col, text, self._attrs.get(attr, 0))
+        with contextlib.suppress(curses.error):
+            self._window.move(*self.screen.cursor())
+        self._window.refresh()
+
+    def read_key(self: CursesView) -> int:
+        """Return the next key code, or -1 if none arrived within a tick."""
+        return self._window.getch()
+
+    def tick(self: CursesView) -> None:
+        """Advance the timer while waiting for a key."""
+        if self._timer_start is not None:
+            self.timer(*self._timer_start)
+
+    def handle_resize(self: CursesView) -> None:
+        """Lay the screen out again after the terminal was resized."""
+        rows, cols = self._window.getmaxyx()
+        self.screen.resize(rows, cols)
+        self._window.clear()
+        self.refresh()
+
+    def message(self: CursesView, text: str) -> None:
+        """Show the last line of *text* on the status row.
+
+        Before :meth:`open` and after :meth:`close` the text is printed.
+        """
+        if self._window is None:
+            print(text)
+            return
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if lines:
+            self._last_message = lines[-1]
+            self.screen.set_status(self._last_message)
+            self.refresh()
+
+    def begin_level(self: CursesView, prefix: str) -> None:
+        """Clear the digit pane for a new level."""
+        self._timer_start = None
+        self.screen.begin_level(prefix)
+        self.refresh()
+
+    def digit(self: CursesView, digit: str, *, correct: bool) -> None:
+        """Add the digit to the pane in the correct or wrong color."""
+        attr = ScreenModel.CORRECT if correct else ScreenModel.WRONG
+        self.screen.append(digit, attr)
+        self.refresh()
+
+    def separator(self: CursesView, text: str) -> None:
+        """Add spacing to the pane."""
+        self.screen.append(text)
+
+    def mistake(self: CursesView, text: str) -> None:
+        """Show the correction after the digits, where it stays until the next level."""
+        self.screen.append(f" ✗ {text}", ScreenModel.WRONG)
+        self.refresh()
+
+    def progress(self: CursesView, current: int, total: int) -> None:
+        """Show the progress bar."""
+        self.screen.set_progress(_progress_bar_text(current, total))
+        self.refresh()
+
+    def status(self: CursesView, text: str) -> None:
+        """Show the status on the status row."""
+        self.screen.set_status(text, ScreenModel.ACCENT)
+        self.refresh()
+
+    def clear_progress(self: CursesView) -> None:
+        """Remove the progress bar."""
+        self.screen.set_progress("")
+        self.refresh()
+
+    def timer(self: CursesView, start_time: float, time_limit: int | None) -> None:
+        """Show the timer; it keeps ticking while a key is awaited."""
+        self._timer_start = (start_time, time_limit)
+        self.screen.set_timer(_timer_text(time.time() - start_time, time_limit))
+        self.refresh()
+
+    def _init_colors(self: CursesView) -> None:
+        curses.start_color()
+        with contextlib.suppress(curses.error):
+            curses.use_default_colors()
+        if self.colorblind_mode:
+            wide = curses.COLORS >= 256  # noqa: PLR2004
+            correct = 34 if wide else curses.COLOR_BLUE
+            wrong = 208 if wide else curses.COLOR_YELLOW
+        else:
+            correct, wrong = curses.COLOR_GREEN, curses.COLOR_RED
+        curses.init_pair(1, correct, -1)
+        curses.init_pair(2, wrong, -1)
+        curses.init_pair(3, curses.COLOR_CYAN, -1)
+        self._attrs = {
+            ScreenModel.CORRECT: curses.color_pair(1),
+            ScreenModel.WRONG: curses.color_pair(2) | curses.A_BOLD,
+            ScreenModel.ACCENT: curses.color_pair(3) | curses.A_BOLD,
+        }
+
+
+class CursesInputSource(InputSource):
+    """Read digits through a :class:`CursesView`, keeping its timer ticking."""
+
+    def __init__(self: CursesInputSource, view: CursesView) -> None:
+        """Initialize the source.
+
+        Args:
+            view: The open view whose window receives the keys.
+        """
+        self.view = view
+
+    def read_digit(self: CursesInputSource, expected: str | None = None) -> str:  # noqa: ARG002
+        """Return the next digit typed, ignoring other keys."""
+        while True:
+            key = self.view.read_key()
+            if key == -1:
+                self.view.tick()
+            elif key == curses.KEY_RESIZE:
+                self.view.handle_resize()
+            elif ord("0") <= key <= ord("9"):
+                return chr(key)
+
+
+# Practice front ends selectable with --ui
+PRACTICE_VIEWS: dict[str, type[PracticeView]] = {
+    "ansi": AnsiView,
+    "curses": CursesView,
+    "plain": PlainView,
+    "ndjson": NdjsonView,
+}
+
+
+# ---------------------------------------------------------------------------
+# Session recordings - compact keystroke logs for auditing and replay
+# ---------------------------------------------------------------------------
+# File layout: the magic bytes, a varint-prefixed UTF-8 JSON header, then a
+# stream of varint-encoded events.  An odd event value is a keystroke:
+#   bit 0 = 1, bit 1 = correct, bits 2-5 = digit, bits 6+ = microseconds since
+#   the previous event.
+# An even event value starts a level: bits 1+ = offset, followed by a second
+# varint holding the level length.
+# ---------------------------------------------------------------------------
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """Append *value* to *out* as an unsigned LEB128 varint.
+
+    Args:
+        value: Non-negative integer to encode.
+        out: Buffer to append to.
+    """
+    while value > 0x7F:  # noqa: PLR2004 - 7 payload bits per byte
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data: bytes, position: int) -> tuple[int, int]:
+    """Decode an unsigned LEB128 varint.
+
+    Args:
+        data: Buffer to read from.
+        position: Index of the first byte of the varint.
+
+    Returns:
+        Tuple of (value, position after the varint).
+
+    Raises:
+        ValueError: If the buffer ends in the middle of the varint.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            msg = "Truncated session recording"
+            raise ValueError(msg)
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position
+        shift += 7
+
+
+class SessionRecorder:
+    """Record every practice keystroke to a compact per-session file.
+
+    Keystrokes are encoded into an in-memory buffer, which is appended to the
+    file when a level starts and when the recorder is closed, so recording
+    never adds a system call to a keystroke.
+    """
+
+    def __init__(self: SessionRecorder, path: Path, header: dict[str, object]) -> None:
+        """Create the recording file and write its header.
+
+        Existing recordings are never truncated: if *path* exists (say, a
+        session started in the same second), ``name-2.pgr``, ``name-3.pgr``
+        and so on are tried, and :attr:`path` is the file created.
+
+        Args:
+            path: File to record to (its directory is created if needed).
+            header: Session metadata, e.g. constant and practice mode.
+        """
+        self._buffer = bytearray(SESSION_RECORDING_MAGIC)
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        encode_varint(len(header_bytes), self._buffer)
+        self._buffer += header_bytes
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path, number = path, 1
+        while True:
+            try:
+                with self.path.open("xb"):
+                    break
+            except FileExistsError:
+                number += 1
+                self.path = path.with_name(f"{path.stem}-{number}{path.suffix}")
+        self._last = time.perf_counter_ns()
+
+    def keystroke(self: SessionRecorder, digit: str, *, correct: bool) -> None:
+        """Record one keystroke."""
+        now = time.perf_counter_ns()
+        delta_us = (now - self._last) // 1000
+        self._last = now
+        encode_varint(
+            (delta_us << 6) | (int(digit) << 2) | (int(correct) << 1) | 1,
+            self._buffer,
+        )
+
+    def begin_level(self: SessionRecorder, offset: int, length: int) -> None:
+        """Record the start of a level and flush the previous one."""
+        encode_varint(offset << 1, self._buffer)
+        encode_varint(length, self._buffer)
+        self.flush()
+
+    def flush(self: SessionRecorder) -> None:
+        """Append buffered events to the recording file."""
+        if self._buffer:
+            with self.path.open("ab") as f:
+                f.write(self._buffer)
+            self._buffer.clear()
+
+    def close(self: SessionRecorder) -> None:
+        """Flush the remaining events."""
+        self.flush()
+
+
+def read_session_recording(
+    path: Path,
+) -> tuple[dict[str, object], list[tuple[object, ...]]]:
+    """Decode a session recording.
+
+    Args:
+        path: Recording file written by :class:`SessionRecorder`.
+
+    Returns:
+        Tuple of (header, events).  Events are ``("level", offset, length)``
+        or ``("key", digit, correct, delta_seconds)``.
+
+    Raises:
+        ValueError: If the file is not a valid recording.
+        UnknownConstantError: If the header names an unknown constant (a
+            ``ValueError``).
+    """
+    data = path.read_bytes()
+    if not data.startswith(SESSION_RECORDING_MAGIC):
+        msg = f"{path} is not a pigame session recording"
+        raise ValueError(msg)
+
+    header_length, position = decode_varint(data, len(SESSION_RECORDING_MAGIC))
+    header = json.loads(data[position : position + header_length])
+    position += header_length
+    if not isinstance(header, dict):
+        msg = f"{path} has a malformed recording header"
+        raise ValueError(msg)  # noqa: TRY004
+    constant = header.setdefault("constant", "pi")
+    if not isinstance(constant, str) or constant not in MATHEMATICAL_CONSTANTS:
+        raise UnknownConstantError(str(constant))
+
+    events: list[tuple[object, ...]] = []
+    while position < len(data):
+        value, position = decode_varint(data, position)
+        if value & 1:
+            events.append(
+                ("key", str((value >> 2) & 0xF), bool(value & 2), (value >> 6) / 1e6),
+            )
+        else:
+            length, position = decode_varint(data, position)
+            events.append(("level", value >> 1, length))
+    return header, events
+
+
+class RecordingInputSource(InputSource):
+    """Wrap another input source and record its keystrokes."""
+
+    def __init__(
+        self: RecordingInputSource,
+        inner: InputSource,
+        recorder: SessionRecorder,
+    ) -> None:
+        """Create a recording wrapper.
+
+        Args:
+            inner: The source that provides the keystrokes.
+            recorder: Where keystrokes are recorded.
+        """
+        self.inner = inner
+        self.recorder = recorder
+        self.interactive = inner.interactive
+
+    def read_digit(self: RecordingInputSource, expected: str | None = None) -> str:
+        """Read a digit from the wrapped source and record it."""
+        digit = self.inner.read_digit(expected)
+        self.recorder.keystroke(digit, correct=digit == expected)
+        return digit
+
+    def begin_level(self: RecordingInputSource, offset: int, length: int) -> None:
+        """Record the start of a level."""
+        self.recorder.begin_level(offset, length)
+        self.inner.begin_level(offset, length)
+
+    def restore(self: RecordingInputSource) -> None:
+        """Restore the wrapped source."""
+        self.inner.restore()
+
+    def pause(self: RecordingInputSource, seconds: float) -> None:
+        """Pause like the wrapped source."""
+        self.inner.pause(seconds)
+
+
+def replay_session(
+    path: Path,
+    *,
+    speed: float = 1.0,
+    score_only: bool = False,
+    colorblind_mode: bool = False,
+) -> dict[str, object]:
+    """Re-render or re-score a recorded session.
+
+    Correctness is re-derived from the verified digits rather than trusted
+    from the recording, so edited recordings show up as mismatches.
+
+    Args:
+        path: Recording file to replay.
+        speed: Playback speed multiplier (1 to ``MAX_REPLAY_SPEED``).
+        score_only: Only re-score the session, without rendering it.
+        colorblind_mode: Whether to use colorblind-friendly colors.
+
+    Returns:
+        Summary dict with keystroke, correct-digit, level and mismatch counts
+        and the recorded typing time in seconds.
+    """
+    header, events = read_session_recording(path)
+    speed = min(max(speed, 1.0), MAX_REPLAY_SPEED)
+    constant = header["constant"]
+    digits = _CONSTANT_DIGIT_STRINGS[constant]
+    correct_color, wrong_color = (
+        ("\033[38;5;34m", "\033[38;5;208m")
+        if colorblind_mode
+        else ("\033[92m", "\033[91m")
+    )
+
+    summary = {"keystrokes": 0, "correct": 0, "levels": 0, "mismatches": 0}
+    typing_time = 0.0
+    position = 0
+    for event in events:
+        if event[0] == "level":
+            _, position, length = event
+            summary["levels"] += 1
+            if not score_only:
+                print(f"\n--- Level: {length} digits ---")
+                sys.stdout.write(_level_prefix(position, _digit_buffer(constant)))
+            continue
+
+        _, digit, recorded_correct, delta = event
+        correct = position < len(digits) and digit == digits[position]
+        position += 1
+        typing_time += delta
+        summary["keystrokes"] += 1
+        summary["correct"] += correct
+        summary["mismatches"] += correct != recorded_correct
+        if not score_only:
+            time.sleep(delta / speed)
+            color = correct_color if correct else wrong_color
+            sys.stdout.write(f"{color}{digit}\033[0m")
+            sys.stdout.flush()
+
+    summary["typing_seconds"] = round(typing_time, 3)
+    return summary
+
+
+def _level_prefix(offset: int, digits: str = "3.") -> str:
+    """Return the text printed before the first digit of a level.
+
+    Args:
+        offset: Number of decimals skipped before the level starts.
+        digits: The constant's digits, starting with its integer part.
+
+    Returns:
+        The integer part and point (``"3."``) for levels starting at the
+        decimal point, otherwise a marker with the (1-based) position of the
+        first digit.
+    """
+    return digits[:2] if offset == 0 else f"[{offset + 1}] "
+
+
+def chunk_based_practice(  # noqa: PLR0913
+    pi_digits: str,
+    chunk_size: int,
+    current_digits: int,
+    *,
+    colorblind_mode: bool = False,
+    offset: int = 0,
+    source: InputSource | None = None,
+    view: PracticeView | None = None,
+) -> tuple[bool, int]:
+    """Implement chunk-based practice strategy.
+
+    Args:
+        pi_digits: String containing the digits of pi
+        chunk_size: Number of digits per chunk
+        current_digits: Current level (total digits to practice)
+        colorblind_mode: Whether to use colorblind-friendly colors
+        offset: Number of decimals to skip before the level starts
+        source: Where keystrokes come from (defaults to the terminal)
+        view: Where output goes (defaults to ANSI text on stdout)
+
+    Returns:
+        Tuple of (all_correct, correct_digits_count)
+    """
+    if source is None:
+        source = TTYInputSource()
+    if view is None:
+        view = AnsiView(colorblind_mode=colorblind_mode)
+    all_correct = True
+    correct_digits = 0
+
+    # Split into chunks
+    digits_after_decimal = pi_digits[offset + 2 : offset + current_digits + 2]
+    chunks = [
+        digits_after_decimal[i : i + chunk_size]
+        for i in range(0, len(digits_after_decimal), chunk_size)
+    ]
+
+    # Print "3." (or the start position when practising from an offset)
+    view.begin_level(_level_prefix(offset, pi_digits))
+
+    # Process each chunk
+    for chunk_index, chunk in enumerate(chunks):
+        # Print chunk separator
+        if chunk_index > 0:
+            view.separator(" | ")
+
+        # Process each digit in chunk
+        for correct_digit in chunk:
+            # Get input for this digit (non-blocking)
+            digit = source.read_digit(correct_digit)
+            _PRACTICE_KEYSTROKES.inc()
+
+            # Show the digit in green if correct, red/orange otherwise
+            view.digit(digit, correct=digit == correct_digit)
+            if digit == correct_digit:
+                correct_digits += 1
+            else:
+                source.restore()
+
+                # Show the correct digit
+                view.mistake(f"Correct: {correct_digit}")
+                all_correct = False
+                return all_correct, correct_digits
+
+    return all_correct, correct_digits
+
+
+def timed_practice(  # noqa: PLR0913
+    pi_digits: str,
+    current_digits: int,
+    time_limit: int,
+    *,
+    colorblind_mode: bool = False,
+    show_timer: bool = True,
+    offset: int = 0,
+    source: InputSource | None = None,
+    view: PracticeView | None = None,
+) -> tuple[bool, int, float]:
+    """Implement timed practice strategy.
+
+    Args:
+        pi_digits: String containing the digits of pi
+        current_digits: Current level (total digits to practice)
+        time_limit: Time limit in seconds
+        colorblind_mode: Whether to use colorblind-friendly colors
+        show_timer: Whether to show the timer
+        offset: Number of decimals to skip before the level starts
+        source: Where keystrokes come from (defaults to the terminal)
+        view: Where output goes (defaults to ANSI text on stdout)
+
+    Returns:
+        Tuple of (all_correct, correct_digits_count, elapsed_time)
+    """
+    if source is None:
+        source = TTYInputSource()
+    if view is None:
+        view = AnsiView(colorblind_mode=colorblind_mode)
+    all_correct = True
+    correct_digits = 0
+    start_time = time.time()
+
+    # Print "3." (or the start position when practising from an offset)
+    view.begin_level(_level_prefix(offset, pi_digits))
+
+    # Process each digit of the level
+    level_digits = pi_digits[offset + 2 : offset + current_digits + 2]
+    for i, correct_digit in enumerate(level_digits):
+        # Update timer if showing
+        if show_timer and i % 3 == 0:  # Update every few digits to avoid flicker
+            view.timer(start_time, time_limit)
+
+            # Check if time's up
+            if time.time() - start_time > time_limit:
+                source.restore()
+                view.message("\n\n⏰ Time's up!")
+                return False, correct_digits, time.time() - start_time
+
+        # Get input for this digit (non-blocking)
+        digit = source.read_digit(correct_digit)
+        _PRACTICE_KEYSTROKES.inc()
+
+        # Show the digit in green if correct, red/orange otherwise
+        view.digit(digit, correct=digit == correct_digit)
+        if digit == correct_digit:
+            correct_digits += 1
+        else:
+            source.restore()
+
+            # Show the correct digit
+            view.mistake(f"Correct: {correct_digit}")
+            all_correct = False
+            return all_correct, correct_digits, time.time() - start_time
+
+        # Add spacing for readability
+        if (i + 1) % 5 == 0:
+            view.separator(" ")
+
+    # Calculate total time
+    elapsed_time = time.time() - start_time
+
+    return all_correct, correct_digits, elapsed_time
+
+
+@dataclass
+class PracticeConfig:
+    """Configuration for practice mode.
+
+    Attributes:
+        colorblind_mode: Whether to use colorblind-friendly colors.
+        mode: Practice mode (standard, timed, chunk, review).
+        min_digits: Minimum number of digits to start with.
+        max_digits: Maximum number of digits to practice.
+        chunk_size: Size of chunks for chunk and review modes.
+        time_limit: Time limit in seconds for timed mode.
+        show_timer: Whether to show the timer.
+        visual_aid: Whether to show visual progress indicators.
+        from_position: Number of decimals to skip before each level starts.
+        window: Maximum number of digits per level after ``from_position``
+            (``None`` for no limit besides ``max_digits``).
+        calibrate: Whether to find the starting level adaptively.
+        constant: Constant to practise, a key of ``MATHEMATICAL_CONSTANTS``.
+        profile: Profile whose statistics and settings to use (the OS user's
+            own if None).
+    """
+
+    colorblind_mode: bool = False
+    mode: str = DEFAULT_PRACTICE_MODE
+    min_digits: int = PRACTICE_MIN_DIGITS
+    max_digits: int = PRACTICE_MAX_DIGITS
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    time_limit: int = DEFAULT_TIME_LIMIT
+    show_timer: bool = True
+    visual_aid: bool = True
+    from_position: int = 0
+    window: int | None = None
+    calibrate: bool = False
+    constant: str = "pi"
+    profile: str | None = None
+
+
+# ---------------------------------------------------------------------------
+# Spaced repetition - SM-2 scheduling over chunks of the digit sequence
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ChunkState:
+    """Review state of one chunk of digits.
+
+    Attributes:
+        index: Zero-based chunk index (chunk *i* covers decimals
+            ``i * chunk_size`` up to ``(i + 1) * chunk_size``).
+        easiness: SM-2 easiness factor (never below ``SM2_MIN_EASINESS``).
+        interval: Current review interval in days.
+        repetitions: Number of consecutive successful reviews.
+        due: Unix timestamp at which the chunk is next due for review.
+        lapses: Number of times the chunk has been forgotten.
+    """
+
+    index: int
+    easiness: float = SM2_DEFAULT_EASINESS
+    interval: int = 0
+    repetitions: int = 0
+    due: float = 0.0
+    lapses: int = 0
+
+
+def sm2_update(state: ChunkState, quality: int, now: float) -> ChunkState:
+    """Apply one SM-2 review to a chunk state.
+
+    Args:
+        state: The chunk state to update (modified in place).
+        quality: Recall quality from 0 (blackout) to 5 (perfect).
+        now: Current Unix timestamp.
+
+    Returns:
+        The updated chunk state.
+    """
+    if quality >= SM2_PASS_QUALITY:
+        if state.repetitions == 0:
+            state.interval = 1
+        elif state.repetitions == 1:
+            state.interval = 6
+        else:
+            state.interval = round(state.interval * state.easiness)
+        state.repetitions += 1
+    else:
+        if state.repetitions > 0:
+            state.lapses += 1
+        state.repetitions = 0
+        state.interval = 1
+
+    penalty = 5 - quality
+    state.easiness = max(
+        SM2_MIN_EASINESS,
+        state.easiness + 0.1 - penalty * (0.08 + penalty * 0.02),
+    )
+    state.due = now + state.interval * SECONDS_PER_DAY
+    return state
+
+
+def grade_chunk_recall(correct: int, chunk_length: int, elapsed: float) -> int:
+    """Convert the result of typing one chunk into an SM-2 quality grade.
+
+    Args:
+        correct: Number of digits typed correctly before the first mistake.
+        chunk_length: Number of digits in the chunk.
+        elapsed: Seconds taken to type the chunk.
+
+    Returns:
+        Quality grade from 0 to 5.
+    """
+    if correct < chunk_length:
+        return 1 if correct > 0 else 0
+    per_digit = elapsed / chunk_length if chunk_length else 0.0
+    if per_digit <= REVIEW_FAST_SECONDS_PER_DIGIT:
+        return 5
+    if per_digit <= REVIEW_SLOW_SECONDS_PER_DIGIT:
+        return 4
+    return 3
+
+
+class ChunkReviewStore:
+    """Chunk review states indexed by chunk number.
+
+    States live in a dict keyed by chunk index, so looking up or updating a
+    chunk is O(1); picking the next chunks to review only looks at due chunks
+    and uses a heap instead of sorting the whole store.
+    """
+
+    def __init__(self: ChunkReviewStore, chunk_size: int) -> None:
+        """Create an empty store.
+
+        Args:
+            chunk_size: Number of digits per chunk.
+        """
+        self.chunk_size = chunk_size
+        self.chunks: dict[int, ChunkState] = {}
+
+    def __len__(self: ChunkReviewStore) -> int:
+        """Return the number of chunks that have been introduced."""
+        return len(self.chunks)
+
+    def get(self: ChunkReviewStore, index: int) -> ChunkState:
+        """Return the state for *index*, creating a new one if needed."""
+        state = self.chunks.get(index)
+        if state is None:
+            state = ChunkState(index=index)
+            self.chunks[index] = state
+        return state
+
+    def session_queue(
+        self: ChunkReviewStore,
+        now: float,
+        limit: int,
+        max_chunks: int,
+    ) -> list[int]:
+        """Pick the chunks to review in this session.
+
+        Due chunks come first, most overdue (then hardest) first.  Remaining
+        slots are filled with chunks that have not been introduced yet.
+
+        Args:
+            now: Current Unix timestamp.
+            limit: Maximum number of chunks to return.
+            max_chunks: Number of chunks the learner may practise at all.
+
+        Returns:
+            Chunk indices in review order.
+        """
+        due = [
+            (state.due, state.easiness, state.index)
+            for state in self.chunks.values()
+            if state.due <= now and state.index < max_chunks
+        ]
+        queue = [index for _, _, index in heapq.nsmallest(limit, due)]
+
+        next_new = max(self.chunks, default=-1) + 1
+        while len(queue) < limit and next_new < max_chunks:
+            queue.append(next_new)
+            next_new += 1
+        return queue
+
+    def to_dict(self: ChunkReviewStore) -> dict[str, object]:
+        """Serialise the store to a JSON-compatible dict."""
+        return {
+            "chunk_size": self.chunk_size,
+            "chunks": {
+                str(index): {
+                    "easiness": state.easiness,
+                    "interval": state.interval,
+                    "repetitions": state.repetitions,
+                    "due": state.due,
+                    "lapses": state.lapses,
+                }
+                for index, state in self.chunks.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(
+        cls: type[ChunkReviewStore],
+        data: dict[str, object],
+        chunk_size: int,
+    ) -> ChunkReviewStore:
+        """Build a store from serialised data.
+
+        States recorded with a different chunk size cover different digits,
+        so they are discarded and the store starts fresh.
+
+        Args:
+            data: Dict as produced by :meth:`to_dict`.
+            chunk_size: Chunk size the caller wants to practise with.
+
+        Returns:
+            The loaded store.
+        """
+        store = cls(chunk_size)
+        if data.get("chunk_size") != chunk_size:
+            return store
+        for key, fields in data.get("chunks", {}).items():
+            index = int(key)
+            store.chunks[index] = ChunkState(index=index, **fields)
+        return store
+
+
+def load_review_store(
+    chunk_size: int,
+    constant: str = "pi",
+    profile: str | None = None,
+) -> ChunkReviewStore:
+    """Load spaced-repetition state from file.
+
+    Args:
+        chunk_size: Chunk size to practise with.
+        constant: Constant whose chunks are reviewed.
+        profile: Profile whose schedule to load (the OS user's own if None).
+
+    Returns:
+        The stored review state, or an empty store if none exists.
+    """
+    if profile is not None:
+        data = _load_profile_data(profile, f"review:{constant}")
+        if data is None:
+            return ChunkReviewStore(chunk_size)
+        try:
+            return ChunkReviewStore.from_dict(data, chunk_size)
+        except (TypeError, ValueError):
+            return ChunkReviewStore(chunk_size)
+
+    try:
+        review_file = _constant_file(PRACTICE_REVIEW_FILE, constant)
+        with review_file.open("r", encoding="utf-8") as f:
+            return ChunkReviewStore.from_dict(json.load(f), chunk_size)
+    except (json.JSONDecodeError, OSError, TypeError, ValueError):
+        return ChunkReviewStore(chunk_size)
+
+
+def save_review_store(
+    store: ChunkReviewStore,
+    constant: str = "pi",
+    profile: str | None = None,
+) -> None:
+    """Save spaced-repetition state to file."""
+    if profile is not None:
+        _save_profile_data(profile, f"review:{constant}", store.to_dict())
+        return
+
+    if not PRACTICE_CONFIG_DIR.exists():
+        PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+    review_file = _constant_file(PRACTICE_REVIEW_FILE, constant)
+    with _file_lock(review_file):
+        _write_json_atomic(review_file, store.to_dict())
+
+
+def review_practice(
+    pi_digits: str,
+    chunk_index: int,
+    chunk_size: int,
+    *,
+    colorblind_mode: bool = False,
+    source: InputSource | None = None,
+    view: PracticeView | None = None,
+) -> tuple[int, float]:
+    """Review a single chunk, cued by the chunk that precedes it.
+
+    Args:
+        pi_digits: String containing the digits of pi
+        chunk_index: Index of the chunk to review
+        chunk_size: Number of digits per chunk
+        colorblind_mode: Whether to use colorblind-friendly colors
+        source: Where keystrokes come from (defaults to the terminal)
+        view: Where output goes (defaults to ANSI text on stdout)
+
+    Returns:
+        Tuple of (correct_digits_count, elapsed_time)
+    """
+    if source is None:
+        source = TTYInputSource()
+    if view is None:
+        view = AnsiView(colorblind_mode=colorblind_mode)
+    start = chunk_index * chunk_size
+    chunk = pi_digits[start + 2 : start + chunk_size + 2]
+
+    # Show the preceding chunk (or "3.") as a cue
+    cue = pi_digits[max(0, start - chunk_size) + 2 : start + 2] if start else ""
+    view.begin_level(f"…{cue} " if cue else pi_digits[:2])
+
+    correct_digits = 0
+    start_time = time.time()
+    for correct_digit in chunk:
+        digit = source.read_digit(correct_digit)
+        _PRACTICE_KEYSTROKES.inc()
+        view.digit(digit, correct=digit == correct_digit)
+
+        if digit == correct_digit:
+            correct_digits += 1
+            continue
+
+        source.restore()
+        view.mistake(f"Correct chunk: {chunk}")
+        break
+
+    return correct_digits, time.time() - start_time
+
+
+def _run_review_session(
+    cfg: PracticeConfig,
+    stats: dict[str, object],
+    source: InputSource,
+    view: PracticeView,
+    *,
+    save_stats: bool = True,
+) -> PracticeSession | None:
+    """Run a spaced-repetition session over due and new chunks.
+
+    Args:
+        cfg: Practice configuration.
+        stats: Practice statistics dictionary.
+        source: Where keystrokes come from.
+        view: Where output goes.
+        save_stats: Whether to save the updated review schedule.
+
+    Returns:
+        The session totals, or None if nothing was due.
+    """
+    store = load_review_store(cfg.chunk_size, cfg.constant, cfg.profile)
+    pi_digits = _digit_buffer(cfg.constant)
+    available = len(pi_digits) - 2
+    max_chunks = min(cfg.max_digits, available) // cfg.chunk_size
+    queue = store.session_queue(time.time(), REVIEW_SESSION_CHUNKS, max_chunks)
+    if not queue:
+        view.message("Nothing is due for review. Come back later!")
+        return None
+
+    # Reviewing chunks does not prove the whole prefix, so the best level stays
+    session = PracticeSession(
+        start_time=time.time(),
+        max_level=stats.get("max_digits", 0),
+    )
+    try:
+        for position, index in enumerate(queue, start=1):
+            first = index * cfg.chunk_size + 1
+            last = first + cfg.chunk_size - 1
+            view.message(
+                f"\n--- Review {position}/{len(queue)}: digits {first}-{last} ---",
+            )
+            source.begin_level(index * cfg.chunk_size, cfg.chunk_size)
+            correct, elapsed = review_practice(
+                pi_digits,
+                index,
+                cfg.chunk_size,
+                colorblind_mode=cfg.colorblind_mode,
+                source=source,
+                view=view,
+            )
+            session.correct_digits += correct
+            session.record_level(
+                index * cfg.chunk_size, cfg.chunk_size, correct, elapsed
+            )
+
+            quality = grade_chunk_recall(correct, cfg.chunk_size, elapsed)
+            state = sm2_update(store.get(index), quality, time.time())
+            view.message(f"\nNext review in {state.interval} day(s).")
+    except (KeyboardInterrupt, EOFError):
+        source.restore()
+        view.message("\n\nReview session ended.")
+
+    if save_stats:
+        save_review_store(store, cfg.constant, cfg.profile)
+
+    return session
+
+
+def _load_practice_config_settings(  # noqa: PLR0913
+    *,
+    colorblind_mode: bool,
+    mode: str | None,
+    min_digits: int | None,
+    max_digits: int | None,
+    chunk_size: int | None,
+    time_limit: int | None,
+    visual_aid: bool | None,
+    from_position: int | None = None,
+    window: int | None = None,
+    calibrate: bool = False,
+    constant: str = "pi",
+    profile: str | None = None,
+) -> PracticeConfig:
+    """Load practice configuration from parameters and config file.
+
+    Args:
+        colorblind_mode: Whether to use colorblind-friendly colors.
+        mode: Practice mode (standard, timed, chunk, review).
+        min_digits: Minimum number of digits to start with.
+        max_digits: Maximum number of digits to practice.
+        chunk_size: Size of chunks for chunk mode.
+        time_limit: Time limit in seconds for timed mode.
+        visual_aid: Whether to show visual progress indicators.
+        from_position: Number of decimals to skip before each level starts.
+        window: Maximum number of digits per level.
+        calibrate: Whether to find the starting level adaptively.
+        constant: Constant to practise.
+        profile: Profile whose settings to use.
+
+    Returns:
+        PracticeConfig object with merged settings.
+    """
+    settings = load_practice_config(profile)
+    overrides = {
+        "mode": mode,
+        "min_digits": min_digits,
+        "max_digits": max_digits,
+        "chunk_size": chunk_size,
+        "time_limit": time_limit,
+        "visual_aid": visual_aid,
+        "from_position": from_position,
+        "window": window,
+    }
+    settings.update(
+        (key, value) for key, value in overrides.items() if value is not None
+    )
+
+    return PracticeConfig(
+        colorblind_mode=colorblind_mode,
+        calibrate=calibrate,
+        constant=constant,
+        profile=profile,
+        **settings,
+    )
+
+
+def _print_practice_instructions(
+    cfg: PracticeConfig,
+    view: PracticeView | None = None,
+) -> None:
+    """Print mode-specific instructions for practice mode.
+
+    Args:
+        cfg: The practice configuration.
+        view: Where output goes (defaults to ANSI text on stdout).
+    """
+    if view is None:
+        view = AnsiView()
+    symbol = MATHEMATICAL_CONSTANTS[cfg.constant]["symbol"]
+    if cfg.mode == "standard":
+        view.message(f"Practice memorizing digits of {symbol} one by one.")
+        view.message("Type each digit (0-9) without pressing Enter.")
+    elif cfg.mode == "timed":
+        view.message(
+            f"Timed practice: You have {cfg.time_limit} seconds to enter digits.",
+        )
+        view.message("Type each digit (0-9) without pressing Enter.")
+    elif cfg.mode == "chunk":
+        view.message(
+            f"Chunk-based practice: Memorize {symbol} in chunks of "
+            f"{cfg.chunk_size} digits."
+        )
+        view.message("Type each digit (0-9) without pressing Enter.")
+    elif cfg.mode == "review":
+        view.message(
+            f"Review practice: Recall the {cfg.chunk_size}-digit chunks that are "
+            "due, weakest first.",
+        )
+        view.message("Type each digit (0-9) without pressing Enter.")
+
+    view.message("Press Ctrl+C at any time to exit.\n")
+
+
+def _get_starting_digits(
+    stats: dict[str, object],
+    min_digits: int,
+    max_digits: int,
+    offset: int = 0,
+) -> int:
+    """Determine starting digit count for practice session.
+
+    Args:
+        stats: Practice statistics dictionary.
+        min_digits: Minimum number of digits.
+        max_digits: Maximum number of digits.
+        offset: Number of decimals skipped before each level starts.
+
+    Returns:
+        The starting digit count for this session.
+    """
+    current_digits = max(stats.get("max_digits", 0) - offset + 1, min_digits)
+    return min(current_digits, max_digits)
+
+
+def _print_practice_header(
+    stats: dict[str, object],
+    current_digits: int | None,
+    view: PracticeView | None = None,
+) -> None:
+    """Print practice session header with stats.
+
+    Args:
+        stats: Practice statistics dictionary.
+        current_digits: Starting digit count, or ``None`` when the starting
+            level is found by calibration.
+        view: Where output goes (defaults to ANSI text on stdout).
+    """
+    if view is None:
+        view = AnsiView()
+    view.message(f"Your best: {stats.get('max_digits', 0)} digits")
+    if stats.get("best_speed"):
+        view.message(f"Best speed: {stats.get('best_speed'):.1f} digits/minute")
+    if current_digits is None:
+        view.message("Calibrating your starting level...\n")
+    else:
+        view.message(f"Starting with {current_digits} digits\n")
+
+
+def _get_level_cap(cfg: PracticeConfig) -> int:
+    """Return the longest level a session may reach.
+
+    Args:
+        cfg: Practice configuration.
+
+    Returns:
+        The level cap, limited by ``max_digits``, the practice window and the
+        digits available after ``from_position`` (may be below 1).
+    """
+    available = len(_CONSTANT_DIGIT_STRINGS[cfg.constant]) - cfg.from_position
+    level_cap = min(cfg.max_digits, available)
+    if cfg.window is not None:
+        level_cap = min(level_cap, cfg.window)
+    return level_cap
+
+
+def _show_reference_digits(
+    practice_mode: str,
+    pi_digits: str,
+    current_digits: int,
+    offset: int = 0,
+    view: PracticeView | None = None,
+) -> None:
+    """Show reference digits before practice (except in timed mode).
+
+    When practising from an offset the digits just before the window are
+    shown as a cue in every mode, since they are not part of the answer.
+
+    Args:
+        practice_mode: The practice mode being used.
+        pi_digits: The pi digits string.
+        current_digits: Number of digits to practice.
+        offset: Number of decimals skipped before each level starts.
+        view: Where output goes (defaults to ANSI text on stdout).
+    """
+    if view is None:
+        view = AnsiView()
+    if offset > 0:
+        context_start = max(0, offset - REFERENCE_CONTEXT_DIGITS)
+        context = pi_digits[context_start + 2 : offset + 2]
+        view.message(f"Digits {context_start + 1}-{offset}: …{context}")
+
+    if practice_mode != "timed":
+        ref_digits = min(5, current_digits)
+        level_start = pi_digits[offset + 2 : offset + ref_digits + 2]
+        if offset == 0:
+            view.message(f"First {ref_digits} digits: {pi_digits[: ref_digits + 2]}")
+        else:
+            view.message(f"Next {ref_digits} digits: {level_start}")
+
+
+def _run_practice_strategy(
+    cfg: PracticeConfig,
+    pi_digits: str,
+    current_digits: int,
+    stats: dict[str, object],
+    source: InputSource | None = None,
+    view: PracticeView | None = None,
+) -> tuple[bool, int, float | None]:
+    """Run the appropriate practice strategy based on configuration.
+
+    Args:
+        cfg: Practice configuration.
+        pi_digits: The pi digits string.
+        current_digits: Number of digits to practice.
+        stats: Practice statistics dictionary.
+        source: Where keystrokes come from (defaults to the terminal).
+        view: Where output goes (defaults to ANSI text on stdout).
+
+    Returns:
+        Tuple of (all_correct, correct_count, elapsed_time).
+    """
+    if source is None:
+        source = TTYInputSource()
+    if view is None:
+        view = AnsiView(colorblind_mode=cfg.colorblind_mode)
+    source.begin_level(cfg.from_position, current_digits)
+
+    if cfg.mode == "standard":
+        all_correct, correct_count = standard_practice(
+            pi_digits,
+            current_digits,
+            colorblind_mode=cfg.colorblind_mode,
+            visual_aid=cfg.visual_aid,
+            offset=cfg.from_position,
+            source=source,
+            view=view,
+        )
+        return all_correct, correct_count, None
+
+    if cfg.mode == "timed":
+        all_correct, correct_count, elapsed_time = timed_practice(
+            pi_digits,
+            current_digits,
+            cfg.time_limit,
+            colorblind_mode=cfg.colorblind_mode,
+            show_timer=cfg.show_timer,
+            offset=cfg.from_position,
+            source=source,
+            view=view,
+        )
+
+        # Calculate and update speed
+        if elapsed_time > 0:
+            speed = (correct_count / elapsed_time) * 60
+            view.message(f"\nSpeed: {speed:.1f} digits/minute")
+
+            if not stats.get("best_speed") or speed > stats.get("best_speed"):
+                stats["best_speed"] = speed
+
+        return all_correct, correct_count, elapsed_time
+
+    # Chunk mode
+    all_correct, correct_count = chunk_based_practice(
+        pi_digits,
+        cfg.chunk_size,
+        current_digits,
+        colorblind_mode=cfg.colorblind_mode,
+        offset=cfg.from_position,
+        source=source,
+        view=view,
+    )
+    return all_correct, correct_count, None
+
+
+@dataclass
+class PracticeSession:
+    """Running totals of a practice session.
+
+    Attributes:
+        start_time: Unix timestamp at which the session started.
+        correct_digits: Total correct digits typed so far.
+        max_level: Furthest decimal position reached (all-time best so far).
+            Only levels recited from the first decimal count towards it.
+        furthest_position: Furthest decimal position reached this session,
+            including levels that start after ``from_position``.
+        elapsed_time: Elapsed time of the last timed level, if any.
+        best_speed: Fastest timed level this session, in digits per minute.
+        levels: Outcome of every level played, in order.
+    """
+
+    start_time: float
+    correct_digits: int = 0
+    max_level: int = 0
+    furthest_position: int = 0
+    elapsed_time: float | None = None
+    best_speed: float | None = None
+    levels: list[dict[str, object]] = field(default_factory=list)
+
+    def record_level(
+        self: PracticeSession,
+        start: int,
+        length: int,
+        correct: int,
+        elapsed: float | None = None,
+    ) -> None:
+        """Remember the outcome of one level for the statistics store.
+
+        Args:
+            start: Number of decimals skipped before the level.
+            length: Number of digits in the level.
+            correct: Digits typed correctly before the first mistake.
+            elapsed: Seconds taken, when the strategy measures it.
+        """
+        self.levels.append(
+            {"start": start, "length": length, "correct": correct, "elapsed": elapsed},
+        )
+        if elapsed:
+            speed = correct / elapsed * 60
+            self.best_speed = max(self.best_speed or 0.0, speed)
+
+    def reach(self: PracticeSession, offset: int, length: int) -> None:
+        """Credit a level of *length* digits recited after *offset* decimals.
+
+        A window starting past the first decimal does not prove the prefix
+        before it, so it never raises the all-time best ``max_level``.
+        """
+        position = offset + length
+        self.furthest_position = max(self.furthest_position, position)
+        if offset == 0:
+            self.max_level = max(self.max_level, position)
+
+    @property
+    def duration(self: PracticeSession) -> float:
+        """Seconds since the session started."""
+        return time.time() - self.start_time
+
+
+def _run_practice_levels(  # noqa: PLR0913
+    cfg: PracticeConfig,
+    pi_digits: str,
+    current_digits: int,
+    stats: dict[str, object],
+    source: InputSource,
+    view: PracticeView,
+    *,
+    session: PracticeSession,
+) -> None:
+    """Play levels of growing length until the level cap is passed.
+
+    Args:
+        cfg: Practice configuration.
+        pi_digits: The pi digits string.
+        current_digits: Length of the first level.
+        stats: Practice statistics dictionary.
+        source: Where keystrokes come from.
+        view: Where output goes.
+        session: Session totals, updated after every level.
+    """
+    level_cap = _get_level_cap(cfg)
+    while current_digits <= level_cap:
+        view.message(f"\n--- Level: {current_digits} digits ---")
+
+        # Run practice strategy
+        all_correct, correct_count, session.elapsed_time = _run_practice_strategy(
+            cfg,
+            pi_digits,
+            current_digits,
+            stats,
+            source,
+            view,
+        )
+        session.correct_digits += correct_count
+        session.record_level(
+            cfg.from_position, current_digits, correct_count, session.elapsed_time
+        )
+
+        # End of level processing
+        if all_correct:
+            view.message("\n\n🎉 Perfect! Moving to next level.")
+            session.reach(cfg.from_position, current_digits)
+            current_digits += 1
+
+            source.pause(1)
+        else:
+            view.message("\n\nTry again for this level.")
+            source.pause(1)
+
+
+def _calibrate_frontier(  # noqa: PLR0913
+    cfg: PracticeConfig,
+    pi_digits: str,
+    level_cap: int,
+    stats: dict[str, object],
+    source: InputSource,
+    view: PracticeView,
+    *,
+    session: PracticeSession | None = None,
+) -> tuple[int, int]:
+    """Find the longest level the user can currently recite without error.
+
+    Level lengths gallop upwards (doubling) from ``min_digits`` until a level
+    fails.  The failed level's correct-digit count bounds the frontier from
+    above, so that bound is tried first and the remaining range is bisected.
+    This takes O(log n) levels instead of one level per digit.
+
+    Args:
+        cfg: Practice configuration.
+        pi_digits: The pi digits string.
+        level_cap: Longest level the session may reach.
+        stats: Practice statistics dictionary.
+        source: Where keystrokes come from.
+        view: Where output goes.
+        session: Session whose level outcomes to record, if any.
+
+    Returns:
+        Tuple of (frontier, correct_digits_count).
+    """
+    correct_total = 0
+
+    def probe(length: int) -> tuple[bool, int]:
+        nonlocal correct_total
+        view.message(f"\n--- Calibration: {length} digits ---")
+        all_correct, correct_count, elapsed = _run_practice_strategy(
+            cfg, pi_digits, length, stats, source, view
+        )
+        correct_total += correct_count
+        if session is not None:
+            session.record_level(cfg.from_position, length, correct_count, elapsed)
+        source.pause(1)
+        return all_correct, correct_count
+
+    # Gallop: double the level length until the user fails
+    known = 0
+    length = min(max(cfg.min_digits, 1), level_cap)
+    while True:
+        all_correct, correct_count = probe(length)
+        if not all_correct:
+            ceiling = max(known, min(length - 1, correct_count))
+            break
+        known = length
+        if length >= level_cap:
+            return known, correct_total
+        length = min(length * 2, level_cap)
+
+    # Confirm the bound from the failed level, bisecting if it does not hold
+    length = ceiling
+    while known < ceiling:
+        all_correct, correct_count = probe(length)
+        if all_correct:
+            known = length
+        else:
+            ceiling = max(known, min(length - 1, correct_count))
+        length = (known + ceiling + 1) // 2
+
+    return known, correct_total
+
+
+def _update_practice_stats(  # noqa: PLR0913
+    stats: dict[str, object],
+    session_max_level: int,
+    session_correct_digits: int,
+    session_duration: float,
+    practice_mode: str,
+    elapsed_time: float | None,
+    *,
+    save: bool = True,
+    constant: str = "pi",
+    levels: list[dict[str, object]] | None = None,
+    profile: str | None = None,
+    furthest_position: int | None = None,
+    speed: float | None = None,
+) -> None:
+    """Update practice statistics and log the session.
+
+    Args:
+        stats: Practice statistics dictionary.
+        session_max_level: Maximum level reached in this session.
+        session_correct_digits: Total correct digits in this session.
+        session_duration: Total session duration in seconds.
+        practice_mode: The practice mode used.
+        elapsed_time: Elapsed time for the last level (if applicable).
+        save: Whether to append the session to the statistics log.
+        constant: Constant the session practised.
+        levels: Outcome of every level (see :meth:`PracticeSession.record_level`).
+        profile: Profile that practised (the OS user if None).
+        furthest_position: Furthest position reached in a window after
+            ``--from-position``, kept in the session record only.
+        speed: The session's fastest timed level, in digits per minute.
+    """
+    session_record = {
+        "uid": uuid.uuid4().hex,
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "mode": practice_mode,
+        "max_level": session_max_level,
+        "correct_digits": session_correct_digits,
+        "duration_seconds": round(session_duration),
+    }
+    if furthest_position is not None:
+        session_record["furthest_position"] = furthest_position
+    event = {
+        "session": session_record,
+        "elapsed_time": elapsed_time,
+        "best_speed": speed,
+    }
+    _apply_practice_event(stats, event)
+
+    if save:
+        _log_practice_event(event, constant, levels, profile)
+
+
+def _print_session_summary(
+    stats: dict[str, object],
+    practice_mode: str,
+    session_duration: float,
+    session_correct_digits: int,
+    session_max_level: int,
+    view: PracticeView | None = None,
+) -> None:
+    """Print summary of practice session.
+
+    Args:
+        stats: Practice statistics dictionary.
+        practice_mode: The practice mode used.
+        session_duration: Total session duration in seconds.
+        session_correct_digits: Total correct digits in this session.
+        session_max_level: Maximum level reached in this session.
+        view: Where output goes (defaults to ANSI text on stdout).
+    """
+    if view is None:
+        view = AnsiView()
+    view.summary(
+        {
+            "mode": practice_mode,
+            "duration_seconds": round(session_duration, 3),
+            "correct_digits": session_correct_digits,
+            "max_level": session_max_level,
+            "best_level": stats["max_digits"],
+        },
+    )
+    view.message("\n=== Session Summary ===")
+    view.message(f"Mode: {practice_mode}")
+    view.message(
+        f"Time: {round(session_duration // 60)} min {round(session_duration % 60)} sec",
+    )
+    view.message(f"Digits correct: {session_correct_digits}")
+    view.message(f"Maximum level: {session_max_level}")
+    view.message(f"All-time best: {stats['max_digits']} digits")
+
+    if practice_mode == "timed" and session_correct_digits > 0:
+        speed = (session_correct_digits / session_duration) * 60
+        view.message(f"Average speed: {speed:.1f} digits/minute")
+        view.message(
+            f"All-time best speed: {stats.get('best_speed', 0):.1f} digits/minute"
+        )
+
+
+def standard_practice(  # noqa: PLR0913
+    pi_digits: str,
+    current_digits: int,
+    *,
+    colorblind_mode: bool = False,
+    visual_aid: bool = False,
+    offset: int = 0,
+    source: InputSource | None = None,
+    view: PracticeView | None = None,
+) -> tuple[bool, int]:
+    """Implement standard digit-by-digit practice strategy.
+
+    Args:
+        pi_digits: String containing the digits of pi
+        current_digits: Current level (total digits to practice)
+        colorblind_mode: Whether to use colorblind-friendly colors
+        visual_aid: Whether to show visual progress indicators
+        offset: Number of decimals to skip before the level starts
+        source: Where keystrokes come from (defaults to the terminal)
+        view: Where output goes (defaults to ANSI text on stdout)
+
+    Returns:
+        Tuple of (all_correct, correct_digits_count)
+    """
+    if source is None:
+        source = TTYInputSource()
+    if view is None:
+        view = AnsiView(colorblind_mode=colorblind_mode)
+    all_correct = True
+    correct_digits = 0
+
+    # Print "3." (or the start position when practising from an offset)
+    view.begin_level(_level_prefix(offset, pi_digits))
+
+    # Process each digit of the level
+    level_digits = pi_digits[offset + 2 : offset + current_digits + 2]
+    for i, correct_digit in enumerate(level_digits):
+        # Show progress bar if visual aid is enabled
+        if visual_aid and i % 3 == 0:  # Update every few digits to avoid flicker
+            view.progress(i, current_digits)
+
+        # Get input for this digit (non-blocking)
+        digit = source.read_digit(correct_digit)
+        _PRACTICE_KEYSTROKES.inc()
+
+        # Show the digit in green if correct, red/orange otherwise
+        view.digit(digit, correct=digit == correct_digit)
+        if digit == correct_digit:
+            correct_digits += 1
+        else:
+            source.restore()
+
+            # Show the correct digit
+            view.mistake(f"Correct: {correct_digit}")
+            all_correct = False
+            return all_correct, correct_digits
+
+        # Add spacing for readability
+        if (i + 1) % 5 == 0:
+            view.separator(" ")
+
+    # Clear progress bar if used
+    if visual_aid:
+        view.clear_progress()
+
+    return all_correct, correct_digits
+
+
+def practice_mode(  # noqa: PLR0913
+    *,
+    colorblind_mode: bool = False,
+    mode: str | None = None,
+    min_digits: int | None = None,
+    max_digits: int | None = None,
+    chunk_size: int | None = None,
+    time_limit: int | None = None,
+    visual_aid: bool | None = None,
+    from_position: int | None = None,
+    window: int | None = None,
+    calibrate: bool = False,
+    constant: str = "pi",
+    profile: str | None = None,
+    source: InputSource | None = None,
+    save_stats: bool = True,
+    record: bool = False,
+    ui: str = DEFAULT_PRACTICE_UI,
+) -> None:
+    """Interactive practice mode for memorizing π (or another constant's) digits.
+
+    Args:
+        colorblind_mode: Whether to use colorblind-friendly colors
+        mode: Practice mode (standard, timed, chunk, review)
+        min_digits: Minimum number of digits to start with
+        max_digits: Maximum number of digits to practice
+        chunk_size: Size of chunks for chunk and review modes
+        time_limit: Time limit in seconds for timed mode
+        visual_aid: Whether to show visual progress indicators
+        from_position: Number of decimals to skip before each level starts
+        window: Maximum number of digits per level after from_position
+        calibrate: Whether to find the starting level adaptively
+        constant: Constant to practise; each keeps its own statistics
+        profile: Profile to practise as (the OS user's own files if None)
+        source: Where keystrokes come from (defaults to the view's own input)
+        save_stats: Whether to record the session in the statistics file
+        record: Whether to record every keystroke to a session file
+        ui: Practice front end, one of PRACTICE_VIEWS (ansi, curses)
+    """
+    # Load configuration and stats
+    cfg = _load_practice_config_settings(
+        colorblind_mode=colorblind_mode,
+        mode=mode,
+        min_digits=min_digits,
+        max_digits=max_digits,
+        chunk_size=chunk_size,
+        time_limit=time_limit,
+        visual_aid=visual_aid,
+        from_position=from_position,
+        window=window,
+        calibrate=calibrate,
+        constant=constant,
+        profile=profile,
+    )
+    stats = load_practice_stats(cfg.constant, cfg.profile)
+
+    view = PRACTICE_VIEWS[ui](colorblind_mode=cfg.colorblind_mode)
+    if source is None:
+        source = view.default_source()
+
+    # Print instructions and header
+    view.message("\n🔢 PIGAME PRACTICE MODE 🔢")
+    view.message("=========================\n")
+    _print_practice_instructions(cfg, view)
+
+    if record:
+        source = _start_recording(cfg, source)
+
+    view.open()
+    try:
+        session = _run_practice_session(cfg, stats, source, view, save_stats=save_stats)
+    finally:
+        view.close()
+        if isinstance(source, RecordingInputSource):
+            source.recorder.close()
+            view.message(f"Session recorded to {source.recorder.path}")
+
+    if session is None:
+        return
+
+    # Update and save stats
+    session_duration = session.duration
+    _update_practice_stats(
+        stats,
+        session.max_level,
+        session.correct_digits,
+        session_duration,
+        cfg.mode,
+        session.elapsed_time,
+        save=save_stats,
+        constant=cfg.constant,
+        levels=session.levels,
+        profile=cfg.profile,
+        furthest_position=session.furthest_position if cfg.from_position else None,
+        speed=session.best_speed,
+    )
+
+    # Show session summary
+    _print_session_summary(
+        stats,
+        cfg.mode,
+        session_duration,
+        session.correct_digits,
+        session.max_level,
+        view,
+    )
+    if cfg.from_position:
+        view.message(f"Furthest position reached: {session.furthest_position}")
+
+
+def _start_recording(cfg: PracticeConfig, source: InputSource) -> InputSource:
+    """Wrap *source* so that the session's keystrokes are recorded.
+
+    Args:
+        cfg: Practice configuration.
+        source: The source that provides the keystrokes.
+
+    Returns:
+        A recording wrapper around *source*.
+    """
+    path = PRACTICE_SESSIONS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.pgr"
+    header = {
+        "version": 1,
+        "constant": cfg.constant,
+        "mode": cfg.mode,
+        "started": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    return RecordingInputSource(source, SessionRecorder(path, header))
+
+
+def _run_practice_session(
+    cfg: PracticeConfig,
+    stats: dict[str, object],
+    source: InputSource,
+    view: PracticeView,
+    *,
+    save_stats: bool,
+) -> PracticeSession | None:
+    """Run a practice session.
+
+    Args:
+        cfg: Practice configuration.
+        stats: Practice statistics dictionary.
+        source: Where keystrokes come from.
+        view: Where output goes.
+        save_stats: Whether to save the updated review schedule.
+
+    Returns:
+        The session totals, or None if the session could not start.
+    """
+    # Review mode schedules chunks instead of growing levels
+    if cfg.mode == "review":
+        return _run_review_session(cfg, stats, source, view, save_stats=save_stats)
+
+    level_cap = _get_level_cap(cfg)
+    if cfg.from_position < 0 or level_cap < 1:
+        view.message(
+            f"Cannot start at position {cfg.from_position}: not enough digits.",
+        )
+        return None
+
+    offset = cfg.from_position
+    current_digits = _get_starting_digits(stats, cfg.min_digits, level_cap, offset)
+    _print_practice_header(stats, None if cfg.calibrate else current_digits, view)
+
+    # Every level slices its window out of the constant's shared digit buffer
+    pi_digits = _digit_buffer(cfg.constant)
+
+    # Track session stats
+    session = PracticeSession(
+        start_time=time.time(),
+        max_level=stats.get("max_digits", 0),
+    )
+
+    try:
+        # Find the user's current frontier before practising from it
+        if cfg.calibrate:
+            frontier, calibration_correct = _calibrate_frontier(
+                cfg, pi_digits, level_cap, stats, source, view, session=session
+            )
+            session.correct_digits += calibration_correct
+            if frontier > 0:
+                session.reach(offset, frontier)
+            current_digits = frontier + 1
+            view.message(f"\nCalibrated frontier: {frontier} digits")
+
+        # Show reference digits
+        _show_reference_digits(cfg.mode, pi_digits, current_digits, offset, view)
+        if cfg.mode != "timed":
+            source.pause(1)
+
+        # Start practice session
+        _run_practice_levels(
+            cfg, pi_digits, current_digits, stats, source, view, session=session
+        )
+
+        # Reached maximum difficulty
+        view.message("\n🏆 Congratulations! You've reached the maximum level!")
+
+    except (KeyboardInterrupt, EOFError):
+        source.restore()
+        view.message("\n\nPractice session ended.")
+
+    return session
 
-            # Check if digit is correct
-            if digit == correct_digit:
-                correct_digits += 1
 
-                # Show correct digit in green
-                if colorblind_mode:
-                    sys.stdout.write(f"\033[38;5;34m{digit}\033[0m")
-                else:
-                    sys.stdout.write(f"\033[92m{digit}\033[0m")
-            else:
-                # Show incorrect digit in red/orange
-                if colorblind_mode:
-                    sys.stdout.write(f"\033[38;5;208m{digit}\033[0m")
-                else:
-                    sys.stdout.write(f"\033[91m{digit}\033[0m")
-
-                # Restore terminal settings for proper printing
-                termios.tcsetattr(
-                    sys.stdin.fileno(),
-                    termios.TCSADRAIN,
-                    termios.tcgetattr(sys.stdin.fileno()),
-                )
+# ---------------------------------------------------------------------------
+# Race mode - head-to-head recitation over a local socket
+#
+# Host and players exchange newline-delimited JSON objects with a "type" key.
+# Players send "join" {name}, one "key" {digit} per keystroke and "done" when
+# they run out of input.  The host answers "welcome", broadcasts "start"
+# {in, digits} once the lobby is full, acknowledges each key ("key" {digit,
+# correct, expected}), broadcasts "leaderboard" {ranking} at most once per
+# tick and ends with "finish".
+# ---------------------------------------------------------------------------
 
-                # Show the correct digit
-                print(f" ✗ Correct: {correct_digit}")
-                all_correct = False
-                return all_correct, correct_digits
 
-        sys.stdout.flush()
+class RaceLeaderboard:
+    """Live race ranking: most correct digits first, then the fastest.
 
-    return all_correct, correct_digits
+    A score change pushes a new heap entry instead of updating the old one.
+    Old entries are recognised as stale (they are no longer the player's
+    current entry) and dropped when they reach the top of the heap, and the
+    heap is rebuilt once stale entries outnumber live ones.  Updates cost
+    O(log n) and reading the top k costs O(k log n).
+    """
 
+    def __init__(self: RaceLeaderboard) -> None:
+        """Initialize an empty leaderboard."""
+        self._heap: list[tuple[int, float, str]] = []
+        self._entries: dict[str, tuple[int, float, str]] = {}
 
-def timed_practice(
-    pi_digits: str,
-    current_digits: int,
-    time_limit: int,
-    *,
-    colorblind_mode: bool = False,
-    show_timer: bool = True,
-) -> tuple[bool, int, float]:
-    """Implement timed practice strategy.
+    def __len__(self: RaceLeaderboard) -> int:
+        """Return the number of ranked players."""
+        return len(self._entries)
 
-    Args:
-        pi_digits: String containing the digits of pi
-        current_digits: Current level (total digits to practice)
-        time_limit: Time limit in seconds
-        colorblind_mode: Whether to use colorblind-friendly colors
-        show_timer: Whether to show the timer
+    def update(self: RaceLeaderboard, name: str, correct: int, elapsed: float) -> None:
+        """Set a player's score.
 
-    Returns:
-        Tuple of (all_correct, correct_digits_count, elapsed_time)
+        Args:
+            name: Player name.
+            correct: Correct digits typed so far.
+            elapsed: Seconds from the start to the last correct digit.
+        """
+        entry = (-correct, elapsed, name)
+        self._entries[name] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._entries) + RACE_HEAP_SLACK:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def remove(self: RaceLeaderboard, name: str) -> None:
+        """Drop a player; their heap entries become stale."""
+        self._entries.pop(name, None)
+
+    def top(self: RaceLeaderboard, count: int) -> list[tuple[str, int, float]]:
+        """Return up to *count* leaders as (name, correct, elapsed) tuples."""
+        live = []
+        while self._heap and len(live) < count:
+            entry = heapq.heappop(self._heap)
+            if self._entries.get(entry[2]) is entry:
+                live.append(entry)
+        for entry in live:
+            heapq.heappush(self._heap, entry)
+        return [(name, -negated, elapsed) for negated, elapsed, name in live]
+
+
+@dataclass
+class RacePlayer:
+    """A connected race participant.
+
+    Attributes:
+        name: Unique player name.
+        writer: Stream the host writes the player's messages to.
+        correct: Correct digits typed so far.
+        elapsed: Seconds from the start to the last correct digit.
+        done: Whether the player finished, made a mistake or left.
     """
-    all_correct = True
-    correct_digits = 0
-    start_time = time.time()
 
-    # Print the first 2 characters (3.)
-    sys.stdout.write("3.")
-    sys.stdout.flush()
+    name: str
+    writer: asyncio.StreamWriter
+    correct: int = 0
+    elapsed: float = 0.0
+    done: bool = False
 
-    # Process each digit after the decimal point
-    for i, correct_digit in enumerate(pi_digits[2 : current_digits + 2]):
-        # Update timer if showing
-        if show_timer and i % 3 == 0:  # Update every few digits to avoid flicker
-            display_timer(start_time, time_limit)
 
-            # Check if time's up
-            if time.time() - start_time > time_limit:
-                termios.tcsetattr(
-                    sys.stdin.fileno(),
-                    termios.TCSADRAIN,
-                    termios.tcgetattr(sys.stdin.fileno()),
-                )
-                print("\n\n⏰ Time's up!")
-                return False, correct_digits, time.time() - start_time
+def _race_send(writer: asyncio.StreamWriter, message: dict[str, object]) -> None:
+    """Queue one protocol message on *writer* (drained by the caller)."""
+    writer.write(json.dumps(message).encode() + b"\n")
 
-        # Get input for this digit (non-blocking)
-        digit = input_digit()
 
-        # Check if digit is correct
-        if digit == correct_digit:
-            correct_digits += 1
+async def _race_read(reader: asyncio.StreamReader) -> dict[str, object] | None:
+    """Read one protocol message, or None at the end of the stream.
 
-            # Show correct digit in green
-            if colorblind_mode:
-                sys.stdout.write(f"\033[38;5;34m{digit}\033[0m")
-            else:
-                sys.stdout.write(f"\033[92m{digit}\033[0m")
-        else:
-            # Show incorrect digit in red/orange
-            if colorblind_mode:
-                sys.stdout.write(f"\033[38;5;208m{digit}\033[0m")
-            else:
-                sys.stdout.write(f"\033[91m{digit}\033[0m")
+    Raises:
+        ValueError: If the line is too long or not a JSON object.
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        msg = "Race messages must be JSON objects"
+        raise ValueError(msg)  # noqa: TRY004
+    return message
+
+
+class RaceHost:
+    """Run a race: gather players, start them together, rank their progress.
+
+    Everything runs on one asyncio event loop, so a keystroke updates only
+    its player's state and the leaderboard, with no locks.  Standings are
+    broadcast at most once per tick however fast players type.
+    """
 
-            # Restore terminal settings for proper printing
-            termios.tcsetattr(
-                sys.stdin.fileno(),
-                termios.TCSADRAIN,
-                termios.tcgetattr(sys.stdin.fileno()),
+    def __init__(
+        self: RaceHost,
+        digits: str,
+        *,
+        players: int = 2,
+        time_limit: float = DEFAULT_TIME_LIMIT,
+        countdown: float = RACE_COUNTDOWN_SECONDS,
+        tick: float = RACE_TICK_SECONDS,
+        on_join: Callable[[str], None] | None = None,
+    ) -> None:
+        """Initialize the host.
+
+        Args:
+            digits: The digits (after the decimal point) players must type.
+            players: Number of players that starts the race.
+            time_limit: Seconds after the start at which the race ends.
+            countdown: Seconds between the start signal and the start.
+            tick: Seconds between leaderboard broadcasts.
+            on_join: Called with each player's name once they have joined.
+        """
+        self.digits = digits
+        self.expected_players = players
+        self.time_limit = time_limit
+        self.countdown = countdown
+        self.tick = tick
+        self.on_join = on_join
+        self.players: dict[str, RacePlayer] = {}
+        self.leaderboard = RaceLeaderboard()
+        self.start_time: float | None = None
+        self.server: asyncio.AbstractServer | None = None
+        self._lobby_full = asyncio.Event()
+        self._finished = asyncio.Event()
+        self._changed = False
+        self._handlers: set[asyncio.Task[None]] = set()
+
+    async def start(
+        self: RaceHost,
+        *,
+        socket_path: Path | None = None,
+        port: int | None = None,
+    ) -> asyncio.AbstractServer:
+        """Listen on a Unix socket (default) or on localhost TCP *port*.
+
+        Raises:
+            OSError: If the socket cannot be created or a race already
+                listens on it.
+        """
+        if port is not None:
+            self.server = await asyncio.start_server(
+                self._serve_player, "127.0.0.1", port, limit=RACE_MAX_LINE
+            )
+        else:
+            path = socket_path or RACE_SOCKET_FILE
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                if probe.connect_ex(str(path)) == 0:
+                    msg = f"A pigame race is already listening on {path}"
+                    raise OSError(msg)
+            path.unlink(missing_ok=True)
+            self.server = await asyncio.start_unix_server(
+                self._serve_player, path, limit=RACE_MAX_LINE
             )
+        return self.server
+
+    async def run(self: RaceHost) -> list[dict[str, object]]:
+        """Wait for the lobby to fill, run the race and return the ranking."""
+        # Re-check on waking: a player may have left the full lobby meanwhile
+        while len(self.players) < self.expected_players:
+            await self._lobby_full.wait()
+        loop = asyncio.get_running_loop()
+        self.start_time = loop.time() + self.countdown
+        self._broadcast(
+            {"type": "start", "in": self.countdown, "digits": len(self.digits)}
+        )
+        await self._drain()
+        await asyncio.sleep(self.countdown)
+
+        ticker = asyncio.create_task(self._broadcast_standings())
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._finished.wait(), self.time_limit)
+        ticker.cancel()
+
+        ranking = self.ranking()
+        self._broadcast({"type": "finish", "ranking": ranking})
+        await self._drain()
+        self.server.close()
+        for player in self.players.values():
+            player.writer.close()
+        # Closed connections end their handlers; let them finish cleanly
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        return ranking
+
+    def ranking(self: RaceHost, count: int | None = None) -> list[dict[str, object]]:
+        """Return the standings, best first."""
+        leaders = self.leaderboard.top(count or len(self.leaderboard))
+        return [
+            {
+                "rank": position,
+                "name": name,
+                "correct": correct,
+                "seconds": round(elapsed, 3),
+                "done": self.players[name].done,
+            }
+            for position, (name, correct, elapsed) in enumerate(leaders, start=1)
+        ]
+
+    async def _serve_player(
+        self: RaceHost,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self._handlers.add(asyncio.current_task())
+        player = None
+        try:
+            message = await _race_read(reader)
+            if message is None or message.get("type") != "join":
+                return
+            if self.start_time is not None or self._lobby_full.is_set():
+                started = self.start_time is not None
+                reason = "Race already started" if started else "Race is full"
+                _race_send(writer, {"type": "error", "message": reason})
+                await writer.drain()
+                return
+            player = self._join(str(message.get("name") or "player"), writer)
+            while (message := await _race_read(reader)) is not None:
+                if message.get("type") == "key":
+                    self._key(player, str(message.get("digit", "")))
+                elif message.get("type") == "done" and not player.done:
+                    player.done = True
+                    self._changed = True
+                    self._check_finished()
+        except (ConnectionError, ValueError):
+            logger.debug("Race connection dropped", exc_info=True)
+        finally:
+            if player is None:
+                writer.close()
+            elif self.start_time is None:
+                # Left the lobby: free the seat
+                del self.players[player.name]
+                self.leaderboard.remove(player.name)
+                self._lobby_full.clear()
+                writer.close()
+            elif not player.done:
+                player.done = True
+                self._changed = True
+                self._check_finished()
+
+    def _join(self: RaceHost, name: str, writer: asyncio.StreamWriter) -> RacePlayer:
+        base, suffix = name[:RACE_MAX_NAME], 1
+        while name in self.players:
+            suffix += 1
+            name = f"{base}#{suffix}"
+        player = RacePlayer(name=name, writer=writer)
+        self.players[name] = player
+        self.leaderboard.update(name, 0, 0.0)
+        _race_send(
+            writer,
+            {
+                "type": "welcome",
+                "name": name,
+                "players": len(self.players),
+                "expected": self.expected_players,
+            },
+        )
+        if self.on_join is not None:
+            self.on_join(name)
+        if len(self.players) >= self.expected_players:
+            self._lobby_full.set()
+        return player
+
+    def _key(self: RaceHost, player: RacePlayer, digit: str) -> None:
+        loop = asyncio.get_running_loop()
+        if self.start_time is None or player.done or loop.time() < self.start_time:
+            return
+        expected = self.digits[player.correct]
+        correct = digit == expected
+        if correct:
+            player.correct += 1
+            player.elapsed = loop.time() - self.start_time
+            self.leaderboard.update(player.name, player.correct, player.elapsed)
+        player.done = not correct or player.correct == len(self.digits)
+        _race_send(
+            player.writer,
+            {"type": "key", "digit": digit, "correct": correct, "expected": expected},
+        )
+        self._changed = True
+        self._check_finished()
+
+    def _check_finished(self: RaceHost) -> None:
+        if self.start_time is not None and all(
+            player.done for player in self.players.values()
+        ):
+            self._finished.set()
+
+    def _broadcast(self: RaceHost, message: dict[str, object]) -> None:
+        for player in self.players.values():
+            if not player.writer.is_closing():
+                _race_send(player.writer, message)
+
+    async def _drain(self: RaceHost) -> None:
+        await asyncio.gather(
+            *(player.writer.drain() for player in self.players.values()),
+            return_exceptions=True,
+        )
 
-            # Show the correct digit
-            print(f" ✗ Correct: {correct_digit}")
-            all_correct = False
-            return all_correct, correct_digits, time.time() - start_time
+    async def _broadcast_standings(self: RaceHost) -> None:
+        while True:
+            await asyncio.sleep(self.tick)
+            if self._changed:
+                self._changed = False
+                self._broadcast(
+                    {
+                        "type": "leaderboard",
+                        "ranking": self.ranking(RACE_LEADERBOARD_SIZE),
+                        "players": len(self.players),
+                    },
+                )
+                await self._drain()
 
-        # Add spacing for readability
-        if (i + 1) % 5 == 0:
-            sys.stdout.write(" ")
 
-        sys.stdout.flush()
+def run_race_host(
+    *,
+    socket_path: Path | None = None,
+    port: int | None = None,
+    players: int = 2,
+    digits: int = RACE_DEFAULT_DIGITS,
+    time_limit: float = DEFAULT_TIME_LIMIT,
+    countdown: float = RACE_COUNTDOWN_SECONDS,
+) -> list[dict[str, object]]:
+    """Host a race until it finishes and return the final ranking.
 
-    # Calculate total time
-    elapsed_time = time.time() - start_time
+    Args:
+        socket_path: Unix socket to listen on (default ~/.pigame/race.sock).
+        port: Listen on this localhost TCP port instead of a Unix socket.
+        players: Number of players that starts the race.
+        digits: Number of decimals of π to recite.
+        time_limit: Seconds after the start at which the race ends.
+        countdown: Seconds between the start signal and the start.
 
-    return all_correct, correct_digits, elapsed_time
+    Returns:
+        The final standings, best first.
 
+    Raises:
+        TooManyDigitsError: If more digits are requested than are available.
+    """
+    race_digits = calculate_pi(digits)[2:]
+
+    async def host() -> list[dict[str, object]]:
+        race = RaceHost(
+            race_digits,
+            players=players,
+            time_limit=time_limit,
+            countdown=countdown,
+            on_join=lambda name: print(
+                f"{name} joined ({len(race.players)}/{players})"
+            ),
+        )
+        await race.start(socket_path=socket_path, port=port)
+        where = (
+            f"127.0.0.1:{port}" if port is not None else socket_path or RACE_SOCKET_FILE
+        )
+        print(f"Race host listening on {where}; waiting for {players} player(s)")
+        try:
+            return await race.run()
+        finally:
+            if port is None:
+                (socket_path or RACE_SOCKET_FILE).unlink(missing_ok=True)
 
-@dataclass
-class PracticeConfig:
-    """Configuration for practice mode.
+    return asyncio.run(host())
 
-    Attributes:
-        colorblind_mode: Whether to use colorblind-friendly colors.
-        mode: Practice mode (standard, timed, chunk).
-        min_digits: Minimum number of digits to start with.
-        max_digits: Maximum number of digits to practice.
-        chunk_size: Size of chunks for chunk mode.
-        time_limit: Time limit in seconds for timed mode.
-        show_timer: Whether to show the timer.
-        visual_aid: Whether to show visual progress indicators.
-    """
 
-    colorblind_mode: bool = False
-    mode: str = DEFAULT_PRACTICE_MODE
-    min_digits: int = PRACTICE_MIN_DIGITS
-    max_digits: int = PRACTICE_MAX_DIGITS
-    chunk_size: int = DEFAULT_CHUNK_SIZE
-    time_limit: int = DEFAULT_TIME_LIMIT
-    show_timer: bool = True
-    visual_aid: bool = True
+class RaceClient:
+    """A player's end of a race: relays keystrokes and shows the standings.
 
+    Sources block, so keystrokes are read on a daemon thread and handed to
+    the event loop through a queue.
+    """
 
-def _load_practice_config_settings(  # noqa: PLR0913
+    def __init__(
+        self: RaceClient,
+        name: str,
+        source: InputSource,
+        view: PracticeView,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            name: Name to race under (the host may add a suffix).
+            source: Where keystrokes come from.
+            view: Where output goes.
+        """
+        self.name = name
+        self.source = source
+        self.view = view
+        self.ranking: list[dict[str, object]] = []
+        self._total = 0
+        self._typed = 0
+        self._keys: asyncio.Queue[str | None] = asyncio.Queue()
+        self._stop = threading.Event()
+        self._sender: asyncio.Task[None] | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def run(
+        self: RaceClient,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> list[dict[str, object]]:
+        """Join through *reader*/*writer* and race until the host finishes."""
+        self._writer = writer
+        _race_send(writer, {"type": "join", "name": self.name})
+        await writer.drain()
+        try:
+            while (message := await _race_read(reader)) is not None:
+                if not await self._handle(message):
+                    break
+        finally:
+            self._stop.set()
+            if self._sender is not None:
+                self._sender.cancel()
+            writer.close()
+            self.source.restore()
+        return self.ranking
+
+    async def _handle(self: RaceClient, message: dict[str, object]) -> bool:
+        """Act on one host message; return False when the race is over."""
+        kind = message.get("type")
+        if kind == "welcome":
+            self.name = str(message["name"])
+            self.view.message(
+                f"Joined as {self.name} ({message['players']}/{message['expected']}); "
+                "waiting for the start..."
+            )
+        elif kind == "start":
+            self._total = int(message["digits"])
+            self.view.message(
+                f"Race starts in {message['in']:g}s: "
+                f"type the first {self._total} digits of π!"
+            )
+            await asyncio.sleep(float(message["in"]))
+            self.view.begin_level("3.")
+            loop = asyncio.get_running_loop()
+            threading.Thread(target=self._read_keys, args=(loop,), daemon=True).start()
+            self._sender = asyncio.create_task(self._send_keys())
+        elif kind == "key":
+            self._typed += 1
+            self.view.digit(str(message["digit"]), correct=bool(message["correct"]))
+            if not message["correct"]:
+                self._stop.set()
+                self.view.mistake(f"Correct: {message['expected']}")
+            elif self._typed == self._total:
+                self._stop.set()
+        elif kind == "leaderboard":
+            self.view.status(_race_standings_text(message["ranking"], self.name))
+        elif kind == "finish":
+            self.ranking = message["ranking"]
+            return False
+        elif kind == "error":
+            self.view.message(f"Race error: {message['message']}")
+            return False
+        return True
+
+    def _read_keys(self: RaceClient, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            # Nobody can type more than the race's digits
+            for expected in calculate_pi(self._total)[2:]:
+                if self._stop.is_set():
+                    break
+                digit = self.source.read_digit(expected)
+                loop.call_soon_threadsafe(self._keys.put_nowait, digit)
+        except (EOFError, KeyboardInterrupt, OSError, RuntimeError):
+            logger.debug("Race input ended", exc_info=True)
+        finally:
+            with contextlib.suppress(RuntimeError):  # the loop may be closed
+                loop.call_soon_threadsafe(self._keys.put_nowait, None)
+
+    async def _send_keys(self: RaceClient) -> None:
+        while (digit := await self._keys.get()) is not None:
+            _race_send(self._writer, {"type": "key", "digit": digit})
+            await self._writer.drain()
+        # Out of keystrokes: the player has nothing more to give
+        _race_send(self._writer, {"type": "done"})
+        await self._writer.drain()
+
+
+async def race_client(
+    name: str,
     *,
-    colorblind_mode: bool,
-    mode: str | None,
-    min_digits: int | None,
-    max_digits: int | None,
-    chunk_size: int | None,
-    time_limit: int | None,
-    visual_aid: bool | None,
-) -> PracticeConfig:
-    """Load practice configuration from parameters and config file.
+    socket_path: Path | None = None,
+    port: int | None = None,
+    source: InputSource | None = None,
+    view: PracticeView | None = None,
+) -> list[dict[str, object]]:
+    """Join a race and print the final standings.
 
     Args:
-        colorblind_mode: Whether to use colorblind-friendly colors.
-        mode: Practice mode (standard, timed, chunk).
-        min_digits: Minimum number of digits to start with.
-        max_digits: Maximum number of digits to practice.
-        chunk_size: Size of chunks for chunk mode.
-        time_limit: Time limit in seconds for timed mode.
-        visual_aid: Whether to show visual progress indicators.
+        name: Name to race under.
+        socket_path: Unix socket of the host (default ~/.pigame/race.sock).
+        port: Connect to this localhost TCP port instead of a Unix socket.
+        source: Where keystrokes come from (defaults to the view's own input).
+        view: Where output goes (defaults to ANSI text on stdout).
 
     Returns:
-        PracticeConfig object with merged settings.
+        The final standings, or an empty list if the race did not finish.
     """
-    config = load_practice_config()
+    if view is None:
+        view = AnsiView()
+    if source is None:
+        source = view.default_source()
+    if port is not None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    else:
+        reader, writer = await asyncio.open_unix_connection(
+            socket_path or RACE_SOCKET_FILE
+        )
 
-    return PracticeConfig(
-        colorblind_mode=colorblind_mode,
-        mode=mode if mode is not None else config.get("mode", DEFAULT_PRACTICE_MODE),
-        min_digits=(
-            min_digits
-            if min_digits is not None
-            else config.get("min_digits", PRACTICE_MIN_DIGITS)
-        ),
-        max_digits=(
-            max_digits
-            if max_digits is not None
-            else config.get("max_digits", PRACTICE_MAX_DIGITS)
-        ),
-        chunk_size=(
-            chunk_size
-            if chunk_size is not None
-            else config.get("chunk_size", DEFAULT_CHUNK_SIZE)
-        ),
-        time_limit=(
-            time_limit
-            if time_limit is not None
-            else config.get("time_limit", DEFAULT_TIME_LIMIT)
-        ),
-        show_timer=config.get("show_timer", True),
-        visual_aid=(
-            visual_aid if visual_aid is not None else config.get("visual_aid", True)
-        ),
-    )
+    ranking = await RaceClient(name, source, view).run(reader, writer)
+    _print_race_results(ranking, view)
+    return ranking
 
 
-def _print_practice_instructions(cfg: PracticeConfig) -> None:
-    """Print mode-specific instructions for practice mode.
+def _race_standings_text(ranking: list[dict[str, object]], name: str) -> str:
+    """Summarise the leaderboard in one line from *name*'s point of view."""
+    leaders = " ".join(
+        f"{entry['rank']}.{entry['name']}:{entry['correct']}" for entry in ranking[:3]
+    )
+    mine = next((entry for entry in ranking if entry["name"] == name), None)
+    position = f"you #{mine['rank']}" if mine else "you are outside the top"
+    return f"{position} | {leaders}"
 
-    Args:
-        cfg: The practice configuration.
-    """
-    if cfg.mode == "standard":
-        print("Practice memorizing digits of π one by one.")
-        print("Type each digit (0-9) without pressing Enter.")
-    elif cfg.mode == "timed":
-        print(
-            f"Timed practice: You have {cfg.time_limit} seconds to enter digits.",
+
+def _print_race_results(
+    ranking: list[dict[str, object]],
+    view: PracticeView | None = None,
+) -> None:
+    """Print the final race standings."""
+    if view is None:
+        view = AnsiView()
+    view.summary({"ranking": ranking})
+    view.message("\n=== Race Results ===")
+    for entry in ranking:
+        view.message(
+            f"{entry['rank']:>3}. {entry['name']:<20} "
+            f"{entry['correct']:>5} digits  {entry['seconds']:8.2f} s"
         )
-        print("Type each digit (0-9) without pressing Enter.")
-    elif cfg.mode == "chunk":
-        print(f"Chunk-based practice: Memorize π in chunks of {cfg.chunk_size} digits.")
-        print("Type each digit (0-9) without pressing Enter.")
 
-    print("Press Ctrl+C at any time to exit.\n")
 
+# ---------------------------------------------------------------------------
+# Worker mode - the library API over newline-delimited JSON
+#
+# Each request is one JSON object with an "op" key ("score", "digits",
+# "format" or "constants") plus that operation's arguments, and an optional
+# "id" that is echoed back.  Each response is one line, in request order:
+# {"id", "ok": true, "result": {...}} or {"id", "ok": false, "error":
+# {"type", "message"}}.  A bad request gets an error response; the worker
+# keeps serving until its input ends.
+# ---------------------------------------------------------------------------
 
-def _get_starting_digits(
-    stats: dict[str, object],
-    min_digits: int,
-    max_digits: int,
-) -> int:
-    """Determine starting digit count for practice session.
+# Marks a request field that has no default
+_REQUIRED = object()
 
-    Args:
-        stats: Practice statistics dictionary.
-        min_digits: Minimum number of digits.
-        max_digits: Maximum number of digits.
 
-    Returns:
-        The starting digit count for this session.
+def _request_field(
+    request: dict[str, object],
+    name: str,
+    kind: type,
+    default: object = _REQUIRED,
+) -> object:
+    """Return a request argument, checking its JSON type.
+
+    Raises:
+        TypeError: If the argument is missing or has the wrong type.
     """
-    current_digits = max(stats.get("max_digits", 0) + 1, min_digits)
-    return min(current_digits, max_digits)
+    value = request.get(name, default)
+    if value is _REQUIRED:
+        msg = f"Missing {name!r}"
+        raise TypeError(msg)
+    if value is not default and (
+        not isinstance(value, kind) or (kind is int and isinstance(value, bool))
+    ):
+        msg = f"{name!r} must be {'a string' if kind is str else 'an integer'}"
+        raise TypeError(msg)
+    return value
+
+
+def _score_request(request: dict[str, object]) -> dict[str, object]:
+    """Score ``answer`` against ``constant`` (default pi) to ``decimals``."""
+    result = score(
+        _request_field(request, "answer", str),
+        _request_field(request, "constant", str, "pi"),
+        decimals=_request_field(request, "decimals", int, None),
+    )
+    return {
+        "match": result.match,
+        "expected": result.expected,
+        "decimals": result.decimals,
+        "constant": result.constant,
+        "errors": list(result.errors),
+    }
 
 
-def _print_practice_header(stats: dict[str, object], current_digits: int) -> None:
-    """Print practice session header with stats.
+def _digits_arguments(request: dict[str, object]) -> tuple[int, str]:
+    """Return a digits request's ``length`` and ``constant`` (default pi)."""
+    return (
+        _request_field(request, "length", int, DEFAULT_LENGTH),
+        _request_field(request, "constant", str, "pi"),
+    )
 
-    Args:
-        stats: Practice statistics dictionary.
-        current_digits: Starting digit count.
-    """
-    print(f"Your best: {stats.get('max_digits', 0)} digits")
-    if stats.get("best_speed"):
-        print(f"Best speed: {stats.get('best_speed'):.1f} digits/minute")
-    print(f"Starting with {current_digits} digits\n")
 
+def _digits_request(request: dict[str, object]) -> dict[str, object]:
+    """Return ``constant`` (default pi) to ``length`` decimals."""
+    return {"digits": digits(*_digits_arguments(request))}
+
+
+def _format_request(request: dict[str, object]) -> dict[str, object]:
+    """Group ``digits`` in fives after the point."""
+    return {"text": format_digits(_request_field(request, "digits", str))}
+
+
+def _constants_request(_request: dict[str, object]) -> dict[str, object]:
+    """List the constants with their symbols and the digits available."""
+    return {
+        "constants": {
+            name: {
+                "symbol": meta["symbol"],
+                "name": meta["name"],
+                "digits": len(_CONSTANT_DIGIT_STRINGS[name]),
+            }
+            for name, meta in MATHEMATICAL_CONSTANTS.items()
+        }
+    }
 
-def _show_reference_digits(
-    practice_mode: str,
-    pi_digits: str,
-    current_digits: int,
-) -> None:
-    """Show reference digits before practice (except in timed mode).
+
+# Worker operations, by the request's "op"
+_REQUEST_HANDLERS = {
+    "score": _score_request,
+    "digits": _digits_request,
+    "format": _format_request,
+    "constants": _constants_request,
+}
+
+
+def handle_request(request: object) -> dict[str, object]:
+    """Answer one worker request.
 
     Args:
-        practice_mode: The practice mode being used.
-        pi_digits: The pi digits string.
-        current_digits: Number of digits to practice.
-    """
-    if practice_mode != "timed":
-        ref_digits = min(5, current_digits)
-        print(f"First {ref_digits} digits: {pi_digits[: ref_digits + 2]}")
-        time.sleep(1)
+        request: The decoded request, a JSON object with an ``op`` key.
 
+    Returns:
+        The response: ``ok`` with a ``result``, or not ``ok`` with an
+        ``error`` naming the exception type and its message.
+    """
+    request_id = request.get("id") if isinstance(request, dict) else None
+    try:
+        if not isinstance(request, dict):
+            msg = "Requests must be JSON objects"
+            raise TypeError(msg)  # noqa: TRY301
+        op = request.get("op")
+        handler = _REQUEST_HANDLERS.get(op) if isinstance(op, str) else None
+        if handler is None:
+            msg = f"Unknown op {op!r}; expected one of {', '.join(_REQUEST_HANDLERS)}"
+            raise ValueError(msg)  # noqa: TRY301
+        result = handler(request)
+    except (PiError, TypeError, ValueError) as e:
+        error = {"type": type(e).__name__, "message": str(e)}
+        return {"id": request_id, "ok": False, "error": error}
+    return {"id": request_id, "ok": True, "result": result}
+
+
+def serve_stdio(
+    stdin: TextIO | None = None,
+    stdout: TextIO | None = None,
+) -> int:
+    """Answer newline-delimited JSON requests until the input ends.
 
-def _run_practice_strategy(
-    cfg: PracticeConfig,
-    pi_digits: str,
-    current_digits: int,
-    stats: dict[str, object],
-) -> tuple[bool, int, float | None]:
-    """Run the appropriate practice strategy based on configuration.
+    One worker process serves any number of requests, so callers pay the
+    interpreter start-up and imports once; the digit strings stay in memory
+    between requests.  Each response is flushed as soon as it is written.
 
     Args:
-        cfg: Practice configuration.
-        pi_digits: The pi digits string.
-        current_digits: Number of digits to practice.
-        stats: Practice statistics dictionary.
+        stdin: Where requests come from (default: standard input).
+        stdout: Where responses go (default: standard output).
 
     Returns:
-        Tuple of (all_correct, correct_count, elapsed_time).
+        The exit status, 0.
     """
-    if cfg.mode == "standard":
-        all_correct, correct_count = standard_practice(
-            pi_digits,
-            current_digits,
-            colorblind_mode=cfg.colorblind_mode,
-            visual_aid=cfg.visual_aid,
-        )
-        return all_correct, correct_count, None
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    served = 0
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {
+                "id": None,
+                "ok": False,
+                "error": {"type": "JSONDecodeError", "message": str(e)},
+            }
+        else:
+            response = handle_request(request)
+        stdout.write(json.dumps(response, separators=(",", ":")) + "\n")
+        stdout.flush()
+        served += 1
+    logger.debug("serve_stdio: answered %d request(s)", served)
+    return 0
 
-    if cfg.mode == "timed":
-        all_correct, correct_count, elapsed_time = timed_practice(
-            pi_digits,
-            current_digits,
-            cfg.time_limit,
-            colorblind_mode=cfg.colorblind_mode,
-            show_timer=cfg.show_timer,
-        )
 
-        # Calculate and update speed
-        if elapsed_time > 0:
-            speed = (correct_count / elapsed_time) * 60
-            print(f"\nSpeed: {speed:.1f} digits/minute")
+# ---------------------------------------------------------------------------
+# HTTP scoring service - the library API over HTTP/1.1 on localhost
+#
+# GET /constants lists the constants.  /digits and /score take the worker
+# mode arguments as query parameters (GET) or a JSON object body (POST) and
+# answer with the worker's result object, or with {"error": {type, message}}.
+# Connections are kept alive between requests.  Each request costs 1 plus 1
+# per SERVE_COST_DIGITS digits involved; the cost is charged to the client's
+# token bucket (429 when it runs dry) and counted against the cost already in
+# flight (503 when the service is full).  Costly requests run on a bounded
+# thread pool so that the event loop keeps answering cheap ones.
+# ---------------------------------------------------------------------------
+
+
+class TokenBucket:
+    """Rate limiter holding up to *burst* tokens, refilled at *rate* per second."""
+
+    def __init__(
+        self: TokenBucket,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Most tokens the bucket holds.
+            clock: Source of the current time in seconds.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self: TokenBucket) -> None:
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def take(self: TokenBucket, cost: float) -> float:
+        """Spend *cost* tokens if the bucket holds them.
+
+        Returns:
+            0 if the tokens were spent, otherwise the seconds until they
+            will be available.
+        """
+        self._refill()
+        if cost <= self.tokens:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
 
-            if not stats.get("best_speed") or speed > stats.get("best_speed"):
-                stats["best_speed"] = speed
+    def full(self: TokenBucket) -> bool:
+        """Whether the bucket has refilled completely."""
+        self._refill()
+        return self.tokens >= self.burst
 
-        return all_correct, correct_count, elapsed_time
 
-    # Chunk mode
-    all_correct, correct_count = chunk_based_practice(
-        pi_digits,
-        cfg.chunk_size,
-        current_digits,
-        colorblind_mode=cfg.colorblind_mode,
-    )
-    return all_correct, correct_count, None
+@dataclass
+class HttpRequest:
+    """One parsed HTTP request.
 
+    Attributes:
+        method: Request method, e.g. ``"GET"``.
+        path: Path without the query string.
+        query: Query parameters (the last value of repeated ones).
+        headers: Headers by lower-case name.
+        body: Request body.
+        keep_alive: Whether the connection stays open after the response.
+    """
 
-def _update_practice_stats(
-    stats: dict[str, object],
-    session_max_level: int,
-    session_correct_digits: int,
-    session_duration: float,
-    practice_mode: str,
-    elapsed_time: float | None,
-) -> None:
-    """Update and save practice statistics.
+    method: str
+    path: str
+    query: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    keep_alive: bool = True
 
-    Args:
-        stats: Practice statistics dictionary.
-        session_max_level: Maximum level reached in this session.
-        session_correct_digits: Total correct digits in this session.
-        session_duration: Total session duration in seconds.
-        practice_mode: The practice mode used.
-        elapsed_time: Elapsed time for the last level (if applicable).
-    """
-    stats["max_digits"] = max(stats.get("max_digits", 0), session_max_level)
-    stats["total_digits_correct"] = (
-        stats.get("total_digits_correct", 0) + session_correct_digits
-    )
-    stats["total_practice_sessions"] = stats.get("total_practice_sessions", 0) + 1
-    stats["last_session_date"] = time.strftime("%Y-%m-%d %H:%M:%S")
 
-    # Update fastest time for timed mode
-    time_improved = not stats.get("fastest_time") or (
-        elapsed_time is not None
-        and elapsed_time < stats.get("fastest_time", float("inf"))
-    )
-    if practice_mode == "timed" and elapsed_time is not None and time_improved:
-        stats["fastest_time"] = elapsed_time
+class HttpServiceError(Exception):
+    """A request the service answers with an error status."""
 
-    # Add session to history
-    session_record = {
-        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "mode": practice_mode,
-        "max_level": session_max_level,
-        "correct_digits": session_correct_digits,
-        "duration_seconds": round(session_duration),
-    }
+    def __init__(
+        self: HttpServiceError,
+        status: int,
+        message: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize with the HTTP *status* and a *message* for the client."""
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
 
-    if "history" not in stats:
-        stats["history"] = []
 
-    stats["history"].append(session_record)
+async def _read_http_request(
+    reader: asyncio.StreamReader,
+    max_body: int,
+) -> HttpRequest | None:
+    """Read one request, or None if the client closed the connection.
 
-    # Limit history to last 100 sessions
-    max_history = 100
-    if len(stats["history"]) > max_history:
-        stats["history"] = stats["history"][-max_history:]
+    Raises:
+        HttpServiceError: If the request is malformed or too large.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError as e:
+        raise HttpServiceError(431, "Request header is too large") from e
 
-    save_practice_stats(stats)
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = request_line.split(" ")
+    except ValueError as e:
+        raise HttpServiceError(400, "Malformed request line") from e
+    if version not in {"HTTP/1.0", "HTTP/1.1"}:
+        raise HttpServiceError(505, f"Unsupported protocol {version}")
+    headers = {}
+    for line in filter(None, header_lines):
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise HttpServiceError(400, "Malformed header")
+        headers[name.strip().lower()] = value.strip()
+
+    if "transfer-encoding" in headers:
+        raise HttpServiceError(501, "Request bodies need a Content-Length")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError as e:
+        raise HttpServiceError(400, "Malformed Content-Length") from e
+    if length < 0:
+        raise HttpServiceError(400, "Malformed Content-Length")
+    if length > max_body:
+        raise HttpServiceError(413, f"Request body exceeds {max_body} bytes")
+    try:
+        body = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+
+    connection = headers.get("connection", "").lower()
+    url = urlparse.urlsplit(target)
+    return HttpRequest(
+        method=method,
+        path=url.path,
+        query=dict(urlparse.parse_qsl(url.query)),
+        headers=headers,
+        body=body,
+        keep_alive=(
+            connection != "close"
+            if version == "HTTP/1.1"
+            else connection == "keep-alive"
+        ),
+    )
 
 
-def _print_session_summary(
-    stats: dict[str, object],
-    practice_mode: str,
-    session_duration: float,
-    session_correct_digits: int,
-    session_max_level: int,
-) -> None:
-    """Print summary of practice session.
+def _http_response(
+    status: int,
+    payload: dict[str, object] | bytes,
+    *,
+    keep_alive: bool,
+    headers: dict[str, str] | None = None,
+) -> bytes:
+    """Encode a response; a JSON *payload* may be encoded already.
 
-    Args:
-        stats: Practice statistics dictionary.
-        practice_mode: The practice mode used.
-        session_duration: Total session duration in seconds.
-        session_correct_digits: Total correct digits in this session.
-        session_max_level: Maximum level reached in this session.
+    A ``Content-Type`` in *headers* replaces the JSON default.
     """
-    print("\n=== Session Summary ===")
-    print(f"Mode: {practice_mode}")
-    print(
-        f"Time: {round(session_duration // 60)} min {round(session_duration % 60)} sec",
+    body = (
+        payload
+        if isinstance(payload, bytes)
+        else json.dumps(payload, separators=(",", ":")).encode()
     )
-    print(f"Digits correct: {session_correct_digits}")
-    print(f"Maximum level: {session_max_level}")
-    print(f"All-time best: {stats['max_digits']} digits")
-
-    if practice_mode == "timed" and session_correct_digits > 0:
-        speed = (session_correct_digits / session_duration) * 60
-        print(f"Average speed: {speed:.1f} digits/minute")
-        print(f"All-time best speed: {stats.get('best_speed', 0):.1f} digits/minute")
+    extra = {"Content-Type": "application/json", **(headers or {})}
+    lines = [
+        f"HTTP/1.1 {status} {http.HTTPStatus(status).phrase}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    lines.extend(f"{name}: {value}" for name, value in extra.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def _observe_http_request(path: str, status: int, seconds: float) -> None:
+    """Count one answered request and record how long it took."""
+    if path not in SERVE_ROUTES and path != SERVE_METRICS_PATH:
+        path = "other"
+    METRICS.counter(
+        "pigame_http_requests_total",
+        "HTTP requests answered, by path and status.",
+        path=path,
+        status=str(status),
+    ).inc()
+    METRICS.histogram(
+        "pigame_http_request_seconds",
+        "Time taken to answer HTTP requests.",
+        path=path,
+    ).observe(seconds)
+
+
+def _error_payload(error_type: str, message: str) -> dict[str, object]:
+    """Return the body of an error response."""
+    return {"error": {"type": error_type, "message": message}}
+
+
+def _operation_response(
+    request: dict[str, object],
+) -> tuple[int, dict[str, object] | bytes]:
+    """Run one operation for the HTTP service and return (status, payload).
+
+    Digits come encoded from ``OUTPUT_CACHE``, which is not thread-safe, so
+    run ``digits`` requests on the event loop only.
+    """
+    if request["op"] == "digits":
+        try:
+            return 200, digits_output(*_digits_arguments(request), fmt="json")
+        except (PiError, TypeError, ValueError) as e:
+            return 400, _error_payload(type(e).__name__, str(e))
+    response = handle_request(request)
+    if not response["ok"]:
+        return 400, {"error": response["error"]}
+    return 200, response["result"]
 
 
-def standard_practice(
-    pi_digits: str,
-    current_digits: int,
-    *,
-    colorblind_mode: bool = False,
-    visual_aid: bool = False,
-) -> tuple[bool, int]:
-    """Implement standard digit-by-digit practice strategy.
+def _request_arguments(request: HttpRequest) -> dict[str, object]:
+    """Collect an HTTP request's operation arguments.
 
-    Args:
-        pi_digits: String containing the digits of pi
-        current_digits: Current level (total digits to practice)
-        colorblind_mode: Whether to use colorblind-friendly colors
-        visual_aid: Whether to show visual progress indicators
+    Query parameters named like integer arguments are converted; a POST
+    body must be a JSON object and overrides the query.
 
-    Returns:
-        Tuple of (all_correct, correct_digits_count)
+    Raises:
+        ValueError: If a parameter or the body cannot be decoded.
+    """
+    arguments: dict[str, object] = {}
+    for name, value in request.query.items():
+        if name in SERVE_INTEGER_ARGUMENTS:
+            try:
+                arguments[name] = int(value)
+            except ValueError:
+                msg = f"{name!r} must be an integer"
+                raise ValueError(msg) from None
+        else:
+            arguments[name] = value
+    if request.method == "POST" and request.body:
+        body = json.loads(request.body)
+        if not isinstance(body, dict):
+            msg = "Request bodies must be JSON objects"
+            raise ValueError(msg)
+        arguments.update(body)
+    return arguments
+
+
+def _request_cost(arguments: dict[str, object]) -> int:
+    """Return a request's cost: 1 plus 1 per SERVE_COST_DIGITS digits."""
+    size = 0
+    for name in ("answer", "digits"):
+        if isinstance(arguments.get(name), str):
+            size = max(size, len(arguments[name]))
+    for name in SERVE_INTEGER_ARGUMENTS:
+        if isinstance(arguments.get(name), int):
+            size = max(size, arguments[name])
+    return 1 + size // SERVE_COST_DIGITS
+
+
+class ScoringService:
+    """Serve the library API over HTTP/1.1 with rate limits and admission control.
+
+    Requests are handled on one asyncio event loop.  Costly ones run on a
+    thread pool of *workers* threads, and at most *max_cost* worth of
+    requests is in flight at once; beyond that clients get 503 and retry.
+    The digit strings are module data shared by every request.
     """
-    all_correct = True
-    correct_digits = 0
 
-    # Print the first 2 characters (3.)
-    sys.stdout.write("3.")
-    sys.stdout.flush()
+    def __init__(
+        self: ScoringService,
+        *,
+        rate: float = SERVE_RATE,
+        burst: float = SERVE_BURST,
+        max_cost: int = SERVE_MAX_COST,
+        workers: int = SERVE_WORKERS,
+        max_body: int = SERVE_MAX_BODY,
+        idle_timeout: float = SERVE_IDLE_SECONDS,
+    ) -> None:
+        """Initialize the service.
 
-    # Process each digit after the decimal point
-    for i, correct_digit in enumerate(pi_digits[2 : current_digits + 2]):
-        # Show progress bar if visual aid is enabled
-        if visual_aid and i % 3 == 0:  # Update every few digits to avoid flicker
-            total_digits = current_digits
-            sys.stdout.write("\033[s\033[2;1H")  # Save cursor and move to line 2
-            display_progress_bar(i, total_digits)
-            sys.stdout.write("\033[u")  # Restore cursor
+        Args:
+            rate: Cost each client may spend per second.
+            burst: Cost each client may spend at once.
+            max_cost: Cost of the requests in flight that fills the service.
+            workers: Threads running costly requests.
+            max_body: Largest request body accepted, in bytes.
+            idle_timeout: Seconds an idle kept-alive connection stays open.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_cost = max_cost
+        self.max_body = max_body
+        self.idle_timeout = idle_timeout
+        self.server: asyncio.AbstractServer | None = None
+        self.cost_in_flight = 0
+        self._buckets: dict[str, TokenBucket] = {}
+        self._connections: set[asyncio.StreamWriter] = set()
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="pigame-serve"
+        )
 
-        # Get input for this digit (non-blocking)
-        digit = input_digit()
+    async def start(
+        self: ScoringService,
+        host: str = "127.0.0.1",
+        port: int = SERVE_DEFAULT_PORT,
+    ) -> asyncio.AbstractServer:
+        """Listen on *host*:*port* (port 0 picks a free port)."""
+        self.server = await asyncio.start_server(
+            self._serve_client, host, port, limit=SERVE_MAX_HEADER
+        )
+        return self.server
+
+    @property
+    def port(self: ScoringService) -> int:
+        """The TCP port the service listens on."""
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self: ScoringService) -> None:
+        """Stop listening, close open connections and stop the thread pool."""
+        self.server.close()
+        for writer in self._connections:
+            writer.close()
+        await self.server.wait_closed()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def respond(
+        self: ScoringService,
+        request: HttpRequest,
+        client: str = "local",
+    ) -> tuple[int, dict[str, object] | bytes, dict[str, str]]:
+        """Answer one request from *client*.
+
+        Returns:
+            The status, the JSON payload (as an object or encoded) and any
+            extra headers.
+        """
+        if request.path == SERVE_METRICS_PATH and request.method == "GET":
+            metrics = METRICS.render().encode()
+            return 200, metrics, {"Content-Type": PROMETHEUS_CONTENT_TYPE}
+        op = SERVE_ROUTES.get(request.path)
+        if op is None:
+            return 404, _error_payload("NotFound", f"No endpoint {request.path}"), {}
+        if request.method not in {"GET", "POST"}:
+            message = f"Method {request.method} not allowed"
+            return (
+                405,
+                _error_payload("MethodNotAllowed", message),
+                {"Allow": "GET, POST"},
+            )
+        try:
+            arguments = _request_arguments(request)
+        except ValueError as e:
+            return 400, _error_payload(type(e).__name__, str(e)), {}
 
-        # Check if digit is correct
-        if digit == correct_digit:
-            correct_digits += 1
+        cost = min(_request_cost(arguments), self.burst)
+        rejection = self._admit(client, cost)
+        if rejection is not None:
+            return rejection
 
-            # Show correct digit in green
-            if colorblind_mode:
-                sys.stdout.write(f"\033[38;5;34m{digit}\033[0m")
-            else:
-                sys.stdout.write(f"\033[92m{digit}\033[0m")
-        else:
-            # Show incorrect digit in red/orange
-            if colorblind_mode:
-                sys.stdout.write(f"\033[38;5;208m{digit}\033[0m")
+        request_body = {**arguments, "op": op}
+        self.cost_in_flight += cost
+        try:
+            # Digits are a lookup in the output cache, kept on the event loop
+            if cost >= SERVE_OFFLOAD_COST and op != "digits":
+                loop = asyncio.get_running_loop()
+                status, payload = await loop.run_in_executor(
+                    self._executor, _operation_response, request_body
+                )
             else:
-                sys.stdout.write(f"\033[91m{digit}\033[0m")
+                status, payload = _operation_response(request_body)
+        finally:
+            self.cost_in_flight -= cost
+        return status, payload, {}
+
+    def _admit(
+        self: ScoringService,
+        client: str,
+        cost: float,
+    ) -> tuple[int, dict[str, object], dict[str, str]] | None:
+        """Return the response refusing a request, or None to run it."""
+        # A lone request is always admitted, however costly
+        if self.cost_in_flight and self.cost_in_flight + cost > self.max_cost:
+            message = "Service is busy; retry shortly"
+            return 503, _error_payload("Overloaded", message), {"Retry-After": "1"}
+        wait = self._bucket(client).take(cost)
+        if wait:
+            message = f"Rate limit exceeded; retry in {wait:.1f} s"
+            retry = {"Retry-After": str(math.ceil(wait))}
+            return 429, _error_payload("RateLimited", message), retry
+        return None
+
+    def _bucket(self: ScoringService, client: str) -> TokenBucket:
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            if len(self._buckets) >= SERVE_MAX_CLIENTS:
+                # Forget clients whose buckets have refilled; they lose nothing
+                self._buckets = {
+                    name: kept
+                    for name, kept in self._buckets.items()
+                    if not kept.full()
+                }
+            bucket = self._buckets[client] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    async def _serve_client(
+        self: ScoringService,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self._connections.add(writer)
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if isinstance(peer, tuple) else "local"
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(
+                        _read_http_request(reader, self.max_body), self.idle_timeout
+                    )
+                except HttpServiceError as e:
+                    writer.write(
+                        _http_response(
+                            e.status,
+                            _error_payload("BadRequest", str(e)),
+                            keep_alive=False,
+                            headers=e.headers,
+                        )
+                    )
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                keep_alive = request.keep_alive
+                start = time.perf_counter()
+                status, payload, headers = await self.respond(request, client)
+                _observe_http_request(request.path, status, time.perf_counter() - start)
+                writer.write(
+                    _http_response(
+                        status, payload, keep_alive=keep_alive, headers=headers
+                    )
+                )
+                await writer.drain()
+        except (TimeoutError, ConnectionError):
+            logger.debug("HTTP connection from %s closed", client, exc_info=True)
+        finally:
+            self._connections.discard(writer)
+            writer.close()
 
-            # Restore terminal settings for proper printing
-            termios.tcsetattr(
-                sys.stdin.fileno(),
-                termios.TCSADRAIN,
-                termios.tcgetattr(sys.stdin.fileno()),
-            )
 
-            # Show the correct digit
-            print(f" ✗ Correct: {correct_digit}")
-            all_correct = False
-            return all_correct, correct_digits
+def run_http_service(
+    *,
+    host: str = "127.0.0.1",
+    port: int = SERVE_DEFAULT_PORT,
+    rate: float = SERVE_RATE,
+    burst: float = SERVE_BURST,
+    workers: int = SERVE_WORKERS,
+) -> None:
+    """Serve the library API over HTTP until interrupted.
 
-        # Add spacing for readability
-        if (i + 1) % 5 == 0:
-            sys.stdout.write(" ")
+    Args:
+        host: Address to listen on (default: localhost only).
+        port: TCP port to listen on.
+        rate: Cost each client may spend per second.
+        burst: Cost each client may spend at once.
+        workers: Threads running costly requests.
+    """
 
-        sys.stdout.flush()
+    async def serve() -> None:
+        service = ScoringService(rate=rate, burst=burst, workers=workers)
+        server = await service.start(host, port)
+        print(f"Serving pigame on http://{host}:{service.port}/", flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await service.close()
 
-    # Clear progress bar if used
-    if visual_aid:
-        sys.stdout.write("\033[2;1H\033[K")  # Move to line 2 and clear
-        sys.stdout.flush()
+    asyncio.run(serve())
 
-    return all_correct, correct_digits
 
+# ---------------------------------------------------------------------------
+# Command daemon - pigame commands run in forks of one warm process
+#
+# A client connects to the daemon's Unix socket and sends one JSON line,
+# {"argv", "cwd", "env"}, together with its stdin, stdout and stderr file
+# descriptors.  The daemon forks; the child takes over those descriptors,
+# runs the command as `pigame ARGV` would and writes its exit status back
+# as one line.  Data (or end of file) from the client while the command
+# runs interrupts it, as Ctrl-C would.
+# ---------------------------------------------------------------------------
 
-def practice_mode(  # noqa: PLR0913
-    *,
-    colorblind_mode: bool = False,
-    mode: str | None = None,
-    min_digits: int | None = None,
-    max_digits: int | None = None,
-    chunk_size: int | None = None,
-    time_limit: int | None = None,
-    visual_aid: bool | None = None,
-) -> None:
-    """Interactive practice mode for memorizing π digits.
 
-    Args:
-        colorblind_mode: Whether to use colorblind-friendly colors
-        mode: Practice mode (standard, timed, chunk)
-        min_digits: Minimum number of digits to start with
-        max_digits: Maximum number of digits to practice
-        chunk_size: Size of chunks for chunk mode
-        time_limit: Time limit in seconds for timed mode
-        visual_aid: Whether to show visual progress indicators
+def daemon_socket_file() -> Path:
+    """Return the command daemon's socket path.
+
+    ``$PIGAME_SOCKET`` if set, else ``pigame.sock`` in ``$XDG_RUNTIME_DIR``,
+    else in ``~/.pigame``.
     """
-    print("\n🔢 PIGAME PRACTICE MODE 🔢")
-    print("=========================\n")
+    if path := os.environ.get("PIGAME_SOCKET"):
+        return Path(path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    return (Path(runtime_dir) if runtime_dir else PRACTICE_CONFIG_DIR) / "pigame.sock"
 
-    # Load configuration and stats
-    cfg = _load_practice_config_settings(
-        colorblind_mode=colorblind_mode,
-        mode=mode,
-        min_digits=min_digits,
-        max_digits=max_digits,
-        chunk_size=chunk_size,
-        time_limit=time_limit,
-        visual_aid=visual_aid,
+
+def _read_forwarded_command(
+    conn: socket.socket,
+) -> tuple[dict[str, object], list[int]]:
+    """Receive a client's command and standard stream descriptors.
+
+    Raises:
+        ValueError: If the request is malformed or lacks the descriptors.
+    """
+    data, fds, _flags, _address = socket.recv_fds(conn, DAEMON_MAX_REQUEST, 3)
+    try:
+        while data and not data.endswith(b"\n") and len(data) < DAEMON_MAX_REQUEST:
+            chunk = conn.recv(DAEMON_MAX_REQUEST)
+            if not chunk:
+                break
+            data += chunk
+        request = json.loads(data)
+        if not isinstance(request, dict) or len(fds) != len(DAEMON_STREAMS):
+            msg = "Expected a JSON object and three file descriptors"
+            raise ValueError(msg)  # noqa: TRY301
+    except ValueError:
+        for fd in fds:
+            os.close(fd)
+        raise
+    return request, fds
+
+
+def _relocate_practice_files(config_dir: Path) -> None:
+    """Move the practice file paths (fixed at import) under *config_dir*."""
+    names = (
+        "PRACTICE_STATS_FILE",
+        "PRACTICE_CONFIG_FILE",
+        "PRACTICE_REVIEW_FILE",
+        "PRACTICE_SESSIONS_DIR",
+        "RACE_SOCKET_FILE",
     )
-    stats = load_practice_stats()
+    paths = globals()
+    for name in names:
+        paths[name] = config_dir / paths[name].relative_to(PRACTICE_CONFIG_DIR)
+    paths["PRACTICE_CONFIG_DIR"] = config_dir
 
-    # Print instructions and header
-    _print_practice_instructions(cfg)
-    current_digits = _get_starting_digits(stats, cfg.min_digits, cfg.max_digits)
-    _print_practice_header(stats, current_digits)
 
-    # Get pi digits
-    pi_digits = calculate_pi(current_digits)
+def _interrupt_on_client_input(conn: socket.socket) -> None:
+    """Raise KeyboardInterrupt in the command once the client speaks or leaves."""
+    with contextlib.suppress(OSError):
+        conn.recv(1)
+    os.kill(os.getpid(), signal.SIGINT)
 
-    try:
-        # Track session stats
-        session_start_time = time.time()
-        session_correct_digits = 0
-        session_max_level = stats.get("max_digits", 0)
-        elapsed_time = None
 
-        # Show reference digits
-        _show_reference_digits(cfg.mode, pi_digits, current_digits)
+def _run_forwarded_command(
+    conn: socket.socket,
+    request: dict[str, object],
+    fds: list[int],
+) -> int:
+    """Run a forwarded command in a forked child and report its status.
 
-        # Start practice session
-        while current_digits <= cfg.max_digits:
-            print(f"\n--- Level: {current_digits} digits ---")
+    Returns:
+        The command's exit status.
+    """
+    # Leave the daemon's session so the client's terminal can be used freely
+    os.setsid()
+    for target, fd in zip(DAEMON_STREAMS, fds, strict=True):
+        os.dup2(fd, target)
+        os.close(fd)
+    sys.stdin = open(0, closefd=False)  # noqa: SIM115
+    sys.stdout = open(1, "w", buffering=1 if os.isatty(1) else -1, closefd=False)  # noqa: SIM115
+    sys.stderr = open(2, "w", buffering=1, closefd=False)  # noqa: SIM115
+    os.chdir(request.get("cwd") or "/")
+    os.environ.clear()
+    os.environ.update(request.get("env") or {})
+    # Practice files belong under the client's home, not the daemon's
+    _relocate_practice_files(Path.home() / ".pigame")
+    logger.setLevel(
+        logging.DEBUG if os.environ.get("PIGAME_DEBUG") else logging.WARNING
+    )
+    sys.argv = ["pigame", *request.get("argv", [])]
 
-            # Run practice strategy
-            all_correct, correct_count, elapsed_time = _run_practice_strategy(
-                cfg,
-                pi_digits,
-                current_digits,
-                stats,
-            )
-            session_correct_digits += correct_count
+    threading.Thread(
+        target=_interrupt_on_client_input, args=(conn,), daemon=True
+    ).start()
+    try:
+        main()
+        status = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            status = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            status = 1
+    except KeyboardInterrupt:
+        status = 130
+    except Exception:  # noqa: BLE001 - reported like an uncaught exception
+        sys.excepthook(*sys.exc_info())
+        status = 1
+    # The command is over; a late interrupt must not outlive it
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for stream in (sys.stdout, sys.stderr):
+        with contextlib.suppress(OSError, ValueError):
+            stream.flush()
+    with contextlib.suppress(OSError):
+        conn.sendall(f"{status}\n".encode())
+    return status
+
+
+def _serve_forwarded_connection(conn: socket.socket) -> int:
+    """Read and run one client's command in a forked child.
 
-            # End of level processing
-            if all_correct:
-                print("\n\n🎉 Perfect! Moving to next level.")
-                current_digits += 1
+    Returns:
+        The command's exit status.
+    """
+    for signum in (signal.SIGCHLD, signal.SIGTERM):
+        signal.signal(signum, signal.SIG_DFL)
+    # A client that never sends its command only holds up this child
+    conn.settimeout(DAEMON_READ_TIMEOUT)
+    try:
+        request, fds = _read_forwarded_command(conn)
+    except (OSError, ValueError):
+        logger.debug("Dropped a malformed command", exc_info=True)
+        return 1
+    conn.settimeout(None)
+    try:
+        return _run_forwarded_command(conn, request, fds)
+    except Exception:
+        logger.exception("Cannot run a forwarded command")
+        return 1
 
-                # Update max level if improved
-                if current_digits > session_max_level:
-                    session_max_level = current_digits - 1
 
-                # Update pi_digits if needed
-                if current_digits > len(pi_digits) - 2:
-                    pi_digits = calculate_pi(current_digits)
+def _preload_daemon() -> None:
+    """Import every deferred module and build the digit buffers once.
 
-                time.sleep(1)
-            else:
-                print("\n\nTry again for this level.")
-                time.sleep(1)
+    Children inherit them, so no command pays for an import.
+    """
+    for value in list(globals().values()):
+        if isinstance(value, _LazyModule):
+            getattr(value, "__name__")  # noqa: B009 - imports the module
+    for name in MATHEMATICAL_CONSTANTS:
+        _digit_buffer(name)
+    get_version()
 
-        # Reached maximum difficulty
-        print("\n🏆 Congratulations! You've reached the maximum level!")
 
-    except KeyboardInterrupt:
-        # Restore terminal settings
-        termios.tcsetattr(
-            sys.stdin.fileno(),
-            termios.TCSADRAIN,
-            termios.tcgetattr(sys.stdin.fileno()),
-        )
-        print("\n\nPractice session ended.")
+def run_command_daemon(socket_path: Path | None = None) -> None:
+    """Serve forwarded pigame commands on a Unix socket until interrupted.
 
-    # Update and save stats
-    session_duration = time.time() - session_start_time
-    _update_practice_stats(
-        stats,
-        session_max_level,
-        session_correct_digits,
-        session_duration,
-        cfg.mode,
-        elapsed_time,
-    )
+    Args:
+        socket_path: Socket to listen on (default: :func:`daemon_socket_file`).
 
-    # Show session summary
-    _print_session_summary(
-        stats,
-        cfg.mode,
-        session_duration,
-        session_correct_digits,
-        session_max_level,
-    )
+    Raises:
+        OSError: If the socket cannot be created or a daemon already listens.
+    """
+    path = socket_path or daemon_socket_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        if probe.connect_ex(str(path)) == 0:
+            msg = f"A pigame daemon is already listening on {path}"
+            raise OSError(msg)
+    path.unlink(missing_ok=True)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Only this user may connect: commands run with the daemon's rights
+    umask = os.umask(0o177)
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(umask)
+    server.listen()
+    # Children are never waited for; the kernel reaps them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    # Stop cleanly (removing the socket) when terminated
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    _preload_daemon()
+    print(f"pigame daemon listening on {path}", flush=True)
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                # Fork before reading, so a slow client never stalls the loop
+                if os.fork() == 0:
+                    status = 1
+                    try:
+                        server.close()
+                        status = _serve_forwarded_connection(conn)
+                    finally:
+                        os._exit(status)
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
 
 
 def input_digit() -> str:
@@ -1665,8 +6908,8 @@ def _create_argument_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--practice-mode",
-        choices=["standard", "timed", "chunk"],
-        help="Set practice mode (standard, timed, chunk).",
+        choices=PRACTICE_MODES,
+        help="Set practice mode (" + ", ".join(PRACTICE_MODES) + ").",
     )
     parser.add_argument(
         "--min-digits",
@@ -1689,19 +6932,96 @@ def _create_argument_parser() -> argparse.ArgumentParser:
         help="Time limit in seconds for timed practice mode.",
     )
     parser.add_argument(
-        "--visual-aid",
-        action="store_true",
-        help="Enable visual progress indicators in practice mode.",
+        "--from-position",
+        type=int,
+        metavar="N",
+        help="Skip the first N decimals and practise from digit N+1 onwards.",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        metavar="K",
+        help="Practise at most K digits per level after --from-position.",
+    )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="Find your current frontier in a few levels before practising.",
+    )
+    parser.add_argument(
+        "--visual-aid",
+        action="store_true",
+        help="Enable visual progress indicators in practice mode.",
+    )
+    parser.add_argument(
+        "--no-visual-aid",
+        action="store_true",
+        help="Disable visual progress indicators in practice mode.",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help=(
+            "Record every practice keystroke to ~/.pigame/sessions/.\n"
+            "Replay or re-score a recording with: pigame replay FILE"
+        ),
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        metavar="FILE",
+        help=(
+            "Run a practice session headlessly from a keystroke script.\n"
+            "Each line holds KEYS [DELAY]; statistics are not saved."
+        ),
+    )
+    parser.add_argument(
+        "--ui",
+        choices=list(PRACTICE_VIEWS),
+        help=(
+            "Practice front end (default: ansi on a terminal, plain otherwise).\n"
+            "curses: full-screen UI that scrolls long levels and survives resizes\n"
+            "plain, ndjson: text or JSON events for pipes and sockets"
+        ),
+    )
+    parser.add_argument(
+        "--input-fd",
+        type=int,
+        metavar="FD",
+        help="Read practice digits from file descriptor FD instead of the terminal.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Show your practice statistics.",
+    )
+    parser.add_argument(
+        "--since",
+        type=_iso_date,
+        metavar="YYYY-MM-DD",
+        help="With --stats, only count sessions on or after this date.",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=PRACTICE_MODES,
+        help="With --stats, only count sessions of this practice mode.",
     )
     parser.add_argument(
-        "--no-visual-aid",
+        "--profile",
+        type=_profile_name,
+        metavar="NAME",
+        help="Practise, configure and show statistics as profile NAME "
+        "(for machines shared by several people).",
+    )
+    parser.add_argument(
+        "--profiles",
         action="store_true",
-        help="Disable visual progress indicators in practice mode.",
+        help="List the profiles on this machine, best first (see --constant).",
     )
     parser.add_argument(
-        "--stats",
+        "--migrate-stats",
         action="store_true",
-        help="Show your practice statistics.",
+        help="Move practice statistics into an SQLite database for history queries.",
     )
     parser.add_argument(
         "--config",
@@ -1724,6 +7044,22 @@ def _create_argument_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Show available constants with descriptions and exit.",
     )
+    parser.add_argument(
+        "--serve-stdio",
+        action="store_true",
+        help=(
+            "Answer newline-delimited JSON requests (score, digits, format)\n"
+            "on stdin, one response line each on stdout, until stdin ends."
+        ),
+    )
+    parser.add_argument(
+        "--metrics-dump",
+        action="store_true",
+        help=(
+            "Write the run's metrics to stderr, in Prometheus text format,\n"
+            "when the command finishes."
+        ),
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -1738,26 +7074,142 @@ def _create_argument_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _handle_stats_display() -> None:
-    """Display practice statistics and exit."""
-    stats = load_practice_stats()
-    print("\n=== PIGAME Practice Statistics ===")
-    print(f"Total practice sessions: {stats.get('total_practice_sessions', 0)}")
-    print(f"Total correct digits entered: {stats.get('total_digits_correct', 0)}")
-    print(f"Best level reached: {stats.get('max_digits', 0)} digits")
-    print(f"Last session: {stats.get('last_session_date', 'Never')}")
+# Every option's value when not given, as the full parser sets them
+_ARGUMENT_DEFAULTS = {
+    "v": False,
+    "p": None,
+    "V": False,
+    "c": False,
+    "practice": False,
+    "practice_mode": None,
+    "min_digits": None,
+    "max_digits": None,
+    "chunk_size": None,
+    "time_limit": None,
+    "from_position": None,
+    "window": None,
+    "calibrate": False,
+    "visual_aid": False,
+    "no_visual_aid": False,
+    "record": False,
+    "replay": None,
+    "ui": None,
+    "input_fd": None,
+    "stats": False,
+    "since": None,
+    "mode": None,
+    "profile": None,
+    "profiles": False,
+    "migrate_stats": False,
+    "config": False,
+    "constant": "pi",
+    "list": False,
+    "serve_stdio": False,
+    "metrics_dump": False,
+    "debug": False,
+    "YOUR_PI": None,
+}
 
-    # Show speed stats if available
-    if stats.get("best_speed"):
-        print(f"Best speed: {stats.get('best_speed', 0):.1f} digits/minute")
-    if stats.get("fastest_time"):
-        mins, secs = divmod(int(stats.get("fastest_time")), 60)
-        print(f"Fastest time: {mins}m {secs}s")
+# Flags the fast path recognises, and the argument each one sets
+_FAST_PATH_FLAGS = {"-v": "v", "-c": "c", "-V": "V", "--debug": "debug"}
+
+
+def _parse_fast_path(argv: list[str]) -> types.SimpleNamespace | None:
+    """Parse the common command lines without building the full parser.
+
+    Checking digits (``YOUR_PI``), printing them (``-p N``) and the ``-v``,
+    ``-c`` and ``--constant X`` options that go with them are recognised
+    here, so they neither import :mod:`argparse` nor build its parser.
+
+    Args:
+        argv: Command-line arguments, without the program name.
+
+    Returns:
+        The arguments as the full parser would parse them, or None if *argv*
+        needs the full parser (practice, configuration, help, errors, ...).
+    """
+    args = types.SimpleNamespace(**_ARGUMENT_DEFAULTS)
+    remaining = iter(argv)
+    for arg in remaining:
+        if arg in _FAST_PATH_FLAGS:
+            setattr(args, _FAST_PATH_FLAGS[arg], True)
+        elif arg in ("-p", "--constant"):
+            value = next(remaining, None)
+            if value is None or value.startswith("-"):
+                return None
+            if arg == "-p":
+                args.p = value
+            elif value in MATHEMATICAL_CONSTANTS:
+                args.constant = value
+            else:
+                return None
+        elif arg.startswith("-p") and not arg.startswith("-p="):
+            args.p = arg[2:]
+        elif not arg.startswith("-") and args.YOUR_PI is None:
+            args.YOUR_PI = arg
+        else:
+            return None
+    return args
+
+
+def _handle_stats_display(
+    constant: str = "pi",
+    profile: str | None = None,
+    *,
+    since: str | None = None,
+    mode: str | None = None,
+) -> None:
+    """Display practice statistics and exit.
+
+    Everything shown comes from the totals, the rollups and the recent
+    sessions, so the cost does not grow with the length of the history.
+
+    Args:
+        constant: Constant whose statistics to show.
+        profile: Profile whose statistics to show.
+        since: Only count sessions on or after this date (``YYYY-MM-DD``).
+        mode: Only count sessions of this practice mode.
+    """
+    stats = load_practice_stats(constant, profile)
+    heading = "PIGAME Practice Statistics"
+    if constant != "pi":
+        heading += f" ({MATHEMATICAL_CONSTANTS[constant]['symbol']})"
+    if profile is not None:
+        heading += f" - {profile}"
+    filters = [f"since {since}"] if since is not None else []
+    if mode is not None:
+        filters.append(mode)
+    if filters:
+        heading += f" [{', '.join(filters)}]"
+    print(f"\n=== {heading} ===")
+
+    if filters:
+        summary = summarize_practice_stats(stats, since=since, mode=mode)
+        mins, secs = divmod(summary["seconds"], 60)
+        print(f"Practice sessions: {summary['sessions']}")
+        print(f"Correct digits entered: {summary['digits']}")
+        print(f"Best level reached: {summary['best']} digits")
+        print(f"Practice time: {mins}m {secs}s")
+    else:
+        _print_stats_totals(stats)
+        summary = summarize_practice_stats(stats)
+
+    if summary["speed_p50"] is not None:
+        print(
+            f"Speed: median {summary['speed_p50']:.1f}, "
+            f"90th percentile {summary['speed_p90']:.1f} digits/minute",
+        )
 
     # Show recent history if available
-    if stats.get("history"):
+    recent = [
+        session
+        for session in stats.get("history", [])
+        if (since is None or session["date"] >= since)
+        and (mode is None or session.get("mode") == mode)
+    ]
+    if recent:
         print("\nRecent sessions:")
-        for i, session in enumerate(reversed(stats.get("history", []))[:5]):
+        for i, session in enumerate(recent[:-6:-1]):
             mode_str = (
                 f"[{session.get('mode', 'standard')}] " if "mode" in session else ""
             )
@@ -1771,31 +7223,187 @@ def _handle_stats_display() -> None:
     print("=================================")
 
 
-def _handle_pi_calculation(args: argparse.Namespace) -> tuple[int, str]:
+def _print_stats_totals(stats: dict[str, object]) -> None:
+    """Print the all-time totals and this week's practice."""
+    print(f"Total practice sessions: {stats.get('total_practice_sessions', 0)}")
+    print(f"Total correct digits entered: {stats.get('total_digits_correct', 0)}")
+    print(f"Best level reached: {stats.get('max_digits', 0)} digits")
+    print(f"Last session: {stats.get('last_session_date', 'Never')}")
+
+    # Show speed stats if available
+    if stats.get("best_speed"):
+        print(f"Best speed: {stats.get('best_speed', 0):.1f} digits/minute")
+    if stats.get("fastest_time"):
+        mins, secs = divmod(int(stats.get("fastest_time")), 60)
+        print(f"Fastest time: {mins}m {secs}s")
+
+    today = dt.date.fromisoformat(time.strftime("%Y-%m-%d"))
+    monday = today - dt.timedelta(days=today.weekday())
+    week = summarize_practice_stats(stats, since=monday.isoformat())
+    print(f"This week: {week['sessions']} sessions, {week['digits']} correct digits")
+
+
+def _handle_profiles_display(constant: str = "pi") -> None:
+    """Display every profile's best results for a constant.
+
+    Args:
+        constant: Constant to compare the profiles on.
+    """
+    board = profile_leaderboard(constant)
+    if not board:
+        print("No profiles yet. Start one with: pigame --practice --profile NAME")
+        return
+
+    symbol = MATHEMATICAL_CONSTANTS[constant]["symbol"]
+    print(f"\n=== PIGAME Profiles ({symbol}) ===")
+    for rank, entry in enumerate(board, start=1):
+        speed = (
+            f", best speed {entry['best_speed']:.1f} digits/minute"
+            if entry["best_speed"]
+            else ""
+        )
+        print(
+            f"  {rank:2d}. {entry['profile']:16s} {entry['max_digits']} digits"
+            f" ({entry['total_practice_sessions']} sessions{speed})",
+        )
+    print("=================================")
+
+
+def _iso_date(value: str) -> str:
+    """Validate a ``YYYY-MM-DD`` command line argument.
+
+    Raises:
+        argparse.ArgumentTypeError: If *value* is not a valid date.
+    """
+    try:
+        return dt.date.fromisoformat(value).isoformat()
+    except ValueError:
+        msg = f"invalid date {value!r} (use YYYY-MM-DD)"
+        raise argparse.ArgumentTypeError(msg) from None
+
+
+def _profile_name(value: str) -> str | None:
+    """Validate a --profile argument.
+
+    Args:
+        value: The profile name given on the command line.
+
+    Returns:
+        The profile name, or None for the default profile (the OS user's own
+        files).
+
+    Raises:
+        argparse.ArgumentTypeError: If the name is not 1-32 letters, digits,
+            ``.``, ``_`` or ``-``.
+    """
+    if not re.fullmatch(PROFILE_NAME_PATTERN, value):
+        msg = f"invalid profile name {value!r} (use 1-32 letters, digits, . _ -)"
+        raise argparse.ArgumentTypeError(msg)
+    return None if value == DEFAULT_PROFILE else value
+
+
+def _handle_stats_migration() -> NoReturn:
+    """Import the JSON practice statistics into the SQLite store and exit."""
+    try:
+        count = migrate_practice_stats()
+    except FileExistsError:
+        print(f"Statistics are already stored in {_stats_db_file()}")
+        sys.exit(1)
+    except sqlite3.Error:
+        logger.exception("Cannot create %s", _stats_db_file())
+        sys.exit(1)
+    print(f"Imported {count} practice sessions into {_stats_db_file()}")
+    sys.exit(0)
+
+
+def _handle_list_display() -> None:
+    """Display the available mathematical constants."""
+    print("Available mathematical constants:\n")
+    for key, meta in MATHEMATICAL_CONSTANTS.items():
+        max_len = MAX_LENGTH if key == "pi" else MAX_CONSTANT_LENGTH
+        print(f"  {meta['symbol']:3s}  {meta['name']:20s}  --constant {key}")
+        print(f"       {meta['description']}")
+        print(f"       Up to {max_len} decimal places available.\n")
+
+
+def _handle_practice(args: argparse.Namespace) -> None:
+    """Run practice mode from the terminal, a stream or a --replay script.
+
+    Args:
+        args: Parsed command line arguments.
+    """
+    if args.input_fd is not None:
+        source = StreamInputSource(args.input_fd)
+        practice_mode(**_practice_mode_options(args), source=source)
+        return
+    if not args.replay:
+        practice_mode(**_practice_mode_options(args))
+        return
+
+    try:
+        source = ScriptedInputSource.from_file(args.replay)
+    except (OSError, ValueError):
+        logger.exception("Cannot read replay script %s", args.replay)
+        sys.exit(1)
+    practice_mode(**_practice_mode_options(args), source=source, save_stats=False)
+
+
+def _practice_mode_options(args: argparse.Namespace) -> dict[str, object]:
+    """Collect practice_mode keyword arguments from the command line.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Keyword arguments for :func:`practice_mode`.
+    """
+    visual_aid_setting = None
+    if args.visual_aid:
+        visual_aid_setting = True
+    elif args.no_visual_aid or args.replay:
+        visual_aid_setting = False
+
+    return {
+        "colorblind_mode": args.c,
+        "mode": args.practice_mode,
+        "min_digits": args.min_digits,
+        "max_digits": args.max_digits,
+        "chunk_size": args.chunk_size,
+        "time_limit": args.time_limit,
+        "visual_aid": visual_aid_setting,
+        "from_position": args.from_position,
+        "window": args.window,
+        "calibrate": args.calibrate,
+        "constant": args.constant,
+        "profile": args.profile,
+        "record": args.record,
+        "ui": args.ui or (DEFAULT_PRACTICE_UI if sys.stdin.isatty() else "plain"),
+    }
+
+
+def _handle_pi_calculation(args: argparse.Namespace) -> int:
     """Handle the -p option for displaying a mathematical constant.
 
     Args:
         args: Parsed command line arguments.
 
     Returns:
-        Tuple of (length, calculated_constant_string).
+        The number of decimals to compare with.
     """
     if args.p:
         constant_key = getattr(args, "constant", "pi")
-        meta = MATHEMATICAL_CONSTANTS[constant_key]
-        symbol = meta["symbol"]
         length = length_validation(args.p)
-        calculated = calculate_constant(constant_key, length)
-        formatted = format_pi_with_spaces(calculated)
-
-        if args.v:
-            print(f"{symbol} with {length} decimals:\t{formatted}")
-        else:
-            print(formatted)
-
-        return length, calculated
+        try:
+            output = digits_output(
+                length, constant_key, fmt="verbose" if args.v else "grouped"
+            )
+        except PiError as e:
+            logger.error("%s", e)  # noqa: TRY400 - a user error, not a crash
+            sys.exit(1)
+        _write_output(output)
+        return length
 
-    return DEFAULT_LENGTH, ""
+    return DEFAULT_LENGTH
 
 
 def _handle_user_pi_input(
@@ -1812,102 +7420,428 @@ def _handle_user_pi_input(
     if handle_easter_egg(args.YOUR_PI):
         sys.exit(0)
 
-    # Validate input
     try:
-        input_validation(args.YOUR_PI)
-    except ValueError:
+        result = score(
+            args.YOUR_PI,
+            getattr(args, "constant", "pi"),
+            decimals=length if args.p else None,
+        )
+    except InvalidDigitsError:
         logger.exception("Invalid input: %r", args.YOUR_PI)
         sys.exit(1)
+    except PiError as e:
+        logger.error("%s", e)  # noqa: TRY400 - a user error, not a crash
+        sys.exit(1)
 
-    constant_key = getattr(args, "constant", "pi")
-    meta = MATHEMATICAL_CONSTANTS[constant_key]
-    symbol = meta["symbol"]
-    name = meta["name"]
+    print(format_score(result, verbose=args.v, colorblind_mode=args.c))
 
-    # Calculate constant based on user input length or -p option
-    if not args.p:
-        decimals = (
-            len(args.YOUR_PI) - 2
-            if len(args.YOUR_PI) >= MIN_DIGITS_WITH_POINT
-            else len(args.YOUR_PI)
+
+def _replay_command(argv: list[str]) -> int:
+    """Implement ``pigame replay FILE``: re-render or re-score a recording.
+
+    Args:
+        argv: Arguments after ``replay``.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pigame replay",
+        description="Re-render or re-score a recorded practice session.",
+    )
+    parser.add_argument("file", type=Path, help="Session recording (.pgr).")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help=f"Playback speed multiplier, 1 to {MAX_REPLAY_SPEED:g} (default: 1).",
+    )
+    parser.add_argument(
+        "--score",
+        action="store_true",
+        help="Only re-score the session, without rendering it.",
+    )
+    parser.add_argument("-c", action="store_true", help="Color-blind mode.")
+    args = parser.parse_args(argv)
+
+    try:
+        summary = replay_session(
+            args.file,
+            speed=args.speed,
+            score_only=args.score,
+            colorblind_mode=args.c,
         )
-        calculated = calculate_constant(constant_key, decimals)
-    else:
-        decimals = length
-        calculated = calculate_constant(constant_key, decimals)
+    except (OSError, ValueError):
+        logger.exception("Cannot replay %s", args.file)
+        return 1
 
-    print_results(
-        user_pi=args.YOUR_PI,
-        calculated_pi=calculated,
-        decimals=decimals,
-        verbose=args.v,
-        colorblind_mode=args.c,
-        symbol=symbol,
-        constant_name=name,
+    print("\n=== Replay Summary ===")
+    print(f"Levels: {summary['levels']}")
+    print(f"Keystrokes: {summary['keystrokes']}")
+    print(f"Digits correct: {summary['correct']}")
+    print(f"Typing time: {summary['typing_seconds']:.1f} sec")
+    if summary["mismatches"]:
+        print(f"WARNING: {summary['mismatches']} keystroke(s) disagree with the")
+        print("correctness stored in the recording.")
+        return 1
+    return 0
+
+
+def _race_command(argv: list[str]) -> int:
+    """Implement ``pigame race host|join``: head-to-head recitation races.
+
+    Args:
+        argv: Arguments after ``race``.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pigame race",
+        description="Race other players reciting π over a local socket.",
+    )
+    roles = parser.add_subparsers(dest="role", required=True)
+    host = roles.add_parser("host", help="Host a race and wait for players.")
+    join = roles.add_parser("join", help="Join a hosted race.")
+    for role in (host, join):
+        where = role.add_mutually_exclusive_group()
+        where.add_argument(
+            "--socket",
+            type=Path,
+            help=f"Unix socket of the race (default: {RACE_SOCKET_FILE}).",
+        )
+        where.add_argument("--port", type=int, help="Use localhost TCP port PORT.")
+    host.add_argument(
+        "--players",
+        type=int,
+        default=2,
+        help="Number of players that starts the race (default: %(default)s).",
+    )
+    host.add_argument(
+        "--digits",
+        type=int,
+        default=RACE_DEFAULT_DIGITS,
+        help="Number of decimals to recite (default: %(default)s).",
+    )
+    host.add_argument(
+        "--time-limit",
+        type=float,
+        default=DEFAULT_TIME_LIMIT,
+        help="Seconds the race lasts (default: %(default)s).",
+    )
+    host.add_argument(
+        "--countdown",
+        type=float,
+        default=RACE_COUNTDOWN_SECONDS,
+        help="Seconds between the start signal and the start (default: %(default)s).",
+    )
+    join.add_argument("--name", default=None, help="Name to race under.")
+    join.add_argument(
+        "--ui",
+        choices=["ansi", "plain", "ndjson"],
+        default=None,
+        help="Output format (default: ansi on a terminal, plain otherwise).",
     )
+    join.add_argument("--input-fd", type=int, metavar="FD", help="Read digits from FD.")
+    join.add_argument("-c", action="store_true", help="Color-blind mode.")
+    args = parser.parse_args(argv)
 
+    if args.role == "host":
+        if args.digits < 1 or args.players < 1:
+            parser.error("--digits and --players must be positive")
+        try:
+            ranking = run_race_host(
+                socket_path=args.socket,
+                port=args.port,
+                players=args.players,
+                digits=args.digits,
+                time_limit=args.time_limit,
+                countdown=args.countdown,
+            )
+        except TooManyDigitsError as error:
+            parser.error(str(error))
+        except OSError as error:
+            logger.error("Cannot host the race: %s", error)  # noqa: TRY400 - a user error, not a crash
+            return 1
+        except KeyboardInterrupt:
+            return 1
+        _print_race_results(ranking)
+        return 0
+
+    ui = args.ui or (DEFAULT_PRACTICE_UI if sys.stdin.isatty() else "plain")
+    view = PRACTICE_VIEWS[ui](colorblind_mode=args.c)
+    source = None if args.input_fd is None else StreamInputSource(args.input_fd)
+    saved = termios.tcgetattr(sys.stdin) if sys.stdin.isatty() else None
+    try:
+        ranking = asyncio.run(
+            race_client(
+                args.name or os.environ.get("USER", "player"),
+                socket_path=args.socket,
+                port=args.port,
+                source=source,
+                view=view,
+            ),
+        )
+    except (OSError, ValueError):
+        logger.exception("Cannot join the race")
+        return 1
+    except KeyboardInterrupt:
+        return 1
+    finally:
+        # The key-reading thread may still hold the terminal in raw mode
+        if saved is not None:
+            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, saved)
+    return 0 if ranking else 1
 
-def main() -> None:
-    """Parse command line arguments and perform calculations."""
-    # Create parser and parse arguments
-    parser = _create_argument_parser()
 
+def _stats_command(argv: list[str]) -> int:
+    """Implement ``pigame stats export|import``: move practice history.
+
+    Args:
+        argv: Arguments after ``stats``.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pigame stats",
+        description="Export or import practice history as CSV or NDJSON.",
+    )
+    actions = parser.add_subparsers(dest="action", required=True)
+    export = actions.add_parser("export", help="Write every recorded session.")
+    export.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="File to write (default: standard output).",
+    )
+    export.add_argument(
+        "--constant",
+        choices=list(MATHEMATICAL_CONSTANTS.keys()),
+        help="Only export this constant (default: all).",
+    )
+    load = actions.add_parser("import", help="Merge sessions from a file.")
+    load.add_argument("file", help="File to read, or - for standard input.")
+    for action in (export, load):
+        action.add_argument(
+            "--format",
+            choices=STATS_EXPORT_FORMATS,
+            help="Record format (default: csv for .csv files, otherwise ndjson).",
+        )
+        action.add_argument("--profile", type=_profile_name, metavar="NAME")
+    args = parser.parse_args(argv)
+
+    path = args.output if args.action == "export" else args.file
+    fmt = args.format or ("csv" if str(path).endswith(".csv") else "ndjson")
+    try:
+        if args.action == "export":
+            constants = None if args.constant is None else [args.constant]
+            if path is None:
+                export_practice_sessions(
+                    sys.stdout, fmt, constants=constants, profile=args.profile
+                )
+                return 0
+            with path.open("w", encoding="utf-8", newline="") as f:
+                count = export_practice_sessions(
+                    f, fmt, constants=constants, profile=args.profile
+                )
+            print(f"Exported {count} practice sessions to {path}")
+            return 0
+
+        with contextlib.ExitStack() as stack:
+            stream = (
+                sys.stdin
+                if path == "-"
+                else stack.enter_context(Path(path).open(encoding="utf-8", newline=""))
+            )
+            imported, duplicates, invalid = import_practice_sessions(
+                stream, fmt, profile=args.profile
+            )
+    except (OSError, sqlite3.Error):
+        logger.exception("Cannot %s practice history", args.action)
+        return 1
+
+    print(
+        f"Imported {imported} practice sessions "
+        f"({duplicates} already recorded, {invalid} invalid)",
+    )
+    return 1 if invalid else 0
+
+
+def _serve_command(argv: list[str]) -> int:
+    """Implement ``pigame serve --http|--daemon``: pigame as a local service.
+
+    Args:
+        argv: Arguments after ``serve``.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pigame serve",
+        description="Serve scoring and digits to other programs.",
+    )
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument(
+        "--http",
+        action="store_true",
+        help="Serve /score, /digits and /constants over HTTP/1.1.",
+    )
+    mode.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run forwarded pigame commands on a Unix socket (see pigame_client).",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Socket for --daemon (default: $XDG_RUNTIME_DIR/pigame.sock).",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=SERVE_DEFAULT_PORT,
+        help="TCP port to listen on (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=SERVE_RATE,
+        help="Request cost each client may spend per second (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--burst",
+        type=float,
+        default=SERVE_BURST,
+        help="Request cost each client may spend at once (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SERVE_WORKERS,
+        help="Threads running costly requests (default: %(default)s).",
+    )
+    args = parser.parse_args(argv)
+    if args.rate <= 0 or args.burst < 1 or args.workers < 1:
+        parser.error("--rate, --burst and --workers must be positive")
+
+    if args.daemon:
+        try:
+            run_command_daemon(args.socket)
+        except OSError:
+            logger.exception("Cannot start the pigame daemon")
+            return 1
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    try:
+        run_http_service(
+            host=args.host,
+            port=args.port,
+            rate=args.rate,
+            burst=args.burst,
+            workers=args.workers,
+        )
+    except OSError:
+        logger.exception("Cannot serve on %s:%d", args.host, args.port)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+# Subcommands recognised as the first command-line argument
+_SUBCOMMANDS = {
+    "replay": _replay_command,
+    "race": _race_command,
+    "stats": _stats_command,
+    "serve": _serve_command,
+}
+
+
+def _parse_arguments() -> argparse.Namespace | types.SimpleNamespace:
+    """Parse the command line: common forms directly, others with argparse."""
+    args = _parse_fast_path(sys.argv[1:])
+    if args is not None:
+        return args
+
+    parser = _create_argument_parser()
     try:
-        args = parser.parse_args()
+        return parser.parse_args()
     except (argparse.ArgumentError, SystemExit):
         if "--help" in sys.argv or "-h" in sys.argv:
             sys.exit(0)
         logger.exception("Argument parsing failed")
         usage(1)
 
+
+def main() -> None:
+    """Parse command line arguments and perform calculations."""
+    # Dispatch subcommands (e.g. "pigame replay FILE") before the main parser
+    if len(sys.argv) > 1 and sys.argv[1] in _SUBCOMMANDS:
+        sys.exit(_SUBCOMMANDS[sys.argv[1]](sys.argv[2:]))
+
+    args = _parse_arguments()
+
     # Activate debug logging as early as possible (PIGAME_DEBUG env-var is
     # already handled at import time; this covers the --debug CLI flag).
     if getattr(args, "debug", False):
         logger.setLevel(logging.DEBUG)
         logger.debug("debug logging enabled via --debug flag")
 
+    try:
+        _run_command(args)
+    finally:
+        # Also reached on sys.exit(), and in daemon children where atexit
+        # handlers never run
+        if args.metrics_dump:
+            sys.stderr.write(METRICS.render())
+            sys.stderr.flush()
+
+
+def _run_command(args: argparse.Namespace | types.SimpleNamespace) -> None:
+    """Run the command described by the parsed *args*."""
+    if args.serve_stdio:
+        sys.exit(serve_stdio())
+
     # Handle version display
     if args.V:
-        print(f"version: {VERSION}")
+        print(f"version: {get_version()}")
         sys.exit(0)
 
     # Handle --list: show all available constants
     if getattr(args, "list", False):
-        print("Available mathematical constants:\n")
-        for key, meta in MATHEMATICAL_CONSTANTS.items():
-            max_len = MAX_LENGTH if key == "pi" else MAX_CONSTANT_LENGTH
-            print(f"  {meta['symbol']:3s}  {meta['name']:20s}  --constant {key}")
-            print(f"       {meta['description']}")
-            print(f"       Up to {max_len} decimal places available.\n")
+        _handle_list_display()
         sys.exit(0)
 
     # Handle configuration
     if args.config:
-        configure_practice_mode()
+        configure_practice_mode(args.profile)
         sys.exit(0)
 
     # Handle stats display
     if args.stats:
-        _handle_stats_display()
+        _handle_stats_display(
+            args.constant, args.profile, since=args.since, mode=args.mode
+        )
         sys.exit(0)
 
-    # Handle practice mode
-    if args.practice:
-        visual_aid_setting = None
-        if args.visual_aid:
-            visual_aid_setting = True
-        elif args.no_visual_aid:
-            visual_aid_setting = False
+    if args.profiles:
+        _handle_profiles_display(args.constant)
+        sys.exit(0)
 
-        practice_mode(
-            colorblind_mode=args.c,
-            mode=args.practice_mode,
-            min_digits=args.min_digits,
-            max_digits=args.max_digits,
-            chunk_size=args.chunk_size,
-            time_limit=args.time_limit,
-            visual_aid=visual_aid_setting,
-        )
+    if args.migrate_stats:
+        _handle_stats_migration()
+
+    # Handle practice mode (interactive, or headless from a keystroke script)
+    if args.practice or args.replay:
+        _handle_practice(args)
         sys.exit(0)
 
     # Show usage if no arguments provided
@@ -1915,7 +7849,7 @@ def main() -> None:
         usage(0)
 
     # Handle pi calculation
-    length, _ = _handle_pi_calculation(args)
+    length = _handle_pi_calculation(args)
 
     # Exit if only displaying calculated pi
     if args.p and not args.YOUR_PI:
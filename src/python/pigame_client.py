@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Thin client for the pigame command daemon.
+
+Forwards the command line, working directory, environment and standard
+streams to ``pigame serve --daemon`` and exits with the command's status, so
+a command costs a socket round trip instead of a fresh pigame start-up.  When
+no daemon is listening, pigame runs in this process instead.
+
+Only the modules needed to reach the daemon are imported, and ``os.path``
+stands in for :mod:`pathlib`, to keep the client's own start-up short.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+
+
+# Commands that must run in this process rather than in the daemon
+LOCAL_COMMANDS = frozenset({"serve"})
+
+
+def socket_path() -> str:
+    """Return the daemon's socket path, as ``pigame.daemon_socket_file()``."""
+    if path := os.environ.get("PIGAME_SOCKET"):
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.path.expanduser(  # noqa: PTH111
+        "~/.pigame"
+    )
+    return os.path.join(runtime_dir, "pigame.sock")  # noqa: PTH118
+
+
+def forward(argv: list[str], path: str) -> int | None:
+    """Run a pigame command in the daemon listening on *path*.
+
+    Args:
+        argv: The command-line arguments, without the program name.
+        path: The daemon's socket.
+
+    Returns:
+        The command's exit status, or None if no daemon is listening.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except OSError:
+        client.close()
+        return None
+
+    with client:
+        cwd = os.getcwd()  # noqa: PTH109
+        request = {"argv": argv, "cwd": cwd, "env": dict(os.environ)}
+        message = json.dumps(request).encode() + b"\n"
+        socket.send_fds(client, [message], [0, 1, 2])
+        reply = b""
+        while True:
+            try:
+                chunk = client.recv(64)
+            except KeyboardInterrupt:
+                # Pass Ctrl-C on to the command and wait for it to finish
+                client.send(b"\x03")
+                continue
+            if not chunk:
+                break
+            reply += chunk
+    try:
+        return int(reply)
+    except ValueError:
+        return 1
+
+
+def main() -> None:
+    """Run pigame through the daemon if one is listening, else in process."""
+    argv = sys.argv[1:]
+    if not argv or argv[0] not in LOCAL_COMMANDS:
+        status = forward(argv, socket_path())
+        if status is not None:
+            sys.exit(status)
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))  # noqa: PTH100, PTH120
+    import pigame  # noqa: PLC0415
+
+    pigame.main()
+
+
+if __name__ == "__main__":
+    main()
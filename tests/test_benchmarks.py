@@ -11,8 +11,14 @@ Run with:
 from __future__ import annotations
 
 import contextlib
+import io
+import os
+import subprocess
 import sys
+import tempfile
+import time
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -279,3 +285,200 @@ class TestBenchmarkRoundTrip:
 
         result = benchmark(_round_trip_cb)
         assert result == 0
+
+
+# ---------------------------------------------------------------------------
+# Headless practice sessions  -the real practice code driven by a typist
+# ---------------------------------------------------------------------------
+
+
+class TestBenchmarkPracticeSession:
+    """Benchmarks for complete practice sessions driven by a synthetic typist."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_practice_files(self):
+        """Keep the benchmark away from the user's ~/.pigame directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            with (
+                mock.patch.object(pigame, "PRACTICE_CONFIG_DIR", temp_path),
+                mock.patch.object(
+                    pigame, "PRACTICE_STATS_FILE", temp_path / "stats.json"
+                ),
+                mock.patch.object(
+                    pigame, "PRACTICE_CONFIG_FILE", temp_path / "config.json"
+                ),
+            ):
+                yield
+
+    @pytest.mark.parametrize("mode", ["standard", "timed", "chunk"])
+    def test_simulated_session(self, benchmark, mode: str) -> None:
+        """One session from 5 to 20 digits with a 2% error rate."""
+
+        def _session() -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                pigame.practice_mode(
+                    mode=mode,
+                    min_digits=5,
+                    max_digits=20,
+                    visual_aid=False,
+                    source=pigame.SyntheticTypist(error_rate=0.02, seed=42),
+                    save_stats=False,
+                )
+
+        benchmark(_session)
+
+
+# ---------------------------------------------------------------------------
+# Session recording  -per-keystroke cost of the recorder
+# ---------------------------------------------------------------------------
+
+
+class TestBenchmarkSessionRecorder:
+    """Benchmarks for recording keystrokes (buffered, no I/O per keystroke)."""
+
+    def test_record_keystroke(self, benchmark) -> None:
+        """Encode a single keystroke into the recorder's buffer."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            recorder = pigame.SessionRecorder(Path(temp_dir) / "s.pgr", {})
+            benchmark(recorder.keystroke, "5", correct=True)
+
+
+# ---------------------------------------------------------------------------
+# Metrics  -per-observation cost of counters and histograms
+# ---------------------------------------------------------------------------
+
+# Longest an observation may take, in seconds
+OBSERVATION_BUDGET = 1e-6
+
+
+class TestBenchmarkMetrics:
+    """Benchmarks for recording metrics on hot paths."""
+
+    def test_counter_inc(self, benchmark) -> None:
+        """Increment a counter."""
+        benchmark(pigame.Counter().inc)
+
+    def test_histogram_observe(self, benchmark) -> None:
+        """Record a latency in a fixed-bucket histogram."""
+        histogram = pigame.Histogram(pigame.LATENCY_BUCKETS)
+        benchmark(histogram.observe, 0.0003)
+        assert benchmark.stats.stats.min < OBSERVATION_BUDGET
+
+
+# ---------------------------------------------------------------------------
+# Curses practice UI - cost of drawing one keystroke on a long level
+# ---------------------------------------------------------------------------
+
+
+class TestBenchmarkPracticeScreen:
+    """Benchmarks for the damage-tracked practice screen."""
+
+    def test_append_digit_long_level(self, benchmark) -> None:
+        """Add a digit to a level that already fills many screen rows."""
+        screen = pigame.PracticeScreen(24, 80)
+        screen.begin_level("3.")
+        screen.append("1415926535" * 100)
+        screen.model.damage()
+
+        def _keystroke() -> None:
+            screen.append("5", pigame.ScreenModel.CORRECT)
+            screen.model.damage()
+
+        benchmark(_keystroke)
+
+
+# ---------------------------------------------------------------------------
+# Startup  -import cost measured with ``python -X importtime``
+# ---------------------------------------------------------------------------
+
+PIGAME_DIR = Path(__file__).parent.parent / "src" / "python"
+
+# Cumulative import time allowed for ``import pigame`` (bytecode cached)
+STARTUP_BUDGET_US = 80_000
+
+# Modules the digit check and -p never import
+DEFERRED_MODULES = {
+    "argparse",
+    "asyncio",
+    "curses",
+    "csv",
+    "json",
+    "logging",
+    "random",
+    "sqlite3",
+    "tempfile",
+    "threading",
+}
+
+
+def _importtime(*args: str, pycache: Path) -> dict[str, int]:
+    """Run Python with ``-X importtime``; return cumulative µs per module."""
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in {"PYTHONDONTWRITEBYTECODE", "PIGAME_DEBUG"}
+    }
+    env["PYTHONPYCACHEPREFIX"] = str(pycache)
+    env["PYTHONPATH"] = str(PIGAME_DIR)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            with contextlib.suppress(ValueError):
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestBenchmarkStartup:
+    """Regression benchmarks for process startup."""
+
+    def test_import_within_budget(self, benchmark, tmp_path: Path) -> None:
+        """``import pigame`` stays within the startup budget."""
+        _importtime("-c", "import pigame", pycache=tmp_path)  # warm the bytecode
+
+        def _import() -> int:
+            return _importtime("-c", "import pigame", pycache=tmp_path)["pigame"]
+
+        benchmark.pedantic(_import, rounds=3, iterations=1)
+        assert min(_import() for _ in range(3)) < STARTUP_BUDGET_US
+
+    @pytest.mark.parametrize("argv", [["3.14159"], ["-p", "10"]])
+    def test_common_paths_defer_imports(self, tmp_path: Path, argv: list[str]) -> None:
+        """Checking or printing digits never imports the practice modules."""
+        times = _importtime(str(PIGAME_DIR / "pigame.py"), *argv, pycache=tmp_path)
+        assert "dataclasses" in times
+        assert not DEFERRED_MODULES & times.keys()
+
+    def test_fast_path_saves_wall_time(self, benchmark, tmp_path: Path) -> None:
+        """Checking digits is faster than going through the full parser."""
+        env = {key: value for key, value in os.environ.items() if key != "PIGAME_DEBUG"}
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = str(tmp_path)
+        env["PYTHONPATH"] = str(PIGAME_DIR)
+        # Both run the module from cached bytecode; only the parser differs
+        run = "import sys, pigame; sys.argv = ['pigame', '3.14159']; "
+        fast = [sys.executable, "-c", run + "pigame.main()"]
+        full = [
+            sys.executable,
+            "-c",
+            run + "pigame._parse_fast_path = lambda argv: None; pigame.main()",
+        ]
+
+        def _run(command: list[str]) -> float:
+            start = time.perf_counter()
+            subprocess.run(command, capture_output=True, env=env, check=True)
+            return time.perf_counter() - start
+
+        _run(fast)  # warm the bytecode
+        benchmark.pedantic(_run, args=(fast,), rounds=5, iterations=1)
+        # Interleave the runs so that machine noise affects both alike
+        times = [(_run(fast), _run(full)) for _ in range(7)]
+        assert min(t for t, _ in times) < min(t for _, t in times)
@@ -1,9 +1,16 @@
 # !/usr/bin/env python3
 """Tests for the practice mode of pigame."""
 
+import asyncio
+import contextlib
+import io
 import json
+import os
+import socket
+import sqlite3
 import sys
 import tempfile
+import threading
 from pathlib import Path
 from unittest import mock
 
@@ -44,7 +51,7 @@ class TestPracticeMode:
 
     def test_load_practice_stats_new_file(self) -> None:
         """Test loading practice stats when no file exists."""
-        # Should create a new file with default stats
+        # Should return default stats without writing anything
         stats = pigame.load_practice_stats()
 
         assert isinstance(stats, dict)
@@ -55,8 +62,8 @@ class TestPracticeMode:
         assert isinstance(stats["history"], list)
         assert len(stats["history"]) == 0
 
-        # Check that the file was created
-        assert pigame.PRACTICE_STATS_FILE.exists()
+        # The file is only created when a session is saved
+        assert not pigame.PRACTICE_STATS_FILE.exists()
 
     def test_save_practice_stats(self) -> None:
         """Test saving practice stats."""
@@ -85,6 +92,542 @@ class TestPracticeMode:
         assert loaded_stats == test_stats
 
 
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_practice_history_is_logged_and_compacted() -> None:
+    """Sessions are appended to a log; the snapshot stays small."""
+    sessions = 400
+    stats = pigame.load_practice_stats()
+    for level in range(sessions):
+        pigame._update_practice_stats(  # noqa: SLF001
+            stats, level, 10, 60.0, "timed", 90.0 - level / 10
+        )
+
+    history = pigame.load_practice_history()
+    assert len(history) == sessions
+    assert history[-1]["max_level"] == sessions - 1
+
+    # The snapshot was compacted at least once and keeps recent sessions only
+    snapshot = json.loads(pigame.PRACTICE_STATS_FILE.read_text())
+    assert (
+        0
+        < snapshot["log_offset"]
+        < pigame.PRACTICE_STATS_FILE.with_suffix(".ndjson").stat().st_size
+    )
+    assert len(snapshot["history"]) <= pigame.STATS_RECENT_HISTORY
+
+    loaded = pigame.load_practice_stats()
+    assert loaded == stats
+    assert loaded["total_practice_sessions"] == sessions
+    assert loaded["total_digits_correct"] == sessions * 10
+    assert loaded["fastest_time"] == pytest.approx(90.0 - (sessions - 1) / 10)
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_same_second_sessions_are_all_listed() -> None:
+    """Sessions sharing a timestamp are distinct, in the snapshot and the log."""
+    legacy = [
+        {
+            "date": "2024-01-01 10:00:00",
+            "mode": "standard",
+            "max_level": level,
+            "correct_digits": level,
+            "duration_seconds": 30,
+        }
+        for level in (5, 6)
+    ]
+    pigame.PRACTICE_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    pigame.PRACTICE_STATS_FILE.write_text(json.dumps({"history": legacy}))
+
+    stats = pigame.load_practice_stats()
+    with mock.patch("time.strftime", return_value="2024-01-01 10:00:00"):
+        pigame._update_practice_stats(stats, 7, 7, 30.0, "standard", None)  # noqa: SLF001
+        pigame._update_practice_stats(stats, 7, 7, 30.0, "standard", None)  # noqa: SLF001
+
+    history = pigame.load_practice_history()
+    assert [s["max_level"] for s in history] == [5, 6, 7, 7]
+    assert history[2]["uid"] != history[3]["uid"]
+
+
+def test_speed_sketch_quantiles_within_accuracy() -> None:
+    """The streaming sketch answers percentiles within its relative error."""
+    sketch: dict[str, int] = {}
+    speeds = [10 + i * 0.37 for i in range(1000)]
+    for speed in speeds:
+        pigame._sketch_add(sketch, speed)  # noqa: SLF001
+
+    assert len(sketch) < 100
+    for q in (0.5, 0.9):
+        exact = speeds[int(q * (len(speeds) - 1))]
+        estimate = pigame._sketch_quantile(sketch, q)  # noqa: SLF001
+        assert estimate == pytest.approx(exact, rel=pigame.SPEED_SKETCH_ACCURACY)
+
+
+def test_rollups_summarise_by_date_and_mode() -> None:
+    """Rollups answer --since and --mode without walking the history."""
+    stats = {}
+    days = [f"2026-0{month}-{day:02d}" for month in (1, 6) for day in (5, 6, 20)]
+    for i, day in enumerate(days):
+        event = {
+            "session": {
+                "date": f"{day} 10:00:00",
+                "mode": "timed" if i % 2 else "standard",
+                "max_level": 10 + i,
+                "correct_digits": 60,
+                "duration_seconds": 60,
+            },
+        }
+        pigame._apply_practice_event(stats, event)  # noqa: SLF001
+
+    # Old days have left the daily rollups, but weekly ones keep them
+    assert min(stats["rollups"]["daily"]) >= "2026-03"
+    assert pigame.summarize_practice_stats(stats)["sessions"] == len(days)
+
+    recent = pigame.summarize_practice_stats(stats, since="2026-06-06")
+    assert (recent["sessions"], recent["best"]) == (2, 15)
+    timed = pigame.summarize_practice_stats(stats, mode="timed")
+    assert (timed["sessions"], timed["digits"]) == (3, 180)
+    # Before the daily window, dates resolve to whole weeks (Mon 2026-01-05)
+    assert pigame.summarize_practice_stats(stats, since="2026-01-06")["sessions"] == 6
+    assert timed["speed_p50"] == pytest.approx(60, rel=pigame.SPEED_SKETCH_ACCURACY)
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_main_stats_since_and_mode() -> None:
+    """--stats --since/--mode print the filtered rollup summary."""
+    stats = pigame.load_practice_stats()
+    pigame._update_practice_stats(stats, 9, 30, 60.0, "timed", 60.0)  # noqa: SLF001
+    pigame._update_practice_stats(stats, 12, 40, 60.0, "standard", None)  # noqa: SLF001
+    output = io.StringIO()
+
+    with (
+        mock.patch("sys.argv", ["pigame", "--stats", "--mode", "timed"]),
+        mock.patch("sys.stdout", output),
+        pytest.raises(SystemExit),
+    ):
+        pigame.main()
+
+    text = output.getvalue()
+    assert "[timed]" in text
+    assert "Practice sessions: 1" in text
+    assert "Best level reached: 9 digits" in text
+    assert "Speed: median 30." in text
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_practice_stats_ignore_torn_log_line() -> None:
+    """A half-written final event (e.g. after a crash) is ignored."""
+    stats = pigame.load_practice_stats()
+    pigame._update_practice_stats(stats, 7, 7, 30.0, "standard", None)  # noqa: SLF001
+    log_file = pigame.PRACTICE_STATS_FILE.with_suffix(".ndjson")
+    with log_file.open("a") as f:
+        f.write('{"session": {"date"')
+
+    loaded = pigame.load_practice_stats()
+    assert loaded["total_practice_sessions"] == 1
+    assert loaded["max_digits"] == 7
+
+    # The next session still lands on a line of its own
+    pigame._update_practice_stats(loaded, 9, 9, 30.0, "standard", None)  # noqa: SLF001
+    assert [s["max_level"] for s in pigame.load_practice_history()] == [7, 9]
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_concurrent_sessions_are_all_kept() -> None:
+    """Terminals saving at the same time lose no sessions, even on compaction."""
+    terminals, sessions = 8, 25
+
+    def terminal() -> None:
+        stats = pigame.load_practice_stats()
+        for _ in range(sessions):
+            pigame._update_practice_stats(stats, 5, 5, 10.0, "standard", None)  # noqa: SLF001
+
+    with mock.patch.object(pigame, "STATS_COMPACT_BYTES", 512):
+        threads = [threading.Thread(target=terminal) for _ in range(terminals)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    stats = pigame.load_practice_stats()
+    assert stats["total_practice_sessions"] == terminals * sessions
+    assert stats["total_digits_correct"] == terminals * sessions * 5
+    assert len(pigame.load_practice_history()) == terminals * sessions
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_interrupted_save_keeps_previous_stats() -> None:
+    """A crash while writing leaves the old file intact and no temporary files."""
+    stats = pigame.load_practice_stats()
+    stats["max_digits"] = 42
+    pigame.save_practice_stats(stats)
+
+    stats["max_digits"] = 0
+    with (
+        mock.patch("json.dump", side_effect=KeyboardInterrupt),
+        pytest.raises(KeyboardInterrupt),
+    ):
+        pigame.save_practice_stats(stats)
+
+    assert pigame.load_practice_stats()["max_digits"] == 42
+    assert not list(pigame.PRACTICE_CONFIG_DIR.glob("*.tmp"))
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_saved_stats_keep_sessions_logged_since_loading() -> None:
+    """A snapshot saved from older stats still folds in later sessions."""
+    pigame._update_practice_stats(  # noqa: SLF001
+        pigame.load_practice_stats(), 5, 5, 10.0, "standard", None
+    )
+    stats = pigame.load_practice_stats()
+    # Another terminal records a session after these stats were loaded
+    pigame._update_practice_stats(  # noqa: SLF001
+        pigame.load_practice_stats(), 9, 9, 10.0, "standard", None
+    )
+    stats["fastest_time"] = 12.5
+    pigame.save_practice_stats(stats)
+
+    loaded = pigame.load_practice_stats()
+    assert loaded["total_practice_sessions"] == 2
+    assert (loaded["max_digits"], loaded["fastest_time"]) == (9, 12.5)
+
+    # With the SQLite store the totals are written in a transaction
+    pigame.migrate_practice_stats()
+    loaded["fastest_time"] = 11.0
+    pigame.save_practice_stats(loaded)
+    assert pigame.load_practice_stats()["fastest_time"] == 11.0
+
+
+def test_practice_config_is_cached_and_never_written(tmp_path: Path) -> None:
+    """Loading settings writes nothing and re-parses only a changed file."""
+    config_dir = tmp_path / "pigame"
+    config_file = config_dir / "config.json"
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_DIR", config_dir),
+        mock.patch.object(pigame, "PRACTICE_STATS_FILE", config_dir / "stats.json"),
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_file),
+    ):
+        cfg = pigame._load_practice_config_settings(  # noqa: SLF001
+            colorblind_mode=False,
+            mode="timed",
+            min_digits=None,
+            max_digits=None,
+            chunk_size=None,
+            time_limit=None,
+            visual_aid=None,
+        )
+        assert (cfg.mode, cfg.max_digits) == ("timed", pigame.PRACTICE_MAX_DIGITS)
+        pigame.load_practice_stats()
+        assert not config_dir.exists()
+
+        pigame.save_practice_config({"max_digits": 50, "chunk_size": 99})
+        with mock.patch("json.load", wraps=json.load) as parse:
+            assert pigame.load_practice_config()["max_digits"] == 50
+            assert pigame.load_practice_config()["max_digits"] == 50
+            assert parse.call_count == 1
+
+            # Invalid settings fall back to their defaults
+            assert (
+                pigame.load_practice_config()["chunk_size"] == pigame.DEFAULT_CHUNK_SIZE
+            )
+            config_file.write_text('{"max_digits": 60, "mode": "bogus"}')
+            config = pigame.load_practice_config()
+        assert parse.call_count == 2
+    assert config["max_digits"] == 60
+    assert config["mode"] == pigame.DEFAULT_PRACTICE_MODE
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_save_practice_config_merges_settings() -> None:
+    """Saving config keeps settings another process wrote in the meantime."""
+    config_file = pigame.PRACTICE_CONFIG_DIR / "c.json"
+    with mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_file):
+        pigame.save_practice_config({"max_digits": 50})
+        config = pigame.load_practice_config()
+        # Another process changes settings this one also holds
+        config_file.write_text(json.dumps({"max_digits": 60, "time_limit": 90}))
+        pigame.save_practice_config({**config, "mode": "timed"}, base=config)
+
+        saved = pigame.load_practice_config()
+    assert saved["mode"] == "timed"
+    assert saved["max_digits"] == 60
+    assert saved["time_limit"] == 90
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+@pytest.mark.parametrize("profile", [None, "ada"])
+def test_reset_to_defaults_clears_every_setting(profile: str | None) -> None:
+    """Reset drops settings that have no default, such as from_position."""
+    config_file = pigame.PRACTICE_CONFIG_DIR / "c.json"
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_file),
+        mock.patch("builtins.input", return_value="y"),
+        mock.patch("builtins.print"),
+    ):
+        pigame.save_practice_config({"from_position": 300, "window": 20}, profile)
+        config = pigame.load_practice_config(profile)
+        assert config["from_position"] == 300
+
+        pigame._handle_reset_to_defaults(config, profile)  # noqa: SLF001
+        assert pigame.load_practice_config(profile) == pigame._get_default_config()  # noqa: SLF001
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_save_profile_config_merges_settings() -> None:
+    """A profile's settings are merged too, not replaced."""
+    with mock.patch.object(
+        pigame, "PRACTICE_CONFIG_FILE", pigame.PRACTICE_CONFIG_DIR / "c.json"
+    ):
+        config = pigame.load_practice_config("ada")
+        pigame.save_practice_config({"max_digits": 60}, "ada")
+        pigame.save_practice_config({**config, "mode": "timed"}, "ada", base=config)
+
+        saved = pigame.load_practice_config("ada")
+    assert saved["mode"] == "timed"
+    assert saved["max_digits"] == 60
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_practice_sessions_export_and_import(tmp_path: Path) -> None:
+    """History round-trips through CSV and NDJSON; re-imports are skipped."""
+    rows = [
+        {"constant": "pi", "date": "2024-03-02 10:00:00", "mode": "timed",
+         "max_level": 12, "correct_digits": 40, "duration_seconds": 90},
+        {"constant": "e", "date": "2024-03-01 09:00:00", "mode": "chunk",
+         "max_level": 6, "correct_digits": 6, "duration_seconds": 20},
+        {"constant": "pi", "date": "2024-03-01 08:00:00", "mode": "standard",
+         "max_level": 9, "correct_digits": 30, "duration_seconds": 60},
+        {"constant": "pi", "date": "2024-03-01 08:00:00", "mode": "standard",
+         "max_level": 9, "correct_digits": 30, "duration_seconds": 60},
+        {"constant": "tau", "date": "yesterday", "mode": "standard",
+         "max_level": 1, "correct_digits": 1, "duration_seconds": 1},
+    ]  # fmt: skip
+    source = io.StringIO("".join(json.dumps(row) + "\n" for row in rows) + "{\n")
+    assert pigame.import_practice_sessions(source) == (3, 1, 2)
+
+    stats = pigame.load_practice_stats()
+    assert stats["total_practice_sessions"] == 2
+    assert stats["max_digits"] == 12
+    # The older session was sorted into the history
+    assert [record["max_level"] for record in stats["history"]] == [9, 12]
+    assert pigame.load_practice_stats("e")["total_digits_correct"] == 6
+
+    for fmt in pigame.STATS_EXPORT_FORMATS:
+        exported = io.StringIO()
+        assert pigame.export_practice_sessions(exported, fmt) == 3
+
+        target = tmp_path / fmt
+        target.mkdir()
+        with (
+            mock.patch.object(pigame, "PRACTICE_CONFIG_DIR", target),
+            mock.patch.object(pigame, "PRACTICE_STATS_FILE", target / "stats.json"),
+        ):
+            exported.seek(0)
+            assert pigame.import_practice_sessions(exported, fmt) == (3, 0, 0)
+            assert pigame.load_practice_stats() == stats
+            exported.seek(0)
+            assert pigame.import_practice_sessions(exported, fmt) == (0, 3, 0)
+
+    # The SQLite store is merged in one transaction too
+    pigame.migrate_practice_stats()
+    source = io.StringIO(
+        "constant,date,mode,max_level,correct_digits,duration_seconds\n"
+        "pi,2024-02-01 07:00:00,standard,20,20,45\n"
+        "pi,2024-03-02 10:00:00,timed,12,40,90\n"
+        "pi,2024-02-02 07:00:00,standard,-1,20,45\n"
+    )
+    assert pigame.import_practice_sessions(source, "csv") == (1, 1, 1)
+    assert pigame.load_practice_stats()["max_digits"] == 20
+    assert len(pigame.load_practice_history()) == 3
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+@pytest.mark.parametrize("store", ["json", "sqlite"])
+def test_same_second_sessions_round_trip(store: str) -> None:
+    """Sessions saved in the same second are all exported and imported once."""
+    if store == "sqlite":
+        pigame.migrate_practice_stats()
+    stats = pigame.load_practice_stats()
+    with mock.patch("time.strftime", return_value="2024-01-01 10:00:00"):
+        for _ in range(3):
+            pigame._update_practice_stats(stats, 7, 7, 30.0, "standard", None)  # noqa: SLF001
+    exported = io.StringIO()
+    assert pigame.export_practice_sessions(exported, "csv") == 3
+
+    exported.seek(0)
+    assert pigame.import_practice_sessions(exported, "csv", profile="ada") == (3, 0, 0)
+    exported.seek(0)
+    assert pigame.import_practice_sessions(exported, "csv") == (0, 3, 0)
+    assert len(pigame.load_practice_history(profile="ada")) == 3
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_session_keeps_its_own_speed() -> None:
+    """Each logged session stores its own speed, not the all-time best."""
+    pigame.migrate_practice_stats()
+    stats = pigame.load_practice_stats()
+    pigame._update_practice_stats(stats, 9, 30, 60.0, "timed", 20.0, speed=90.0)  # noqa: SLF001
+    pigame._update_practice_stats(stats, 9, 30, 60.0, "timed", 30.0, speed=60.0)  # noqa: SLF001
+
+    assert pigame.load_practice_stats()["best_speed"] == 90.0
+    db_file = pigame.PRACTICE_STATS_FILE.with_suffix(".db")
+    with contextlib.closing(sqlite3.connect(db_file)) as conn:
+        speeds = conn.execute("SELECT best_speed FROM sessions ORDER BY id").fetchall()
+    assert speeds == [(90.0,), (60.0,)]
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_main_stats_export_import(tmp_path: Path) -> None:
+    """``pigame stats export|import`` picks the format from the extension."""
+    stats = pigame.load_practice_stats()
+    pigame._update_practice_stats(stats, 9, 30, 60.0, "standard", None)  # noqa: SLF001
+    export_file = tmp_path / "history.csv"
+
+    with (
+        mock.patch("sys.argv", ["pigame", "stats", "export", "-o", str(export_file)]),
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        pigame.main()
+    assert exc_info.value.code == 0
+    assert export_file.read_text().startswith("constant,date,mode,")
+
+    with (
+        mock.patch("sys.argv", ["pigame", "stats", "import", str(export_file)]),
+        mock.patch("builtins.print") as mock_print,
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        pigame.main()
+    assert exc_info.value.code == 0
+    mock_print.assert_called_once_with(
+        "Imported 0 practice sessions (1 already recorded, 0 invalid)"
+    )
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_migrate_practice_stats_to_sqlite() -> None:
+    """Migration imports totals and history; later sessions go to SQLite."""
+    stats = pigame.load_practice_stats()
+    pigame._update_practice_stats(stats, 9, 30, 60.0, "standard", None)  # noqa: SLF001
+    pigame._update_practice_stats(stats, 12, 40, 60.0, "timed", 42.0)  # noqa: SLF001
+    e_stats = pigame.load_practice_stats("e")
+    pigame._update_practice_stats(e_stats, 6, 6, 20.0, "chunk", None, constant="e")  # noqa: SLF001
+
+    assert pigame.migrate_practice_stats() == 3
+    db_file = pigame.PRACTICE_STATS_FILE.with_suffix(".db")
+    with pytest.raises(FileExistsError):
+        pigame.migrate_practice_stats()
+
+    loaded = pigame.load_practice_stats()
+    assert loaded == stats
+    assert pigame.load_practice_stats("e") == e_stats
+
+    # New sessions are stored with their levels and per-position results
+    session = pigame.PracticeSession(start_time=0.0)
+    session.record_level(0, 5, 5)
+    session.record_level(0, 6, 3)
+    pigame._update_practice_stats(  # noqa: SLF001
+        loaded, 5, 8, 30.0, "timed", 30.0, levels=session.levels
+    )
+    assert pigame.load_practice_stats()["total_practice_sessions"] == 3
+
+    timed = pigame.query_practice_sessions(mode="timed")
+    assert [record["max_level"] for record in timed] == [12, 5]
+    assert pigame.query_practice_sessions(since="9999-01-01") == []
+
+    with contextlib.closing(sqlite3.connect(db_file)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        results = conn.execute(
+            "SELECT level, position, correct FROM results ORDER BY level, position"
+        ).fetchall()
+    assert results == [(0, p, 1) for p in range(1, 6)] + [
+        (1, 1, 1),
+        (1, 2, 1),
+        (1, 3, 1),
+        (1, 4, 0),
+    ]
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_profiles_share_one_store() -> None:
+    """Profiles keep separate stats and settings and rank on one leaderboard."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    own = pigame.load_practice_stats()
+    pigame._update_practice_stats(own, 15, 15, 60.0, "standard", None)  # noqa: SLF001
+
+    with mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"):
+        for name, level in [("ada", 30), ("bob", 8)]:
+            stats = pigame.load_practice_stats(profile=name)
+            pigame._update_practice_stats(  # noqa: SLF001
+                stats, level, level, 60.0, "standard", None, profile=name
+            )
+        pigame.save_practice_config({"max_digits": 40}, profile="ada")
+
+        assert pigame.load_practice_config("ada")["max_digits"] == 40
+        assert pigame.load_practice_config("bob")["max_digits"] == 100
+
+    # The OS user's own statistics became the default profile
+    assert pigame.load_practice_stats()["max_digits"] == 15
+    assert pigame.load_practice_stats(profile="bob")["max_digits"] == 8
+    assert pigame.load_practice_stats("e", profile="ada")["max_digits"] == 0
+    assert [entry["profile"] for entry in pigame.profile_leaderboard()] == [
+        "ada",
+        "default",
+        "bob",
+    ]
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_reading_a_profile_creates_nothing() -> None:
+    """Showing or replaying as a profile leaves the JSON store in use."""
+    own = pigame.load_practice_stats()
+    pigame._update_practice_stats(own, 15, 15, 60.0, "standard", None)  # noqa: SLF001
+    db_file = pigame.PRACTICE_CONFIG_DIR / "stats.db"
+
+    with (
+        mock.patch("sys.argv", ["pigame", "--stats", "--profile", "ada"]),
+        mock.patch("sys.stdout", io.StringIO()) as output,
+        pytest.raises(SystemExit),
+    ):
+        pigame.main()
+    assert "Best level reached: 0 digits" in output.getvalue()
+    assert pigame.load_practice_config("ada") == pigame.load_practice_config()
+    assert pigame.query_practice_sessions(profile="ada") == []
+    assert not db_file.exists()
+    assert pigame.load_practice_stats()["max_digits"] == 15
+
+    # Once a profile saves, unknown profiles read as defaults
+    pigame.save_practice_config({"max_digits": 40}, profile="bob")
+    assert pigame.load_practice_stats(profile="ada")["max_digits"] == 0
+    assert [e["profile"] for e in pigame.profile_leaderboard()] == ["default", "bob"]
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_main_profiles_lists_leaderboard() -> None:
+    """--profiles prints the profiles best first; bad names are rejected."""
+    stats = pigame.load_practice_stats(profile="zoe")
+    pigame._update_practice_stats(stats, 12, 12, 60.0, "standard", None, profile="zoe")  # noqa: SLF001
+    output = io.StringIO()
+
+    with (
+        mock.patch("sys.argv", ["pigame", "--profiles"]),
+        mock.patch("sys.stdout", output),
+        pytest.raises(SystemExit),
+    ):
+        pigame.main()
+    assert "1. zoe" in output.getvalue()
+    assert "12 digits (1 sessions)" in output.getvalue()
+
+    with (
+        mock.patch("sys.argv", ["pigame", "--stats", "--profile", "../x"]),
+        mock.patch("sys.stderr", io.StringIO()),
+        mock.patch("sys.stdout", io.StringIO()),
+        mock.patch.object(pigame.logger, "exception"),
+        pytest.raises(SystemExit) as excinfo,
+    ):
+        pigame.main()
+    assert excinfo.value.code == 1
+    assert not (pigame.PRACTICE_CONFIG_DIR / "stats.json").exists()
+
+
 @pytest.mark.parametrize(
     ("digit", "expected"),
     [
@@ -160,5 +703,735 @@ def test_practice_mode_keyboard_interrupt() -> None:
             assert len(stats["history"]) == 1
 
 
+def test_sm2_update_schedules_growing_intervals() -> None:
+    """Successful reviews grow the interval; a lapse resets it."""
+    now = 1_000_000.0
+    state = pigame.ChunkState(index=0)
+
+    intervals = [pigame.sm2_update(state, 5, now).interval for _ in range(3)]
+    assert intervals[0] == 1
+    assert intervals[1] == 6
+    assert intervals[2] > intervals[1]
+    assert state.due == now + state.interval * pigame.SECONDS_PER_DAY
+
+    pigame.sm2_update(state, 1, now)
+    assert state.repetitions == 0
+    assert state.interval == 1
+    assert state.lapses == 1
+    assert state.easiness >= pigame.SM2_MIN_EASINESS
+
+
+def test_grade_chunk_recall() -> None:
+    """Mistakes fail the chunk; speed separates the passing grades."""
+    assert pigame.grade_chunk_recall(0, 5, 1.0) == 0
+    assert pigame.grade_chunk_recall(3, 5, 1.0) == 1
+    assert pigame.grade_chunk_recall(5, 5, 2.0) == 5
+    assert pigame.grade_chunk_recall(5, 5, 10.0) == 4
+    assert pigame.grade_chunk_recall(5, 5, 60.0) == 3
+
+
+def test_review_store_queue_prefers_due_then_new() -> None:
+    """Overdue and hard chunks come first, new chunks fill the rest."""
+    store = pigame.ChunkReviewStore(chunk_size=5)
+    store.get(0).due = 50.0
+    store.get(1).due = 500.0  # not yet due
+    store.get(2).due = 10.0
+    store.get(2).easiness = 1.3
+
+    assert store.session_queue(now=100.0, limit=4, max_chunks=10) == [2, 0, 3, 4]
+    assert store.session_queue(now=100.0, limit=4, max_chunks=4) == [2, 0, 3]
+
+
+def test_review_store_round_trip_and_chunk_size_change() -> None:
+    """States survive serialisation but are discarded for another chunk size."""
+    store = pigame.ChunkReviewStore(chunk_size=5)
+    pigame.sm2_update(store.get(3), 4, 0.0)
+    data = json.loads(json.dumps(store.to_dict()))
+
+    loaded = pigame.ChunkReviewStore.from_dict(data, chunk_size=5)
+    assert loaded.chunks == store.chunks
+    assert len(pigame.ChunkReviewStore.from_dict(data, chunk_size=4)) == 0
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_review_session_updates_store() -> None:
+    """A review session grades each chunk and persists the schedule."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    pi = pigame.calculate_pi(10)
+    typed = iter(pi[2:7] + "0")  # first chunk right, second chunk wrong
+
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch.object(pigame, "PRACTICE_REVIEW_FILE", config_dir / "r.json"),
+        mock.patch("pigame.input_digit", side_effect=lambda: next(typed)),
+        mock.patch("termios.tcsetattr"),
+        mock.patch("termios.tcgetattr"),
+        mock.patch("sys.stdin"),
+    ):
+        pigame.practice_mode(mode="review", chunk_size=5, max_digits=10)
+        store = pigame.load_review_store(5)
+
+    assert store.chunks[0].repetitions == 1
+    assert store.chunks[1].repetitions == 0
+
+    stats = pigame.load_practice_stats()
+    assert stats["total_digits_correct"] == 5
+    assert stats["history"][-1]["mode"] == "review"
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_practice_from_position_window() -> None:
+    """Levels only cover the window after --from-position."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    pi = pigame.calculate_pi(310)
+    typed = iter(pi[302:305])
+    output = io.StringIO()
+
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch("pigame.input_digit", side_effect=lambda: next(typed)),
+        mock.patch("time.sleep"),
+        mock.patch("sys.stdout", output),
+    ):
+        pigame.practice_mode(
+            mode="standard",
+            min_digits=3,
+            from_position=300,
+            window=3,
+            visual_aid=False,
+        )
+
+    text = output.getvalue()
+    assert f"Digits 291-300: …{pi[292:302]}" in text
+    assert "[301] " in text
+    assert "maximum level" in text
+
+    stats = pigame.load_practice_stats()
+    assert stats["max_digits"] == 0  # digits 1-300 were never recited
+    assert stats["history"][-1]["furthest_position"] == 303
+    assert stats["total_digits_correct"] == 3
+    assert "Furthest position reached: 303" in text
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_window_does_not_raise_all_time_best() -> None:
+    """A normal session after a windowed one starts from the real best."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    output = io.StringIO()
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch("sys.stdout", output),
+    ):
+        pigame.practice_mode(
+            min_digits=5,
+            max_digits=10,
+            source=pigame.SyntheticTypist(),
+            ui="plain",
+        )
+        pigame.practice_mode(
+            min_digits=5,
+            from_position=300,
+            window=8,
+            source=pigame.SyntheticTypist(),
+            ui="plain",
+        )
+        assert pigame.load_practice_stats()["max_digits"] == 10
+
+        output.seek(0)
+        output.truncate()
+        pigame.practice_mode(
+            min_digits=5,
+            max_digits=12,
+            source=pigame.SyntheticTypist(),
+            ui="plain",
+        )
+
+    assert "Your best: 10 digits\nStarting with 11 digits" in output.getvalue()
+    assert pigame.load_practice_stats()["max_digits"] == 12
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_practice_from_position_beyond_digits() -> None:
+    """Starting past the available digits is rejected without a session."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    output = io.StringIO()
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch("sys.stdout", output),
+    ):
+        pigame.practice_mode(from_position=10_000)
+
+    assert "Cannot start at position 10000" in output.getvalue()
+    assert pigame.load_practice_stats()["total_practice_sessions"] == 0
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+@pytest.mark.parametrize("frontier", [3, 37, 64, 99])
+def test_practice_calibration_finds_frontier(frontier: int) -> None:
+    """Calibration finds the frontier in O(log n) levels, then practice starts."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    levels: list[int] = []
+
+    def fake_standard_practice(_pi_digits, current_digits, **_kwargs):
+        levels.append(current_digits)
+        if len(levels) > 20:
+            raise KeyboardInterrupt
+        return current_digits <= frontier, min(current_digits, frontier)
+
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch("pigame.standard_practice", side_effect=fake_standard_practice),
+        mock.patch("time.sleep"),
+        mock.patch("termios.tcsetattr"),
+        mock.patch("termios.tcgetattr"),
+        mock.patch("sys.stdin"),
+        mock.patch("sys.stdout", io.StringIO()),
+    ):
+        pigame.practice_mode(max_digits=100, calibrate=True)
+
+    calibration = levels[: levels.index(frontier + 1)]
+    assert len(calibration) <= 2 * 7 + 1  # 2 * log2(100) + 1
+    assert levels[len(calibration)] == frontier + 1
+    assert pigame.load_practice_stats()["max_digits"] == frontier
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_calibrated_window_does_not_raise_all_time_best() -> None:
+    """A frontier calibrated after --from-position is not the all-time best."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+
+    levels: list[int] = []
+
+    def fake_standard_practice(_pi_digits, current_digits, **_kwargs):
+        levels.append(current_digits)
+        if len(levels) > 10:
+            raise KeyboardInterrupt
+        return current_digits <= 12, min(current_digits, 12)
+
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch("pigame.standard_practice", side_effect=fake_standard_practice),
+        mock.patch("time.sleep"),
+        mock.patch("sys.stdout", io.StringIO()),
+    ):
+        pigame.practice_mode(
+            from_position=300,
+            window=20,
+            calibrate=True,
+            source=pigame.SyntheticTypist(),
+        )
+
+    stats = pigame.load_practice_stats()
+    assert stats["max_digits"] == 0
+    assert stats["history"][-1]["furthest_position"] == 312
+
+
+def test_input_source_requires_read_digit() -> None:
+    """A source that cannot read digits cannot be created."""
+
+    class Silent(pigame.InputSource):
+        pass
+
+    with pytest.raises(TypeError, match="read_digit"):
+        Silent()
+
+
+def test_practice_view_requires_message_and_digit() -> None:
+    """A view must at least show messages and typed digits."""
+
+    class Blank(pigame.PracticeView):
+        def message(self, text: str) -> None:
+            pass
+
+    with pytest.raises(TypeError, match="digit"):
+        Blank()
+
+
+def test_scripted_input_source_from_file() -> None:
+    """Script lines hold KEYS [DELAY]; comments and blanks are skipped."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script = Path(temp_dir) / "session.txt"
+        script.write_text("# warm-up\n14 0.5\n\n159  # no delay\n")
+        source = pigame.ScriptedInputSource.from_file(script)
+
+    assert source.keys == "14159"
+    assert source.delays == [0.5, 0.5, 0.0, 0.0, 0.0]
+    assert [source.read_digit() for _ in range(5)] == list("14159")
+    with pytest.raises(EOFError):
+        source.read_digit()
+
+
+def test_scripted_input_source_rejects_bad_lines() -> None:
+    """Lines with more than two fields are reported with their line number."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script = Path(temp_dir) / "session.txt"
+        script.write_text("14 0.5 extra\n")
+        with pytest.raises(ValueError, match=r"session.txt:1"):
+            pigame.ScriptedInputSource.from_file(script)
+
+
+def test_synthetic_typist_error_rate() -> None:
+    """The typist types the expected digit unless it makes a mistake."""
+    perfect = pigame.SyntheticTypist(seed=1)
+    assert all(perfect.read_digit(d) == d for d in "0123456789")
+
+    sloppy = pigame.SyntheticTypist(error_rate=1.0, max_keystrokes=3, seed=1)
+    assert all(sloppy.read_digit(d) != d for d in "141")
+    with pytest.raises(EOFError):
+        sloppy.read_digit("5")
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+@pytest.mark.parametrize("mode", ["standard", "timed", "chunk"])
+def test_practice_mode_headless_synthetic_typist(mode: str) -> None:
+    """Practice runs without a TTY and without sleeping or saving stats."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    typist = pigame.SyntheticTypist(error_rate=0.05, seed=7)
+    output = io.StringIO()
+
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch("pigame.input_digit", side_effect=AssertionError("TTY used")),
+        mock.patch("time.sleep", side_effect=AssertionError("slept")),
+        mock.patch("sys.stdout", output),
+    ):
+        pigame.practice_mode(
+            mode=mode,
+            min_digits=5,
+            max_digits=20,
+            source=typist,
+            save_stats=False,
+        )
+
+    assert "reached the maximum level" in output.getvalue()
+    assert "Digits correct:" in output.getvalue()
+    assert pigame.load_practice_stats()["total_practice_sessions"] == 0
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_practice_mode_other_constant_keeps_own_stats() -> None:
+    """Practising e uses e's digits and its own statistics file."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    output = io.StringIO()
+
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch("sys.stdout", output),
+    ):
+        pigame.practice_mode(
+            mode="standard",
+            min_digits=5,
+            max_digits=8,
+            constant="e",
+            source=pigame.SyntheticTypist(),
+            ui="plain",
+        )
+
+    assert "Practice memorizing digits of e one by one." in output.getvalue()
+    assert "2.71828" in output.getvalue()
+    assert pigame.load_practice_stats("e")["max_digits"] == 8
+    assert pigame.load_practice_stats()["total_practice_sessions"] == 0
+    assert (config_dir / "stats-e.json").exists()
+
+
+def test_digit_buffer_is_shared_per_constant() -> None:
+    """Each constant's digits are built once and agree with the calculators."""
+    assert pigame._digit_buffer("phi") is pigame._digit_buffer("phi")  # noqa: SLF001
+    buffer = pigame._digit_buffer("pi")  # noqa: SLF001
+    assert buffer == pigame.calculate_pi(len(buffer) - 2)
+    assert buffer.startswith(pigame.calculate_constant("pi", 10))
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_main_replay_runs_script() -> None:
+    """--replay FILE drives a practice session from a keystroke script."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    script = config_dir / "session.txt"
+    script.write_text(pigame.calculate_pi(6)[2:] + " 0.01\n")
+    output = io.StringIO()
+
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch(
+            "sys.argv", ["pigame", "--replay", str(script), "--max-digits", "6"]
+        ),
+        mock.patch("sys.stdout", output),
+        pytest.raises(SystemExit) as excinfo,
+    ):
+        pigame.main()
+
+    assert excinfo.value.code == 0
+    assert "--- Level: 5 digits ---" in output.getvalue()
+    assert "Practice session ended." in output.getvalue()
+    assert "Digits correct: 5" in output.getvalue()
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**35 + 7])
+def test_varint_round_trip(value: int) -> None:
+    """Varints decode to the value that was encoded."""
+    buffer = bytearray(b"x")
+    pigame.encode_varint(value, buffer)
+    assert pigame.decode_varint(bytes(buffer), 1) == (value, len(buffer))
+
+
+def test_decode_varint_truncated() -> None:
+    """A varint cut off mid-way is rejected."""
+    with pytest.raises(ValueError, match="Truncated"):
+        pigame.decode_varint(b"\x80", 0)
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_recorded_session_replays_and_rescores() -> None:
+    """Recorded keystrokes re-score to the session's own result."""
+    config_dir = pigame.PRACTICE_CONFIG_DIR
+    output = io.StringIO()
+
+    with (
+        mock.patch.object(pigame, "PRACTICE_CONFIG_FILE", config_dir / "c.json"),
+        mock.patch.object(pigame, "PRACTICE_SESSIONS_DIR", config_dir / "sessions"),
+        mock.patch("sys.stdout", output),
+    ):
+        pigame.practice_mode(
+            min_digits=5,
+            max_digits=12,
+            source=pigame.SyntheticTypist(error_rate=0.1, seed=3),
+            record=True,
+        )
+
+    recordings = list((config_dir / "sessions").glob("*.pgr"))
+    assert len(recordings) == 1
+    header, events = pigame.read_session_recording(recordings[0])
+    assert header["constant"] == "pi"
+    assert events[0] == ("level", 0, 5)
+
+    summary = pigame.replay_session(recordings[0], score_only=True)
+    stats = pigame.load_practice_stats()
+    assert summary["correct"] == stats["total_digits_correct"]
+    assert summary["keystrokes"] == sum(1 for e in events if e[0] == "key")
+    assert summary["mismatches"] == 0
+
+
+def test_recordings_started_together_do_not_clobber(tmp_path: Path) -> None:
+    """A recording never truncates an existing one with the same name."""
+    path = tmp_path / "20260101-100000.pgr"
+    first = pigame.SessionRecorder(path, {"constant": "pi"})
+    second = pigame.SessionRecorder(path, {"constant": "e"})
+    for recorder, digit in ((first, "1"), (second, "7")):
+        recorder.begin_level(0, 1)
+        recorder.keystroke(digit, correct=True)
+        recorder.close()
+
+    assert (first.path, second.path) == (path, tmp_path / "20260101-100000-2.pgr")
+    for recorder, constant, digit in ((first, "pi", "1"), (second, "e", "7")):
+        header, events = pigame.read_session_recording(recorder.path)
+        assert header["constant"] == constant
+        assert events[1][:3] == ("key", digit, True)
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_replay_command_flags_tampered_recording() -> None:
+    """Recordings whose stored correctness was edited fail re-scoring."""
+    path = pigame.PRACTICE_CONFIG_DIR / "tampered.pgr"
+    recorder = pigame.SessionRecorder(path, {"constant": "pi"})
+    recorder.begin_level(0, 2)
+    recorder.keystroke("1", correct=True)
+    recorder.keystroke("9", correct=True)  # wrong digit claimed as correct
+    recorder.close()
+
+    with (
+        mock.patch("sys.argv", ["pigame", "replay", str(path), "--score"]),
+        mock.patch("sys.stdout", io.StringIO()) as output,
+        pytest.raises(SystemExit) as excinfo,
+    ):
+        pigame.main()
+
+    assert excinfo.value.code == 1
+    assert "Digits correct: 1" in output.getvalue()
+    assert "1 keystroke(s) disagree" in output.getvalue()
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_replay_command_rejects_unknown_constant(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A recording for an unknown constant is reported, not a traceback."""
+    path = pigame.PRACTICE_CONFIG_DIR / "unknown.pgr"
+    recorder = pigame.SessionRecorder(path, {"constant": "tau"})
+    recorder.begin_level(0, 1)
+    recorder.keystroke("1", correct=True)
+    recorder.close()
+
+    with pytest.raises(pigame.UnknownConstantError, match="'tau'"):
+        pigame.read_session_recording(path)
+    with (
+        mock.patch("sys.argv", ["pigame", "replay", str(path), "--score"]),
+        mock.patch("sys.stdout", io.StringIO()),
+        pytest.raises(SystemExit) as excinfo,
+    ):
+        pigame.main()
+
+    assert excinfo.value.code == 1
+    assert "Cannot replay" in caplog.text
+
+
+def test_screen_model_reports_only_changed_cells() -> None:
+    """Damage covers every cell once, then only cells that changed."""
+    model = pigame.ScreenModel(3, 10)
+    model.put(0, 0, "abc")
+    assert len(model.damage()) == 3
+    assert model.damage() == []
+
+    model.put(0, 0, "abX")
+    model.put(1, 4, "12", pigame.ScreenModel.CORRECT)
+    assert model.damage() == [
+        (0, 2, "X", pigame.ScreenModel.NORMAL),
+        (1, 4, "12", pigame.ScreenModel.CORRECT),
+    ]
+
+    # Wide characters take two cells and text is clipped to the row
+    model.put(2, 0, "🎉 Perfect!")
+    assert model.text(2) == "🎉 Perfect"
+
+
+def test_practice_screen_scrolls_long_levels() -> None:
+    """A 1200-digit level scrolls by rows and costs one cell per digit."""
+    screen = pigame.PracticeScreen(8, 40)
+    screen.begin_level("3.")
+    screen.model.damage()
+
+    digits = "1415926535" * 120
+    scrolls = 0
+    for i, digit in enumerate(digits):
+        screen.append(digit, pigame.ScreenModel.CORRECT)
+        if (i + 1) % 5 == 0:
+            screen.append(" ")
+        runs = screen.model.damage()
+        if len(runs) > 2:
+            scrolls += 1
+
+    width = screen.pane_width
+    assert width == 36
+    total_cells = 2 + len(digits) + len(digits) // 5
+    assert scrolls <= total_cells // width
+    # The last row of digits is on screen, just above the status row
+    row, _ = screen.cursor()
+    assert row == screen.PANE_TOP + screen.pane_rows - 1
+    tail = screen.model.text(row - 1) + screen.model.text(row)
+    assert tail.replace(" ", "").endswith("26535")
+
+
+def test_practice_screen_resize_redraws_layout() -> None:
+    """After a resize every cell is redrawn at the new size."""
+    screen = pigame.PracticeScreen(6, 30)
+    screen.set_timer("00:05")
+    screen.begin_level("3.")
+    screen.append("14159")
+    screen.model.damage()
+
+    screen.resize(10, 50)
+    runs = screen.model.damage()
+    assert {row for row, *_ in runs} == set(range(10))
+    assert screen.model.text(0).rstrip().endswith("00:05")
+    assert screen.model.text(screen.PANE_TOP).startswith("3.14159")
+
+
+def test_stream_input_source_reads_any_fd() -> None:
+    """Digits are read from a pipe, skipping other bytes, until EOF."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"3.14 15\n9")
+    os.close(write_fd)
+
+    source = pigame.StreamInputSource(read_fd)
+    try:
+        assert [source.read_digit() for _ in range(6)] == list("314159")
+        with pytest.raises(EOFError):
+            source.read_digit()
+    finally:
+        os.close(read_fd)
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_practice_mode_ndjson_over_pipe() -> None:
+    """Every line of NDJSON output is an event, ending with the summary."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"14159\n141592\n1415927")
+    os.close(write_fd)
+    output = io.StringIO()
+
+    with (
+        mock.patch.object(
+            pigame, "PRACTICE_CONFIG_FILE", pigame.PRACTICE_CONFIG_DIR / "c.json"
+        ),
+        mock.patch("sys.stdout", output),
+    ):
+        pigame.practice_mode(
+            min_digits=5,
+            max_digits=10,
+            ui="ndjson",
+            source=pigame.StreamInputSource(read_fd),
+        )
+    os.close(read_fd)
+
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    digits = [e for e in events if e["event"] == "digit"]
+    assert [e["prefix"] for e in events if e["event"] == "level"] == ["3."] * 4
+    assert "".join(e["digit"] for e in digits) == "141591415921415927"
+    assert digits[-1]["correct"] is False
+    summary = next(e for e in events if e["event"] == "summary")
+    assert summary["correct_digits"] == 17
+    assert summary["max_level"] == 6
+
+
+@pytest.mark.usefixtures("_mock_practice_config")
+def test_main_practice_plain_ui_from_fd() -> None:
+    """--ui plain with --input-fd needs no terminal and writes no escapes."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"14159")
+    os.close(write_fd)
+
+    argv = ["pigame", "--practice", "--ui", "plain", "--input-fd", str(read_fd)]
+    argv += ["--min-digits", "5", "--max-digits", "5", "--no-visual-aid"]
+    with (
+        mock.patch.object(
+            pigame, "PRACTICE_CONFIG_FILE", pigame.PRACTICE_CONFIG_DIR / "c.json"
+        ),
+        mock.patch("sys.argv", argv),
+        mock.patch("sys.stdout", io.StringIO()) as output,
+        pytest.raises(SystemExit) as excinfo,
+    ):
+        pigame.main()
+    os.close(read_fd)
+
+    assert excinfo.value.code == 0
+    assert "3.14159" in output.getvalue()
+    assert "\033" not in output.getvalue()
+
+
+def test_race_leaderboard_drops_stale_entries() -> None:
+    """Only the latest score of each player is ranked."""
+    board = pigame.RaceLeaderboard()
+    for correct in range(1, 200):
+        board.update("ann", correct, correct * 0.5)
+    board.update("bob", 150, 60.0)
+    board.update("cy", 199, 90.0)
+
+    assert board.top(2) == [("cy", 199, 90.0), ("ann", 199, 99.5)]
+    ranked = [name for name, *_ in board.top(len(board))]
+    assert ranked.index("bob") + 1 == 3
+
+    board.remove("cy")
+    assert [name for name, *_ in board.top(5)] == ["ann", "bob"]
+
+
+def test_race_lobby_holds_only_expected_players() -> None:
+    """A full lobby turns players away until someone leaves."""
+    joined = []
+
+    async def lobby(path: Path) -> tuple[dict, set]:
+        host = pigame.RaceHost("1415", players=2, on_join=joined.append)
+        await host.start(socket_path=path)
+
+        async def join(name: str) -> tuple:
+            reader, writer = await asyncio.open_unix_connection(path)
+            pigame._race_send(writer, {"type": "join", "name": name})  # noqa: SLF001
+            await writer.drain()
+            return reader, writer, await pigame._race_read(reader)  # noqa: SLF001
+
+        ann, bob = await join("ann"), await join("bob")
+        refused = (await join("cy"))[2]
+        # Ann leaves; the host frees her seat and hangs up
+        ann[1].write_eof()
+        await ann[0].read()
+        ann[1].close()
+        dee = await join("dee")
+        players = set(host.players)
+        host.server.close()
+        for _, writer, _ in (bob, dee):
+            writer.close()
+        return refused, players
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        refused, players = asyncio.run(lobby(Path(temp_dir) / "race.sock"))
+
+    assert refused == {"type": "error", "message": "Race is full"}
+    assert players == {"bob", "dee"}
+    assert joined == ["ann", "bob", "dee"]
+
+
+def test_race_host_does_not_take_over_a_live_race() -> None:
+    """A second host on the same socket is refused; the first keeps it."""
+
+    async def hosts(path: Path) -> None:
+        first = pigame.RaceHost("1415")
+        await first.start(socket_path=path)
+        with pytest.raises(OSError, match="already listening"):
+            await pigame.RaceHost("1415").start(socket_path=path)
+        # The first race still answers on its socket
+        _, writer = await asyncio.open_unix_connection(path)
+        writer.close()
+        first.server.close()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        asyncio.run(hosts(Path(temp_dir) / "race.sock"))
+
+
+def test_race_host_reports_busy_port(caplog: pytest.LogCaptureFixture) -> None:
+    """A port in use is reported without a traceback."""
+    with socket.socket() as busy:
+        busy.bind(("127.0.0.1", 0))
+        busy.listen()
+        port = busy.getsockname()[1]
+        with (
+            mock.patch("sys.argv", ["pigame", "race", "host", "--port", str(port)]),
+            mock.patch("builtins.print"),
+            pytest.raises(SystemExit) as excinfo,
+        ):
+            pigame.main()
+
+    assert excinfo.value.code == 1
+    assert "Cannot host the race" in caplog.text
+    assert "Traceback" not in caplog.text
+
+
+def test_race_ranks_concurrent_players() -> None:
+    """Dozens of simulated players race over a Unix socket to one ranking."""
+    players = 24
+
+    async def race(path: Path) -> tuple[list, list]:
+        host = pigame.RaceHost(
+            pigame.calculate_pi(40)[2:],
+            players=players,
+            countdown=0.05,
+            tick=0.01,
+            time_limit=30,
+        )
+        await host.start(socket_path=path)
+        hosting = asyncio.create_task(host.run())
+        results = await asyncio.gather(
+            *(
+                pigame.race_client(
+                    f"p{i}",
+                    socket_path=path,
+                    source=pigame.SyntheticTypist(error_rate=0.05 * (i % 4), seed=i),
+                    view=pigame.NdjsonView(stream=io.StringIO()),
+                )
+                for i in range(players)
+            ),
+        )
+        return await hosting, results
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        ranking, results = asyncio.run(race(Path(temp_dir) / "race.sock"))
+
+    assert len(ranking) == players
+    assert all(result == ranking for result in results)
+    assert all(entry["done"] for entry in ranking)
+    keys = [(-entry["correct"], entry["seconds"]) for entry in ranking]
+    assert keys == sorted(keys)
+    # Players who never make a mistake type every digit
+    perfect = {entry["name"] for entry in ranking if entry["correct"] == 40}
+    assert {f"p{i}" for i in range(0, players, 4)} <= perfect
+
+
 if __name__ == "__main__":
     pytest.main()
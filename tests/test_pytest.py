@@ -3,7 +3,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+import json
+import os
+import socket
 import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
@@ -13,7 +22,7 @@ from src.python import pigame
 
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterator
 
 
 # Test constants
@@ -467,3 +476,594 @@ class TestCalculatePiEdgeCases:
         expected_length = num_decimals + 2  # "3." + decimals
         assert len(result) == expected_length
         assert result.startswith("3.14159265358979323846")
+
+
+class TestFastPathParser:
+    """The fast-path parser agrees with the full argparse parser."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            [VALID_PI_SHORT],
+            ["-p", "10"],
+            ["-p10"],
+            ["-v", "-c", VALID_PI_LONG],
+            ["-p", "5", "-v", VALID_PI_SHORT],
+            ["--constant", "e", "2.718"],
+            ["-V"],
+            ["--debug", "-p", "3"],
+        ],
+    )
+    def test_matches_full_parser(self: TestFastPathParser, argv: list[str]) -> None:
+        """Common command lines parse exactly as argparse parses them."""
+        fast = pigame._parse_fast_path(argv)  # noqa: SLF001
+        full = pigame._create_argument_parser().parse_args(argv)  # noqa: SLF001
+        assert fast is not None
+        assert vars(fast) == vars(full)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--practice"],
+            ["--config"],
+            ["-h"],
+            ["-p"],
+            ["-p", "-5"],
+            ["--constant", "tau"],
+            ["3.14", "3.15"],
+            ["--stats", "--constant", "e"],
+        ],
+    )
+    def test_falls_back_to_full_parser(
+        self: TestFastPathParser,
+        argv: list[str],
+    ) -> None:
+        """Anything else is left to argparse (including its errors)."""
+        assert pigame._parse_fast_path(argv) is None  # noqa: SLF001
+
+
+class TestLibraryApi:
+    """The library functions return results and raise typed errors."""
+
+    def test_score_reports_errors(
+        self: TestLibraryApi,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Scoring returns a result and prints nothing."""
+        result = pigame.score(INCORRECT_PI)
+        assert not result.match
+        assert result.errors == (6,)
+        assert result.expected == VALID_PI_SHORT
+        assert pigame.score(VALID_PI_SHORT).match
+        assert pigame.score("2.718", "e").match
+        assert pigame.score("3.14", decimals=5).expected == VALID_PI_SHORT
+        assert capsys.readouterr() == ("", "")
+
+    @pytest.mark.parametrize(
+        ("call", "error"),
+        [
+            (lambda: pigame.score("3.14.15"), pigame.InvalidDigitsError),
+            (lambda: pigame.score("3,14"), pigame.InvalidDigitsError),
+            (lambda: pigame.score("3.14", "tau"), pigame.UnknownConstantError),
+            (lambda: pigame.digits(-1), pigame.NegativeLengthError),
+            (lambda: pigame.digits(99999), pigame.TooManyDigitsError),
+            (lambda: pigame.digits(600), pigame.TooManyDigitsError),
+        ],
+    )
+    def test_errors_are_typed(self: TestLibraryApi, call, error) -> None:
+        """Bad requests raise PiError subclasses instead of exiting."""
+        with pytest.raises(error) as exc_info:
+            call()
+        assert isinstance(exc_info.value, pigame.PiError)
+
+    @pytest.mark.parametrize("constant", ["pi", "e"])
+    def test_too_many_digits_reports_available(
+        self: TestLibraryApi, constant: str
+    ) -> None:
+        """The error names how many decimals the constant really has."""
+        available = len(pigame._CONSTANT_DIGIT_STRINGS[constant])  # noqa: SLF001
+        with pytest.raises(
+            pigame.TooManyDigitsError, match=f"only {available} are available"
+        ):
+            pigame.digits(99999, constant)
+
+    def test_format_score_matches_cli(self: TestLibraryApi) -> None:
+        """The report is what the command line prints."""
+        assert pigame.digits(10) == "3.1415926535"
+        assert pigame.format_digits(pigame.digits(10)) == "3.14159 26535"
+
+        report = pigame.format_score(pigame.score(INCORRECT_PI), verbose=True)
+        lines = report.splitlines()
+        assert lines[0] == "π with 5 decimals:\t3.14159"
+        assert lines[1] == f"Your version of π:\t{INCORRECT_PI}"
+        assert lines[-2:] == ["Found 1 incorrect digits", "You can do better!"]
+        assert pigame.format_score(pigame.score(VALID_PI_SHORT)).endswith("\nMatch")
+
+
+class TestOutputCache:
+    """Repeated digit output is served from a byte-bounded LRU."""
+
+    def test_digits_output_is_cached(self: TestOutputCache) -> None:
+        """The second identical request is a hit returning the same bytes."""
+        pigame.OUTPUT_CACHE.clear()
+        before = pigame.OUTPUT_CACHE.stats()
+        first = pigame.digits_output(10)
+        assert first == b"3.14159 26535\n"
+        assert pigame.digits_output(10) is first
+        assert pigame.digits_output(10, fmt="plain") == b"3.1415926535\n"
+        assert pigame.digits_output(5, "e", fmt="verbose") == (
+            b"e with 5 decimals:\t2.71828\n"
+        )
+        assert pigame.digits_output(3, fmt="json") == b'{"digits":"3.141"}'
+
+        stats = pigame.OUTPUT_CACHE.stats()
+        assert stats.hits - before.hits == 1
+        assert stats.misses - before.misses == 4
+        assert stats.entries == 4
+        assert stats.size == len(
+            b"3.14159 26535\n3.1415926535\ne with 5 decimals:\t2.71828\n"
+            b'{"digits":"3.141"}'
+        )
+
+    def test_errors_are_not_cached(self: TestOutputCache) -> None:
+        """Bad requests raise every time and leave nothing behind."""
+        cache = pigame.ByteLRU()
+        with patch.object(pigame, "OUTPUT_CACHE", cache):
+            for _ in range(2):
+                with pytest.raises(pigame.TooManyDigitsError):
+                    pigame.digits_output(99999)
+        assert len(cache) == 0
+        assert cache.misses == 2
+
+    def test_lru_evicts_by_bytes(self: TestOutputCache) -> None:
+        """The least recently used values go once the byte bound is passed."""
+        cache = pigame.ByteLRU(max_size=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        assert cache.get("a", bytes) == b"aaaa"  # "b" is now the oldest
+        cache.put("c", b"cccc")
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.size == 8
+        cache.put("huge", b"x" * 11)
+        assert "huge" not in cache
+        assert cache.get("b", lambda: b"bbbb") == b"bbbb"  # evicts "a"
+        assert "a" not in cache
+        assert cache.stats() == pigame.CacheStats(
+            hits=1, misses=1, entries=2, size=8, max_size=10
+        )
+
+    def test_cli_writes_cached_bytes(
+        self: TestOutputCache,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """pigame -p writes the cached output unchanged."""
+        with patch("sys.argv", ["pigame", "-p", "10"]), pytest.raises(SystemExit):
+            pigame.main()
+        assert capsys.readouterr().out == "3.14159 26535\n"
+        assert pigame.digits_output(10) == b"3.14159 26535\n"
+
+
+class TestMetrics:
+    """Counters and histograms render in the Prometheus text format."""
+
+    def test_render(self: TestMetrics) -> None:
+        """Histograms render cumulative buckets; label values are escaped."""
+        registry = pigame.MetricsRegistry()
+        latency = registry.histogram("t_seconds", "Latency.", bounds=(1, 2), op="a")
+        for value in (0.5, 2, 3):
+            latency.observe(value)
+        registry.counter("t_total", "Things.", user='x"y').inc(3)
+        registry.register_reader("t_bytes", "gauge", "Size.", lambda: 42)
+        assert registry.render().splitlines() == [
+            "# HELP t_seconds Latency.",
+            "# TYPE t_seconds histogram",
+            't_seconds_bucket{op="a",le="1"} 1',
+            't_seconds_bucket{op="a",le="2"} 2',
+            't_seconds_bucket{op="a",le="+Inf"} 3',
+            't_seconds_sum{op="a"} 5.5',
+            't_seconds_count{op="a"} 3',
+            "# HELP t_total Things.",
+            "# TYPE t_total counter",
+            't_total{user="x\\"y"} 3',
+            "# HELP t_bytes Size.",
+            "# TYPE t_bytes gauge",
+            "t_bytes 42",
+        ]
+
+    def test_same_metric_returned(self: TestMetrics) -> None:
+        """A name and labels always give the same metric, of one kind."""
+        registry = pigame.MetricsRegistry()
+        counter = registry.counter("t_total", "Things.", op="a")
+        assert registry.counter("t_total", "Things.", op="a") is counter
+        assert registry.counter("t_total", "Things.", op="b") is not counter
+        with pytest.raises(ValueError, match="is a counter"):
+            registry.histogram("t_total", "Things.")
+
+    def test_library_calls_are_recorded(self: TestMetrics) -> None:
+        """score() and digits() update their metrics."""
+        histogram = pigame._SCORE_SECONDS[1]  # noqa: SLF001
+        generated = pigame._DIGITS_GENERATED  # noqa: SLF001
+        count, total = histogram.count, generated.value
+        pigame.score(VALID_PI_LONG)
+        assert histogram.count == count + 1
+        assert generated.value == total + len(VALID_PI_LONG) - 2
+
+    def test_metrics_dump(self: TestMetrics, pigame_exec: Path) -> None:
+        """--metrics-dump prints the run's metrics to stderr."""
+        result = subprocess.run(
+            [str(pigame_exec), "--metrics-dump", "-p", str(TEST_LENGTH_SHORT)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout == "3.14159\n"
+        assert "# TYPE pigame_score_seconds histogram" in result.stderr
+        assert "\npigame_digits_generated_total 5\n" in result.stderr
+
+
+class TestStdioWorker:
+    """--serve-stdio answers JSON requests line by line, in order."""
+
+    def test_requests_answered_in_order(self: TestStdioWorker) -> None:
+        """Each request gets one response line echoing its id."""
+        requests = [
+            {"id": 1, "op": "score", "answer": INCORRECT_PI},
+            {"id": 2, "op": "digits", "length": 10, "constant": "e"},
+            {"id": "f", "op": "format", "digits": "3.1415926535"},
+        ]
+        stdin = io.StringIO("".join(json.dumps(r) + "\n" for r in requests) + "\n")
+        stdout = io.StringIO()
+        assert pigame.serve_stdio(stdin, stdout) == 0
+
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert [r["id"] for r in responses] == [1, 2, "f"]
+        assert all(r["ok"] for r in responses)
+        assert responses[0]["result"]["errors"] == [6]
+        assert not responses[0]["result"]["match"]
+        assert responses[1]["result"] == {"digits": "2.7182818284"}
+        assert responses[2]["result"] == {"text": "3.14159 26535"}
+
+    @pytest.mark.parametrize(
+        ("request_line", "error_type"),
+        [
+            ("not json", "JSONDecodeError"),
+            ("[1, 2]", "TypeError"),
+            ('{"op": "nope"}', "ValueError"),
+            ('{"op": "score"}', "TypeError"),
+            ('{"op": "score", "answer": 3.14}', "TypeError"),
+            ('{"op": "digits", "length": true}', "TypeError"),
+            ('{"op": "score", "answer": "3,14"}', "InvalidDigitsError"),
+            ('{"op": "digits", "constant": "tau"}', "UnknownConstantError"),
+            ('{"op": "digits", "length": 99999}', "TooManyDigitsError"),
+        ],
+    )
+    def test_bad_requests_get_error_responses(
+        self: TestStdioWorker,
+        request_line: str,
+        error_type: str,
+    ) -> None:
+        """A bad request is answered with an error and the worker carries on."""
+        stdin = io.StringIO(f'{request_line}\n{{"id": 2, "op": "digits"}}\n')
+        stdout = io.StringIO()
+        pigame.serve_stdio(stdin, stdout)
+
+        error, following = map(json.loads, stdout.getvalue().splitlines())
+        assert not error["ok"]
+        assert error["error"]["type"] == error_type
+        assert following == {"id": 2, "ok": True, "result": {"digits": pigame.digits()}}
+
+    def test_serve_stdio_flag(self: TestStdioWorker, pigame_exec: Path) -> None:
+        """The command-line worker serves until stdin closes."""
+        result = subprocess.run(
+            [str(pigame_exec), "--serve-stdio"],
+            input='{"id": 7, "op": "score", "answer": "3.14159"}\n',
+            capture_output=True,
+            text=True,
+            check=True,
+        )  # - trusted input
+        response = json.loads(result.stdout)
+        assert response["id"] == 7
+        assert response["result"]["match"]
+
+
+async def _http_exchange(
+    service: pigame.ScoringService,
+    *raw_requests: bytes,
+) -> list[tuple[int, dict[str, str], dict]]:
+    """Send requests over one connection; return (status, headers, body) each."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+    responses = []
+    for raw in raw_requests:
+        writer.write(raw)
+        head = (await reader.readuntil(b"\r\n\r\n")).decode().split("\r\n")
+        headers = dict(line.split(": ", 1) for line in head[1:] if line)
+        body = await reader.readexactly(int(headers["Content-Length"]))
+        if headers["Content-Type"] == "application/json":
+            body = json.loads(body)
+        responses.append((int(head[0].split()[1]), headers, body))
+    writer.close()
+    return responses
+
+
+def _http_get(target: str) -> bytes:
+    return f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+
+
+def _http_post(target: str, body: bytes) -> bytes:
+    head = f"POST {target} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
+    return head.encode() + body
+
+
+def _run_service(exchange, **options) -> object:
+    """Run *exchange(service)* against a service on a free localhost port."""
+
+    async def run() -> object:
+        service = pigame.ScoringService(**options)
+        await service.start(port=0)
+        try:
+            return await exchange(service)
+        finally:
+            await service.close()
+
+    return asyncio.run(run())
+
+
+class TestHttpService:
+    """pigame serve --http answers on localhost with limits applied."""
+
+    def test_endpoints_on_one_kept_alive_connection(self: TestHttpService) -> None:
+        """Requests on one connection are all answered, in order."""
+        answer = json.dumps({"answer": INCORRECT_PI}).encode()
+        responses = _run_service(
+            lambda service: _http_exchange(
+                service,
+                _http_get("/constants"),
+                _http_get("/digits?length=10&constant=e"),
+                _http_post("/score", answer),
+                _http_get(f"/score?answer={VALID_PI_SHORT}"),
+            )
+        )
+        assert [status for status, _, _ in responses] == [200] * 4
+        assert all(h["Connection"] == "keep-alive" for _, h, _ in responses)
+        assert set(responses[0][2]["constants"]) == set(pigame.MATHEMATICAL_CONSTANTS)
+        assert responses[1][2] == {"digits": "2.7182818284"}
+        assert responses[2][2]["errors"] == [6]
+        assert responses[3][2]["match"]
+
+    def test_metrics_endpoint(self: TestHttpService) -> None:
+        """GET /metrics reports the requests answered so far."""
+        responses = _run_service(
+            lambda service: _http_exchange(
+                service,
+                _http_get("/digits?length=3"),
+                _http_get("/nope"),
+                _http_get("/metrics"),
+            )
+        )
+        status, headers, body = responses[2]
+        assert status == 200
+        assert headers["Content-Type"] == pigame.PROMETHEUS_CONTENT_TYPE
+        text = body.decode()
+        assert 'pigame_http_requests_total{path="/digits",status="200"}' in text
+        assert 'pigame_http_requests_total{path="other",status="404"}' in text
+        assert "pigame_output_cache_bytes " in text
+
+    @pytest.mark.parametrize(
+        ("raw", "status"),
+        [
+            (_http_get("/nope"), 404),
+            (b"DELETE /score HTTP/1.1\r\n\r\n", 405),
+            (_http_get("/digits?length=ten"), 400),
+            (_http_get("/score?answer=3,14"), 400),
+            (_http_post("/score", b"[1]"), 400),
+            (_http_post("/score", b"{not json"), 400),
+            (b"POST /score HTTP/1.1\r\nContent-Length: 70000\r\n\r\n", 413),
+            (b"GET / HTTP/2.0\r\n\r\n", 505),
+            (b"GET /" + b"x" * 9000 + b" HTTP/1.1\r\n\r\n", 431),
+        ],
+    )
+    def test_bad_requests(self: TestHttpService, raw: bytes, status: int) -> None:
+        """Bad requests get an error status and a JSON error body."""
+        ((got, _, body),) = _run_service(lambda service: _http_exchange(service, raw))
+        assert got == status
+        assert set(body["error"]) == {"type", "message"}
+
+    def test_rate_limit_per_client(self: TestHttpService) -> None:
+        """A client that spends its burst is told when to retry."""
+        responses = _run_service(
+            lambda service: _http_exchange(service, *[_http_get("/digits")] * 3),
+            rate=0.5,
+            burst=2,
+        )
+        assert [status for status, _, _ in responses] == [200, 200, 429]
+        assert responses[2][1]["Retry-After"] == "2"
+
+    def test_costly_requests_are_admitted_up_to_capacity(
+        self: TestHttpService,
+    ) -> None:
+        """While a costly request runs on the pool, another is turned away."""
+        started, release = threading.Event(), threading.Event()
+        handle_request = pigame.handle_request
+
+        def slow_handle_request(request):
+            started.set()
+            release.wait(5)
+            return handle_request(request)
+
+        long_answer = json.dumps({"answer": pigame.digits(500)}).encode()
+
+        async def exchange(service):
+            first = asyncio.create_task(
+                _http_exchange(service, _http_post("/score", long_answer))
+            )
+            await asyncio.to_thread(started.wait, 5)
+            (second,) = await _http_exchange(service, _http_get("/digits"))
+            release.set()
+            return (await first)[0], second
+
+        with patch.object(pigame, "handle_request", slow_handle_request):
+            first, second = _run_service(exchange, max_cost=2)
+        assert first[0] == 200
+        assert first[2]["match"]
+        assert second[0] == 503
+        assert second[1]["Retry-After"] == "1"
+
+    def test_token_bucket_refills(self: TestHttpService) -> None:
+        """Tokens come back at the configured rate, up to the burst."""
+        now = [0.0]
+        bucket = pigame.TokenBucket(rate=2, burst=4, clock=lambda: now[0])
+        assert bucket.take(4) == 0
+        assert bucket.take(1) == 0.5
+        now[0] = 1.0
+        assert bucket.take(2) == 0
+        now[0] = 100.0
+        assert bucket.full()
+
+
+def _run_client(socket_path: Path, *args: str, **kwargs) -> subprocess.CompletedProcess:
+    """Run pigame_client.py with PIGAME_SOCKET pointing at *socket_path*."""
+    script = Path(pigame.__file__).with_name("pigame_client.py")
+    env = {**os.environ, "PIGAME_SOCKET": str(socket_path)}
+    env.update(kwargs.pop("env", {}))
+    return subprocess.run(
+        [sys.executable, str(script), *args],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+        **kwargs,
+    )  # - trusted input
+
+
+@pytest.fixture
+def command_daemon(tmp_path: Path, pigame_exec: Path) -> Iterator[Path]:
+    """Run `pigame serve --daemon` on a socket in a temporary directory."""
+    socket_path = tmp_path / "pigame.sock"
+    daemon = subprocess.Popen(
+        [str(pigame_exec), "serve", "--daemon", "--socket", str(socket_path)],
+        stdout=subprocess.DEVNULL,
+    )  # - trusted input
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            with socket.socket(socket.AF_UNIX) as probe:
+                if probe.connect_ex(str(socket_path)) == 0:
+                    break
+            assert daemon.poll() is None, "daemon exited"
+            assert time.monotonic() < deadline, "daemon did not start"
+            time.sleep(0.05)
+        yield socket_path
+    finally:
+        daemon.terminate()
+        daemon.wait(10)
+    assert not socket_path.exists()
+
+
+class TestCommandDaemon:
+    """pigame_client runs commands in `pigame serve --daemon` when it can."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [["-p", "10"], ["-c", INCORRECT_PI], ["-p", "600"], ["--list"], ["-V"]],
+    )
+    def test_client_output_matches_pigame(
+        self: TestCommandDaemon,
+        command_daemon: Path,
+        pigame_exec: Path,
+        args: list[str],
+    ) -> None:
+        """A forwarded command prints and exits as pigame would."""
+        forwarded = _run_client(command_daemon, *args)
+        direct = subprocess.run(
+            [str(pigame_exec), *args], capture_output=True, text=True, check=False
+        )  # - trusted input
+        assert (forwarded.stdout, forwarded.returncode) == (
+            direct.stdout,
+            direct.returncode,
+        )
+        assert forwarded.stderr == direct.stderr
+
+    def test_client_forwards_stdin_cwd_and_environment(
+        self: TestCommandDaemon,
+        command_daemon: Path,
+        tmp_path: Path,
+    ) -> None:
+        """The command reads the client's stdin, in its directory and environment."""
+        requests = "".join(
+            json.dumps({"id": n, "op": "digits", "length": n}) + "\n"
+            for n in range(1, 4)
+        )
+        result = _run_client(
+            command_daemon,
+            "--serve-stdio",
+            input=requests,
+            cwd=tmp_path,
+            env={"PIGAME_DEBUG": "1"},
+        )
+        assert result.returncode == 0
+        responses = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [r["result"]["digits"] for r in responses] == ["3.1", "3.14", "3.141"]
+        assert "[DEBUG] pigame: serve_stdio: answered 3 request(s)" in result.stderr
+
+    def test_stalled_client_does_not_block_others(
+        self: TestCommandDaemon,
+        command_daemon: Path,
+    ) -> None:
+        """A client that connects and sends nothing does not hold up the next."""
+        with socket.socket(socket.AF_UNIX) as stalled:
+            stalled.connect(str(command_daemon))
+            # Sooner than the daemon would give up on the stalled client
+            result = _run_client(
+                command_daemon, "-p", "5", timeout=pigame.DAEMON_READ_TIMEOUT - 1
+            )
+        assert result.stdout == "3.14159\n"
+
+    def test_client_home_holds_practice_files(
+        self: TestCommandDaemon,
+        command_daemon: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Practice history goes under the client's HOME, not the daemon's."""
+        home = tmp_path / "home"
+        home.mkdir()
+        result = _run_client(
+            command_daemon,
+            "stats",
+            "import",
+            "--format",
+            "csv",
+            "-",
+            input="constant,date,mode,max_level,correct_digits,duration_seconds\n"
+            "pi,2024-02-01 07:00:00,standard,20,20,45\n",
+            env={"HOME": str(home)},
+        )
+        assert result.returncode == 0, result.stderr
+        assert "Imported 1 practice sessions" in result.stdout
+        assert (home / ".pigame" / "stats.json").exists()
+
+    def test_client_runs_in_process_without_daemon(
+        self: TestCommandDaemon,
+        tmp_path: Path,
+    ) -> None:
+        """With no daemon listening, the client runs pigame itself."""
+        result = _run_client(tmp_path / "missing.sock", "-p", "5")
+        assert result.returncode == 0
+        assert result.stdout == "3.14159\n"
+
+    def test_second_daemon_refuses_to_start(
+        self: TestCommandDaemon,
+        command_daemon: Path,
+        pigame_exec: Path,
+    ) -> None:
+        """A daemon already listening on the socket is left alone."""
+        result = subprocess.run(
+            [str(pigame_exec), "serve", "--daemon", "--socket", str(command_daemon)],
+            capture_output=True,
+            text=True,
+            check=False,
+        )  # - trusted input
+        assert result.returncode == 1
+        assert "already listening" in result.stderr
+        assert _run_client(command_daemon, "-p", "5").stdout == "3.14159\n"
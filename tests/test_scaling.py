@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Scale-sweep benchmarks for pigame core functions, 10 to 1,000,000 digits.
+
+Each function is timed at logarithmically spaced input sizes and a power law
+``seconds = c * digits ** k`` is fitted to the timings.  A test fails when
+the fitted exponent ``k`` exceeds the bound declared for the function, so a
+scaling regression (say, quadratic formatting) shows up long before it is
+noticeable at the few hundred digits the literals hold.  Sizes beyond the
+literals use synthetic digit strings built by repeating the real digits.
+
+The sweeps take tens of seconds, so they are marked ``slow`` and left out
+of the default run.  Run them with:
+    pytest tests/test_scaling.py -v -m slow
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.python import pigame
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+# ---------------------------------------------------------------------------
+# Sweep parameters
+# ---------------------------------------------------------------------------
+
+# Half-decade steps from 10 to 1,000,000 digits
+SIZES = tuple(round(10 ** (step / 2)) for step in range(2, 13))
+
+# Smallest size included in the fit; below it fixed per-call overhead, not
+# the digits, dominates and would flatten the fitted exponent
+FIT_FROM = 1000
+
+# Added to every declared bound to absorb timing noise (a quadratic
+# regression fits near 2, far above it)
+EXPONENT_SLACK = 0.25
+
+# Digits processed per timing, so that small sizes are timed over many calls
+DIGITS_PER_TIMING = 100_000
+TIMING_REPEATS = 3
+
+# Every wrong digit in the synthetic answers is this many digits apart
+ERROR_SPACING = 100
+
+# Decimals held by the pi literal, repeated to build larger inputs.  Nor can
+# calculate_pi be swept past them, which is why it has no sweep: every size
+# it reaches is below FIT_FROM, where per-call overhead hides the scaling
+PI_AVAILABLE = len(pigame._CONSTANT_DIGIT_STRINGS["pi"])  # noqa: SLF001
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _synthetic_pi(decimals: int) -> str:
+    """Return ``"3."`` and *decimals* digits, repeating pi's known digits."""
+    known = pigame.calculate_pi(PI_AVAILABLE)[2:]
+    return "3." + (known * (decimals // len(known) + 1))[:decimals]
+
+
+def _with_errors(value: str) -> str:
+    """Return *value* with every ERROR_SPACING-th decimal changed."""
+    chars = list(value)
+    for position in range(2, len(chars), ERROR_SPACING):
+        chars[position] = "0" if chars[position] != "0" else "1"
+    return "".join(chars)
+
+
+def _time_per_call(function: Callable[[], object], size: int) -> float:
+    """Return the fastest of TIMING_REPEATS timings of one call, in seconds."""
+    calls = max(1, DIGITS_PER_TIMING // size)
+    best = math.inf
+    for _ in range(TIMING_REPEATS):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def fit_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """Return the slope of the least-squares line through log(size), log(time)."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(value) for value in seconds]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def _sweep(
+    make_call: Callable[[int], Callable[[], object]],
+    sizes: tuple[int, ...],
+) -> float:
+    """Time ``make_call(size)()`` at each size and return the fitted exponent."""
+    timings = [_time_per_call(make_call(size), size) for size in sizes]
+    return fit_exponent(list(sizes), timings)
+
+
+# ---------------------------------------------------------------------------
+# Functions under test - each returns the call to time for a size
+# ---------------------------------------------------------------------------
+
+
+def _format(size: int) -> Callable[[], object]:
+    value = _synthetic_pi(size)
+    return lambda: pigame.format_digits(value)
+
+
+def _compare(size: int) -> Callable[[], object]:
+    expected = _synthetic_pi(size)
+    answer = _with_errors(expected)
+
+    def call() -> object:
+        pigame.input_validation(answer)
+        return pigame._digit_errors(answer, expected)  # noqa: SLF001
+
+    return call
+
+
+def _render(size: int) -> Callable[[], object]:
+    expected = _synthetic_pi(size)
+    answer = _with_errors(expected)
+    result = pigame.ScoreResult(
+        answer=answer,
+        expected=expected,
+        decimals=size,
+        errors=pigame._digit_errors(answer, expected),  # noqa: SLF001
+    )
+    return lambda: pigame.format_score(result, verbose=True)
+
+
+# name: (call for a size, declared exponent bound)
+SWEEPS = {
+    "format": (_format, 1.0),
+    "compare": (_compare, 1.0),
+    "render": (_render, 1.0),
+}
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestScaling:
+    """Empirical complexity of the core functions stays within its bound."""
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("name", list(SWEEPS))
+    def test_exponent_within_bound(self, name: str) -> None:
+        """The fitted exponent does not exceed the declared bound."""
+        make_call, bound = SWEEPS[name]
+        fitted = tuple(size for size in SIZES if size >= FIT_FROM)
+        exponent = _sweep(make_call, fitted)
+        assert exponent <= bound + EXPONENT_SLACK, (
+            f"{name} scales as digits ** {exponent:.2f}, bound is {bound}"
+        )
+
+    def test_fit_detects_quadratic(self) -> None:
+        """The fit recovers known exponents from exact power laws."""
+        sizes = [10, 100, 1000, 10_000]
+        assert fit_exponent(sizes, [3e-9 * n for n in sizes]) == pytest.approx(1)
+        assert fit_exponent(sizes, [2e-9 * n * n for n in sizes]) == pytest.approx(2)
+
+    def test_synthetic_digits(self) -> None:
+        """Synthetic inputs have the requested size and spaced errors."""
+        value = _synthetic_pi(1234)
+        assert len(value) == 1236
+        assert value.startswith(pigame.calculate_pi(100))
+        errors = pigame._digit_errors(_with_errors(value), value)  # noqa: SLF001
+        assert errors == tuple(range(2, len(value), ERROR_SPACING))